@@ -10,9 +10,21 @@ that SmartGuard users will get instead of static simulation.
 import sys
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, os.getcwd())
 
+from qubic_real_execution import RealQubicDevKit, compile_and_run_qubic_real
+
+_QDK = None
+
+def _qdk():
+    """Return the shared RealQubicDevKit, creating it on first use."""
+    global _QDK
+    if _QDK is None:
+        _QDK = RealQubicDevKit()
+    return _QDK
+
 def test_real_error_detection():
     """Test real error detection vs static simulation."""
     
@@ -20,12 +32,7 @@ def test_real_error_detection():
     print("  REAL ERROR DETECTION TEST")
     print("=" * 70)
     
-    from qubic_real_execution import RealQubicDevKit
-    
-    # Test 1: Valid contract
-    print("\n[Test 1] Valid Smart Contract")
-    print("-" * 40)
-    
+    # Test contracts: valid, syntax error, complex real-world scenario
     valid_contract = '''
     struct SimpleContract {
         long value;
@@ -40,17 +47,6 @@ def test_real_error_detection():
     };
     '''
     
-    qdk = RealQubicDevKit()
-    result = qdk.compile_contract(valid_contract)
-    
-    print(f"✅ Compilation: {'SUCCESS' if result['success'] else 'FAILED'}")
-    if result.get('compiler_output'):
-        print(f"🔧 Compiler output: {result['compiler_output'][:200]}...")
-    
-    # Test 2: Contract with syntax error
-    print("\n[Test 2] Contract with Syntax Error")
-    print("-" * 40)
-    
     invalid_contract = '''
     struct BrokenContract {
         long value
@@ -66,16 +62,6 @@ def test_real_error_detection():
     };
     '''
     
-    result = qdk.compile_contract(invalid_contract)
-    
-    print(f"🔍 Compilation: {'SUCCESS' if result['success'] else 'FAILED (as expected)'}")
-    if result.get('error'):
-        print(f"⚠️  Real error detected: {result['error'][:150]}...")
-    
-    # Test 3: Complex voting contract
-    print("\n[Test 3] Complex Voting Contract (Real Scenario)")
-    print("-" * 40)
-    
     complex_contract = '''
     struct AdvancedVotingContract {
         struct Voter {
@@ -149,7 +135,45 @@ def test_real_error_detection():
     };
     '''
     
-    result = qdk.compile_contract(complex_contract)
+    # The compiler runs out-of-process, so the three builds can overlap
+    qdk = _qdk()
+    contracts = {
+        "valid": valid_contract,
+        "invalid": invalid_contract,
+        "complex": complex_contract,
+    }
+    with ThreadPoolExecutor(max_workers=len(contracts)) as executor:
+        futures = {
+            name: executor.submit(qdk.compile_contract, code, f"{name}_contract.bytecode")
+            for name, code in contracts.items()
+        }
+    results = {name: future.result() for name, future in futures.items()}
+    
+    # Test 1: Valid contract
+    print("\n[Test 1] Valid Smart Contract")
+    print("-" * 40)
+    
+    result = results["valid"]
+    
+    print(f"✅ Compilation: {'SUCCESS' if result['success'] else 'FAILED'}")
+    if result.get('compiler_output'):
+        print(f"🔧 Compiler output: {result['compiler_output'][:200]}...")
+    
+    # Test 2: Contract with syntax error
+    print("\n[Test 2] Contract with Syntax Error")
+    print("-" * 40)
+    
+    result = results["invalid"]
+    
+    print(f"🔍 Compilation: {'SUCCESS' if result['success'] else 'FAILED (as expected)'}")
+    if result.get('error'):
+        print(f"⚠️  Real error detected: {result['error'][:150]}...")
+    
+    # Test 3: Complex voting contract
+    print("\n[Test 3] Complex Voting Contract (Real Scenario)")
+    print("-" * 40)
+    
+    result = results["complex"]
     
     print(f"🏗️  Complex contract compilation: {'SUCCESS' if result['success'] else 'FAILED'}")
     print(f"📄 Contract complexity: {len(complex_contract)} characters")
@@ -169,8 +193,6 @@ def simulate_smartguard_user_experience():
     print("-" * 50)
     
     # Simulate SmartGuard workflow
-    from qubic_real_execution import compile_and_run_qubic_real
-    
     class MockSmartContractState:
         def __init__(self, contract_code):
             self.contract_code = contract_code
@@ -230,15 +252,21 @@ def simulate_smartguard_user_experience():
 def main():
     """Run comprehensive real-world tests."""
     
+    # Buffer output and flush once per section instead of once per line
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    
     print("🚀 COMPREHENSIVE SMARTGUARD REAL EXECUTION TEST")
     print("=" * 70)
     print("Testing real compilation, error detection, and user experience")
     
     # Test real error detection
     test_real_error_detection()
+    sys.stdout.flush()
     
     # Test user experience
     simulate_smartguard_user_experience()
+    sys.stdout.flush()
     
     print("\n" + "=" * 70)
     print("  FINAL SUMMARY")
@@ -256,6 +284,7 @@ def main():
     
     print("\n🎉 SMARTGUARD IS NOW A REAL QUBIC AUDIT PLATFORM!")
     print(f"📅 Test completed: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
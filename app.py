@@ -1,9 +1,7 @@
 import streamlit as st
-from src.langgraphagenticai.graph.graph_builder import generated_graph
-from src.langgraphagenticai.state.state import SmartContractState
-import streamlit.components.v1 as components
-import json
-import os
+import hashlib
+import re
+import codecs
 
 st.set_page_config(
     page_title="Qubic SmartGuard",
@@ -49,6 +47,28 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
+# === Mermaid ===
+# st.markdown strips <script> tags, so the diagram has to render inside a
+# components.html iframe. Pinning an exact release gives an immutable URL the
+# browser serves from cache on every later Step-4 render instead of refetching.
+_MERMAID_ESM_URL = "https://cdn.jsdelivr.net/npm/mermaid@10.9.1/dist/mermaid.esm.min.mjs"
+_MERMAID_HTML = """
+<link rel="modulepreload" href="{esm_url}">
+<div class="mermaid">
+    {mermaid_code}
+</div>
+<script type="module">
+    import mermaid from '{esm_url}';
+    mermaid.initialize({{
+        startOnLoad: true,
+        theme: "dark"
+    }});
+</script>
+"""
+
+# Opening ```mermaid / closing ``` fences around the generated diagram
+_FENCE_RE = re.compile(r"```(?:mermaid)?\n?")
+
 # === Session State Init ===
 if "step" not in st.session_state:
     st.session_state.step = 0
@@ -65,14 +85,20 @@ steps = [
     "Qubic Dev Kit Execution"
 ]
 
+# One pre-rendered step bar per possible step value
+_STEP_BARS = tuple(
+    '<div class="step-bar">' + ''.join(
+        f'<div class="step {"done" if i < s else "active" if i == s else ""}">{label}</div>'
+        for i, label in enumerate(steps)
+    ) + '</div>'
+    for s in range(len(steps) + 1)
+)
+
 step = st.session_state.step
 
 # === Header ===
 st.title("🧠 Qubic SmartGuard")
-st.markdown('<div class="step-bar">' + ''.join([
-    f'<div class="step {"done" if i < step else "active" if i == step else ""}">{label}</div>'
-    for i, label in enumerate(steps)
-]) + '</div>', unsafe_allow_html=True)
+st.markdown(_STEP_BARS[step], unsafe_allow_html=True)
 
 # === Step 0: Upload ===
 if step == 0:
@@ -80,30 +106,85 @@ if step == 0:
     uploaded_file = st.file_uploader("📤 Upload your C++ Smart Contract file", type=["cpp"])
 
     if uploaded_file:
-        code = uploaded_file.read().decode("utf-8")
+        # Hash and decode in one streaming pass over the upload
+        hasher = hashlib.blake2b()
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        chunks = []
+        uploaded_file.seek(0)
+        for chunk in iter(lambda: uploaded_file.read(65536), b""):
+            hasher.update(chunk)
+            chunks.append(decoder.decode(chunk))
+        chunks.append(decoder.decode(b"", final=True))
+        hasher.update(language.encode("utf-8"))
+        code = "".join(chunks)
         st.session_state.input_code = code
         st.session_state.lang = language
+        st.session_state.input_key = hasher.hexdigest()
         st.code(code, language="cpp")
         if st.button("🚀 Start Analysis"):
             st.session_state.step = 1
             st.rerun()
 
-# === Run Graph Once ===
-if step > 0 and st.session_state.result is None:
-    state = SmartContractState(
-        input_code=st.session_state.input_code,
-        language=st.session_state.lang
-    )
-    st.session_state.result = generated_graph.invoke(state)
+# === Run Graph Once per input ===
+if step > 0:
+    results = st.session_state.setdefault("results", {})
+    input_key = st.session_state.input_key
+    if input_key not in results:
+        # LangGraph and the LLM clients are only imported once analysis starts
+        from src.langgraphagenticai.graph.graph_builder import (
+            get_graph, get_finished_run, run_config, STREAMED_NODES
+        )
+        from src.langgraphagenticai.state.state import SmartContractState
+
+        # Same contract and language as a completed earlier run: reuse its checkpoint
+        final_state = [get_finished_run(input_key)]
+        if final_state[0] is None:
+            state = SmartContractState(
+                input_code=st.session_state.input_code,
+                language=st.session_state.lang
+            )
+
+            # Stream the report tokens as they arrive; the last "values" chunk is the final state
+            def stream_report():
+                for mode, chunk in get_graph().stream(state, run_config(input_key),
+                                                      stream_mode=["messages", "values"]):
+                    if mode == "values":
+                        final_state[0] = chunk
+                    elif chunk[1].get("langgraph_node") in STREAMED_NODES and chunk[0].content:
+                        yield chunk[0].content
+
+            st.write_stream(stream_report())
+        results[input_key] = final_state[0]
+    st.session_state.result = results[input_key]
 
 result = st.session_state.result
 
 # === Helper ===
 def get_result_field(result, key):
-    if isinstance(result, dict) and key in result and result[key]:
-        return result[key]
+    if isinstance(result, dict):
+        return result.get(key) or "⚠️ Missing or not generated."
     return "⚠️ Missing or not generated."
 
+# === Full Report ===
+_REPORT_SPEC = (
+    ("💬 Commented Code", "commented"),
+    ("🧭 Semantic Analysis Report", "semantic_report"),
+    ("✅ Strict Validation Report", "strict_validation_report"),
+    ("🔍 Security Audit Report", "audit_report"),
+    ("📘 Functional Spec", "functional_spec"),
+    ("📜 Detailed Documentation", "detailed_doc"),
+    ("🧪 Test Plan", "test_plan"),
+    ("🤖 Simulation Scenario", "simulation_scenario"),
+    ("🧩 Simulation Result", "simulation_result"),
+    ("⚙️ Qubic DevKit Logs", "qubic_logs"),
+)
+
+@st.cache_data(show_spinner=False)
+def build_full_report(input_key, _result):
+    """Assemble the Markdown report once per input key (the result itself is not hashed)."""
+    sections = [f"## {header}\n{get_result_field(_result, key)}" for header, key in _REPORT_SPEC]
+    return "\n# Qubic SmartGuard Report\n\n" + "\n\n".join(sections) + "\n"
+
 # === Step 1 ===
 if step == 1:
     st.markdown("### 💬 Commented C++ Smart Contract")
@@ -154,20 +235,14 @@ if step == 4:
 
     diagram_raw = get_result_field(result, "flow_diagram")
     if diagram_raw and "graph TD" in diagram_raw:
-        mermaid_code = diagram_raw.replace("```mermaid", "").replace("```", "").strip()
+        mermaid_code = _FENCE_RE.sub("", diagram_raw).strip()
         st.markdown("### 📊 Flow Diagram")
-        components.html(f"""
-        <div class="mermaid">
-            {mermaid_code}
-        </div>
-        <script type="module">
-            import mermaid from 'https://cdn.jsdelivr.net/npm/mermaid@10/dist/mermaid.esm.min.mjs';
-            mermaid.initialize({{
-                startOnLoad: true,
-                theme: "dark"
-            }});
-        </script>
-        """, height=600, scrolling=True)
+        import streamlit.components.v1 as components
+        components.html(
+            _MERMAID_HTML.format(esm_url=_MERMAID_ESM_URL, mermaid_code=mermaid_code),
+            height=600,
+            scrolling=True
+        )
         st.download_button("⬇️ Download Mermaid Code", mermaid_code, file_name="diagram.mmd", mime="text/plain")
     else:
         st.warning("⚠️ Flow diagram not available.")
@@ -211,9 +286,13 @@ if step == 6:
             st.rerun()
 
 # === Step 7 ===
-if step == 7:
-    st.markdown("### 🤖 Local Simulation of onTransaction/onTick")
-    st.warning("⚠️ This simulation is manual. Please write your own call scenario (e.g. onTransaction). Automatic generation of custom scenarios based on your code is not yet implemented in this version.")
+@st.fragment
+def simulation_panel():
+    """
+    Scenario editor and result view. Runs as a fragment so editing and
+    re-simulating only reruns this block, not the whole script.
+    """
+    result = st.session_state.results[st.session_state.input_key]
 
     scenario = get_result_field(result, "simulation_scenario")
     if not scenario or scenario.startswith("⚠️"):
@@ -222,17 +301,29 @@ if step == 7:
     new_scenario = st.text_area("📝 Simulation Scenario (editable)", scenario, height=150)
 
     if st.button("▶️ Run Simulation"):
-        state = SmartContractState(
-            input_code=st.session_state.input_code,
-            language=st.session_state.lang,
-            simulation_scenario=new_scenario
-        )
-        st.session_state.result = generated_graph.invoke(state)
-        st.rerun()
+        base_key = st.session_state.input_key.split(":")[0]
+        sim_key = f"{base_key}:{hashlib.blake2b(new_scenario.encode('utf-8')).hexdigest()}"
+        results = st.session_state.results
+        if sim_key not in results:
+            from src.langgraphagenticai.graph.graph_builder import get_simulation_graph
+            from src.langgraphagenticai.state.state import SmartContractState
+
+            # Only the simulation node depends on the scenario; reuse everything else
+            state = SmartContractState(**{**result, "simulation_scenario": new_scenario})
+            results[sim_key] = get_simulation_graph().invoke(state)
+        st.session_state.input_key = sim_key
+        st.session_state.result = results[sim_key]
+        st.rerun(scope="fragment")
 
     st.markdown("#### 🧩 Simulation Result")
     st.code(get_result_field(result, 'simulation_result'), language="json")
 
+if step == 7:
+    st.markdown("### 🤖 Local Simulation of onTransaction/onTick")
+    st.warning("⚠️ This simulation is manual. Please write your own call scenario (e.g. onTransaction). Automatic generation of custom scenarios based on your code is not yet implemented in this version.")
+
+    simulation_panel()
+
     col1, col2 = st.columns(2)
     with col1:
         if st.button("⬅️ Back"):
@@ -254,39 +345,7 @@ The logs displayed here are AI-generated samples to show the expected structure,
     logs = get_result_field(result, "qubic_logs")
     st.code(logs, language="bash")
 
-    full_report = f"""
-# Qubic SmartGuard Report
-
-## 💬 Commented Code
-{get_result_field(result, 'commented')}
-
-## 🧭 Semantic Analysis Report
-{get_result_field(result, 'semantic_report')}
-
-## ✅ Strict Validation Report
-{get_result_field(result, 'strict_validation_report')}
-
-## 🔍 Security Audit Report
-{get_result_field(result, 'audit_report')}
-
-## 📘 Functional Spec
-{get_result_field(result, 'functional_spec')}
-
-## 📜 Detailed Documentation
-{get_result_field(result, 'detailed_doc')}
-
-## 🧪 Test Plan
-{get_result_field(result, 'test_plan')}
-
-## 🤖 Simulation Scenario
-{get_result_field(result, 'simulation_scenario')}
-
-## 🧩 Simulation Result
-{get_result_field(result, 'simulation_result')}
-
-## ⚙️ Qubic DevKit Logs
-{get_result_field(result, 'qubic_logs')}
-"""
+    full_report = build_full_report(st.session_state.input_key, result)
     st.download_button(
         label="⬇️ Download Full AI Report (Markdown)",
         data=full_report,
@@ -301,6 +360,6 @@ The logs displayed here are AI-generated samples to show the expected structure,
             st.rerun()
 
     if st.button("🏁 Start Over"):
-        for key in ["step", "input_code", "lang", "result"]:
+        for key in ["step", "input_code", "lang", "input_key", "result"]:
             st.session_state.pop(key, None)
         st.rerun()
\ No newline at end of file
@@ -8,9 +8,26 @@ import os
 import sys
 from pathlib import Path
 
+def _listing(root):
+    """Return the names of regular files directly under root (one scandir)."""
+    if not os.path.isdir(root):
+        return set()
+    with os.scandir(root) as entries:
+        return {entry.name for entry in entries if entry.is_file()}
+
 def check_project_status():
     """Verify all deliverables are complete and ready."""
     
+    # Directory listings are cached so each directory is scanned only once
+    listings = {}
+    
+    def present(path):
+        root, name = os.path.split(path)
+        root = root or '.'
+        if root not in listings:
+            listings[root] = _listing(root)
+        return name in listings[root]
+    
     print("🎯 Qubic-SmartGuard Integration - Final Status Check")
     print("=" * 60)
     print()
@@ -24,14 +41,15 @@ def check_project_status():
         'SMARTGUARD_INTEGRATION_GUIDE.md': 'Integration instructions'
     }
     
+    core_present = {file: present(file) for file in core_files}
+    all_core_present = all(core_present.values())
+    
     print("📁 Core Deliverables:")
-    all_core_present = True
     for file, description in core_files.items():
-        if os.path.isfile(file):
+        if core_present[file]:
             print(f"   ✅ {file} - {description}")
         else:
             print(f"   ❌ {file} - {description} (MISSING)")
-            all_core_present = False
     print()
     
     # Check CLI tool
@@ -41,12 +59,13 @@ def check_project_status():
         'qubic-cli/main.cpp'
     ]
     
+    cli_found = {path: present(path) for path in cli_paths}
+    cli_present = any(cli_found.values())
+    
     print("🛠️ CLI Tool Status:")
-    cli_present = False
     for path in cli_paths:
-        if os.path.isfile(path):
+        if cli_found[path]:
             print(f"   ✅ {path} - Available")
-            cli_present = True
         else:
             print(f"   ⚠️ {path} - Not found")
     
@@ -88,10 +107,10 @@ def check_project_status():
     ]
     
     for doc in doc_files:
-        if os.path.isfile(doc):
+        if present(doc):
             with open(doc, 'r', encoding='utf-8') as f:
                 content = f.read()
-                lines = len(content.split('\n'))
+                lines = content.count('\n') + 1
                 print(f"   ✅ {doc} - {lines} lines")
         else:
             print(f"   ❌ {doc} - Missing")
@@ -102,12 +121,12 @@ def check_project_status():
     
     requirements = [
         (all_core_present, "Core files present"),
-        (os.path.isfile('smartguard_integration.py'), "Integration module ready"),
-        (os.path.isfile('SMARTGUARD_INTEGRATION_GUIDE.md'), "Integration guide available"),
-        (os.path.isfile('README.md'), "Documentation complete")
+        (core_present['smartguard_integration.py'], "Integration module ready"),
+        (core_present['SMARTGUARD_INTEGRATION_GUIDE.md'], "Integration guide available"),
+        (core_present['README.md'], "Documentation complete")
     ]
     
-    ready_count = sum(1 for req, _ in requirements if req)
+    ready_count = sum(req for req, _ in requirements)
     total_requirements = len(requirements)
     
     for req_met, description in requirements:
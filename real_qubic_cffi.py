@@ -0,0 +1,79 @@
+"""
+cffi binding for the Real Qubic Dev Kit C interface (realExecution.h).
+Same (result_code, value) interface as real_qubic_cy, for builds where the
+Cython extension is not compiled: real_qubic_integration.RealQubicExecutor
+prefers real_qubic_cy, then this module, then plain ctypes.
+
+Requires the _qubic_cffi extension generated by real_qubic_cffi_build.py;
+importing this module raises ImportError when it has not been built. cffi
+releases the GIL around each call, so concurrent calls overlap.
+"""
+
+from _qubic_cffi import ffi, lib
+
+
+def _decode(buf) -> str:
+    return ffi.string(buf).decode('utf-8')
+
+
+def deploy_contract(bytecode_file: str, private_key: str, network: str):
+    """Deploy a contract; returns (result_code, contract_address)."""
+    buf = ffi.new("char[]", 256)
+    rc = lib.execute_real_contract_deployment(
+        bytecode_file.encode('utf-8'), private_key.encode('utf-8'), network.encode('utf-8'),
+        buf, 256
+    )
+    return rc, _decode(buf)
+
+
+def call_contract(contract_address: str, function_name: str, arguments: str,
+                  private_key: str, network: str):
+    """Call a contract function; returns (result_code, result)."""
+    buf = ffi.new("char[]", 1024)
+    rc = lib.execute_real_contract_call(
+        contract_address.encode('utf-8'), function_name.encode('utf-8'),
+        arguments.encode('utf-8'), private_key.encode('utf-8'), network.encode('utf-8'),
+        buf, 1024
+    )
+    return rc, _decode(buf)
+
+
+def get_balance(address: str, network: str):
+    """Query a balance; returns (result_code, balance)."""
+    balance = ffi.new("unsigned long long *")
+    rc = lib.get_real_balance(address.encode('utf-8'), network.encode('utf-8'), balance)
+    return rc, balance[0]
+
+
+def create_voting_proposal(contract_address: str, title: str, description: str,
+                           duration: int, private_key: str, network: str):
+    """Create a voting proposal; returns (result_code, proposal_id)."""
+    buf = ffi.new("char[]", 256)
+    rc = lib.create_real_voting_proposal(
+        contract_address.encode('utf-8'), title.encode('utf-8'), description.encode('utf-8'),
+        duration, private_key.encode('utf-8'), network.encode('utf-8'),
+        buf, 256
+    )
+    return rc, _decode(buf)
+
+
+def cast_vote(contract_address: str, proposal_id: str, user_id: str, choice: int,
+              comment: str, private_key: str, network: str):
+    """Cast a vote; returns (result_code, result)."""
+    buf = ffi.new("char[]", 1024)
+    rc = lib.cast_real_vote(
+        contract_address.encode('utf-8'), proposal_id.encode('utf-8'), user_id.encode('utf-8'),
+        choice, comment.encode('utf-8'), private_key.encode('utf-8'), network.encode('utf-8'),
+        buf, 1024
+    )
+    return rc, _decode(buf)
+
+
+def get_voting_results(contract_address: str, proposal_id: str, network: str):
+    """Fetch voting results; returns (result_code, results)."""
+    buf = ffi.new("char[]", 2048)
+    rc = lib.get_real_voting_results(
+        contract_address.encode('utf-8'), proposal_id.encode('utf-8'), network.encode('utf-8'),
+        buf, 2048
+    )
+    return rc, _decode(buf)
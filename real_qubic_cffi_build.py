@@ -0,0 +1,50 @@
+"""
+cffi (API mode) build script for the Real Qubic Dev Kit C interface.
+Generates the _qubic_cffi extension used by real_qubic_cffi: cffi emits one
+C thunk per declared function with the argument types compiled in, so calls
+skip libffi's runtime type dispatch.
+
+Build in place (qubic-cli/ on the include path, libqubic-cli on the link path):
+    python real_qubic_cffi_build.py
+"""
+
+from cffi import FFI
+
+ffibuilder = FFI()
+
+# Keep in sync with the extern "C" block of realExecution.h
+ffibuilder.cdef("""
+    int execute_real_contract_call(const char* contract_address, const char* function_name,
+                                   const char* arguments, const char* private_key,
+                                   const char* network, char* result_buffer, int buffer_size);
+
+    int execute_real_contract_deployment(const char* bytecode_file, const char* private_key,
+                                         const char* network, char* contract_address_buffer,
+                                         int buffer_size);
+
+    int get_real_balance(const char* address, const char* network, unsigned long long* balance);
+
+    int create_real_voting_proposal(const char* contract_address, const char* title,
+                                    const char* description, unsigned long long duration,
+                                    const char* private_key, const char* network,
+                                    char* proposal_id_buffer, int buffer_size);
+
+    int cast_real_vote(const char* contract_address, const char* proposal_id,
+                       const char* user_id, int choice, const char* comment,
+                       const char* private_key, const char* network,
+                       char* result_buffer, int buffer_size);
+
+    int get_real_voting_results(const char* contract_address, const char* proposal_id,
+                                const char* network, char* results_buffer, int buffer_size);
+""")
+
+ffibuilder.set_source(
+    "_qubic_cffi",
+    '#include "realExecution.h"',
+    source_extension=".cpp",
+    include_dirs=["qubic-cli"],
+    libraries=["qubic-cli"],
+)
+
+if __name__ == "__main__":
+    ffibuilder.compile(verbose=True)
@@ -0,0 +1,160 @@
+# cython: language_level=3
+# distutils: language = c++
+# distutils: libraries = qubic-cli
+"""
+Cython binding for the Real Qubic Dev Kit C interface (realExecution.h).
+Optional fast path for real_qubic_integration.RealQubicExecutor: when this
+extension is importable it replaces the ctypes calls, so argument marshaling
+happens in C instead of going through libffi on every call.
+
+Build in place (qubic-cli/ on the include path, libqubic-cli on the link path):
+    cythonize -i real_qubic_cy.pyx
+
+Every function returns a (result_code, value) tuple; error handling stays in
+the RealQubicExecutor wrappers so both backends raise the same errors. The
+native calls block on network I/O, so they run with the GIL released and
+concurrent calls from a thread pool overlap.
+"""
+
+from cpython.unicode cimport PyUnicode_DecodeUTF8
+from libc.string cimport strlen
+
+
+cdef extern from "realExecution.h" nogil:
+    int execute_real_contract_call(const char* contract_address, const char* function_name,
+                                   const char* arguments, const char* private_key,
+                                   const char* network, char* result_buffer, int buffer_size)
+
+    int execute_real_contract_deployment(const char* bytecode_file, const char* private_key,
+                                         const char* network, char* contract_address_buffer,
+                                         int buffer_size)
+
+    int get_real_balance(const char* address, const char* network, unsigned long long* balance)
+
+    int create_real_voting_proposal(const char* contract_address, const char* title,
+                                    const char* description, unsigned long long duration,
+                                    const char* private_key, const char* network,
+                                    char* proposal_id_buffer, int buffer_size)
+
+    int cast_real_vote(const char* contract_address, const char* proposal_id,
+                       const char* user_id, int choice, const char* comment,
+                       const char* private_key, const char* network,
+                       char* result_buffer, int buffer_size)
+
+    int get_real_voting_results(const char* contract_address, const char* proposal_id,
+                                const char* network, char* results_buffer, int buffer_size)
+
+
+cdef inline str _decode(const char* buf):
+    # Decode straight from the C buffer: no intermediate bytes object
+    return PyUnicode_DecodeUTF8(buf, strlen(buf), NULL)
+
+
+cpdef tuple deploy_contract(str bytecode_file, str private_key, str network):
+    """Deploy a contract; returns (result_code, contract_address)."""
+    cdef bytes b_file = bytecode_file.encode('utf-8')
+    cdef bytes b_key = private_key.encode('utf-8')
+    cdef bytes b_net = network.encode('utf-8')
+    cdef const char* c_file = b_file
+    cdef const char* c_key = b_key
+    cdef const char* c_net = b_net
+    cdef char buf[256]
+    buf[0] = 0
+    cdef int rc
+    with nogil:
+        rc = execute_real_contract_deployment(c_file, c_key, c_net, buf, 256)
+    return rc, _decode(buf)
+
+
+cpdef tuple call_contract(str contract_address, str function_name, str arguments,
+                          str private_key, str network):
+    """Call a contract function; returns (result_code, result)."""
+    cdef bytes b_addr = contract_address.encode('utf-8')
+    cdef bytes b_func = function_name.encode('utf-8')
+    cdef bytes b_args = arguments.encode('utf-8')
+    cdef bytes b_key = private_key.encode('utf-8')
+    cdef bytes b_net = network.encode('utf-8')
+    cdef const char* c_addr = b_addr
+    cdef const char* c_func = b_func
+    cdef const char* c_args = b_args
+    cdef const char* c_key = b_key
+    cdef const char* c_net = b_net
+    cdef char buf[1024]
+    buf[0] = 0
+    cdef int rc
+    with nogil:
+        rc = execute_real_contract_call(c_addr, c_func, c_args, c_key, c_net, buf, 1024)
+    return rc, _decode(buf)
+
+
+cpdef tuple get_balance(str address, str network):
+    """Query a balance; returns (result_code, balance)."""
+    cdef bytes b_addr = address.encode('utf-8')
+    cdef bytes b_net = network.encode('utf-8')
+    cdef const char* c_addr = b_addr
+    cdef const char* c_net = b_net
+    cdef unsigned long long balance = 0
+    cdef int rc
+    with nogil:
+        rc = get_real_balance(c_addr, c_net, &balance)
+    return rc, balance
+
+
+cpdef tuple create_voting_proposal(str contract_address, str title, str description,
+                                   unsigned long long duration, str private_key, str network):
+    """Create a voting proposal; returns (result_code, proposal_id)."""
+    cdef bytes b_addr = contract_address.encode('utf-8')
+    cdef bytes b_title = title.encode('utf-8')
+    cdef bytes b_desc = description.encode('utf-8')
+    cdef bytes b_key = private_key.encode('utf-8')
+    cdef bytes b_net = network.encode('utf-8')
+    cdef const char* c_addr = b_addr
+    cdef const char* c_title = b_title
+    cdef const char* c_desc = b_desc
+    cdef const char* c_key = b_key
+    cdef const char* c_net = b_net
+    cdef char buf[256]
+    buf[0] = 0
+    cdef int rc
+    with nogil:
+        rc = create_real_voting_proposal(c_addr, c_title, c_desc, duration, c_key, c_net, buf, 256)
+    return rc, _decode(buf)
+
+
+cpdef tuple cast_vote(str contract_address, str proposal_id, str user_id, int choice,
+                      str comment, str private_key, str network):
+    """Cast a vote; returns (result_code, result)."""
+    cdef bytes b_addr = contract_address.encode('utf-8')
+    cdef bytes b_prop = proposal_id.encode('utf-8')
+    cdef bytes b_user = user_id.encode('utf-8')
+    cdef bytes b_comment = comment.encode('utf-8')
+    cdef bytes b_key = private_key.encode('utf-8')
+    cdef bytes b_net = network.encode('utf-8')
+    cdef const char* c_addr = b_addr
+    cdef const char* c_prop = b_prop
+    cdef const char* c_user = b_user
+    cdef const char* c_comment = b_comment
+    cdef const char* c_key = b_key
+    cdef const char* c_net = b_net
+    cdef char buf[1024]
+    buf[0] = 0
+    cdef int rc
+    with nogil:
+        rc = cast_real_vote(c_addr, c_prop, c_user, choice, c_comment, c_key, c_net, buf, 1024)
+    return rc, _decode(buf)
+
+
+cpdef tuple get_voting_results(str contract_address, str proposal_id, str network):
+    """Fetch voting results; returns (result_code, results)."""
+    cdef bytes b_addr = contract_address.encode('utf-8')
+    cdef bytes b_prop = proposal_id.encode('utf-8')
+    cdef bytes b_net = network.encode('utf-8')
+    cdef const char* c_addr = b_addr
+    cdef const char* c_prop = b_prop
+    cdef const char* c_net = b_net
+    cdef char buf[2048]
+    buf[0] = 0
+    cdef int rc
+    with nogil:
+        rc = get_real_voting_results(c_addr, c_prop, c_net, buf, 2048)
+    return rc, _decode(buf)
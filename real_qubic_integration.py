@@ -5,14 +5,185 @@ Perfect for integration with Qubic-SmartGuard Streamlit application.
 """
 
 import ctypes
+import json
 import os
 import platform
-from typing import Optional, Tuple, Dict, Any
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Tuple, Dict, Any, List
+
+# Optional compiled bindings: Cython (real_qubic_cy.pyx), then cffi
+# (real_qubic_cffi_build.py); falls back to ctypes when neither is built
+try:
+    import real_qubic_cy as _native
+except ImportError:
+    try:
+        import real_qubic_cffi as _native
+    except ImportError:
+        _native = None
 
 class RealQubicError(Exception):
     """Exception raised for Real Qubic execution errors."""
     pass
 
+class _BufferPool:
+    """
+    Per-thread pool of reusable result buffers. Each entry is a bytearray plus a
+    zero-copy ctypes view of it, so the C side writes straight into the bytearray.
+    """
+    
+    def __init__(self):
+        self._local = threading.local()
+    
+    def rent(self, size: int) -> Tuple[bytearray, ctypes.Array]:
+        """Take a (bytearray, ctypes view) pair of the given size, allocating one if empty."""
+        free = getattr(self._local, "free", None)
+        if free is None:
+            free = self._local.free = defaultdict(list)
+        if free[size]:
+            raw, view = free[size].pop()
+        else:
+            raw = bytearray(size)
+            view = (ctypes.c_char * size).from_buffer(raw)
+        # Stale results must never be read back if the callee writes nothing
+        raw[0] = 0
+        return raw, view
+    
+    def release(self, raw: bytearray, view: ctypes.Array):
+        """Return a rented pair to the calling thread's pool."""
+        self._local.free[len(raw)].append((raw, view))
+
+
+def _cstr(raw: bytearray) -> str:
+    """Decode a NUL-terminated UTF-8 string written by the C side into raw."""
+    end = raw.find(0)
+    return raw[:end if end >= 0 else len(raw)].decode('utf-8')
+
+_POOL = _BufferPool()
+
+# Upper bound on contract calls in flight when calls are issued individually
+MAX_PARALLEL_CALLS = 8
+
+# Balances are reused within time buckets of this many seconds
+BALANCE_TTL_SECONDS = 2
+
+# Most distinct (address, network) balances cached per executor
+MAX_CACHED_BALANCES = 1024
+
+# Most distinct values kept pinned per executor before the cache is reset
+MAX_PINNED_ARGS = 256
+
+# ctypes handles by library path, shared by every executor in the process
+_LIB_CACHE: Dict[str, ctypes.CDLL] = {}
+
+@lru_cache(maxsize=1)
+def _find_library() -> str:
+    """
+    Locate the compiled C++ library in the common build locations. Only a
+    successful search is cached; a miss raises so the next call looks again.
+    """
+    system = platform.system().lower()
+    if system == "windows":
+        lib_name = "qubic-cli.dll"
+    elif system == "darwin":
+        lib_name = "libqubic-cli.dylib"
+    else:
+        lib_name = "libqubic-cli.so"
+    
+    # Look in common locations
+    possible_paths = [
+        os.path.join(".", lib_name),
+        os.path.join("build", lib_name),
+        os.path.join("build", "Release", lib_name),
+        os.path.join("build", "Debug", lib_name),
+        os.path.join("..", "qubic-cli", "build", lib_name),
+        os.path.join("..", "qubic-cli", "build", "Release", lib_name),
+    ]
+    
+    for path in possible_paths:
+        if os.path.exists(path):
+            return path
+    
+    raise RealQubicError(f"Could not find {lib_name}. Please provide the library path explicitly.")
+
+# Descriptions of the non-zero result codes returned by the C interface
+_ERROR_MESSAGES = {
+    -1: "Invalid parameters",
+    -2: "Connection failed",
+    -3: "Transaction failed",
+    -4: "Operation timeout",
+    -5: "Invalid response",
+    -6: "Result buffer too small",
+}
+
+def _error_message(result_code: int) -> str:
+    """Describe a non-zero result code from the C interface."""
+    return _ERROR_MESSAGES.get(result_code, f"Unknown error (code: {result_code})")
+
+def _raise(result_code: int, operation: str):
+    """Raise RealQubicError for a failed C call; callers test the code inline first."""
+    raise RealQubicError(f"{operation} failed: {_error_message(result_code)}")
+
+# C interface of realExecution.h as (executor attribute, symbol, restype, argtypes).
+# Built once at import; keep in the same order as the header when it changes.
+_c_str = ctypes.c_char_p
+_C_SIGNATURES = (
+    ("_call", "execute_real_contract_call", ctypes.c_int,
+     # contract_address, function_name, arguments, private_key, network, result_buffer, buffer_size
+     (_c_str, _c_str, _c_str, _c_str, _c_str, _c_str, ctypes.c_int)),
+    ("_deploy", "execute_real_contract_deployment", ctypes.c_int,
+     # bytecode_file, private_key, network, contract_address_buffer, buffer_size
+     (_c_str, _c_str, _c_str, _c_str, ctypes.c_int)),
+    ("_balance", "get_real_balance", ctypes.c_int,
+     # address, network, balance
+     (_c_str, _c_str, ctypes.POINTER(ctypes.c_ulonglong))),
+    ("_create_proposal", "create_real_voting_proposal", ctypes.c_int,
+     # contract_address, title, description, duration, private_key, network, proposal_id_buffer, buffer_size
+     (_c_str, _c_str, _c_str, ctypes.c_ulonglong, _c_str, _c_str, _c_str, ctypes.c_int)),
+    ("_cast_vote", "cast_real_vote", ctypes.c_int,
+     # contract_address, proposal_id, user_id, choice, comment, private_key, network, result_buffer, buffer_size
+     (_c_str, _c_str, _c_str, ctypes.c_int, _c_str, _c_str, _c_str, _c_str, ctypes.c_int)),
+    ("_voting_results", "get_real_voting_results", ctypes.c_int,
+     # contract_address, proposal_id, network, results_buffer, buffer_size
+     (_c_str, _c_str, _c_str, _c_str, ctypes.c_int)),
+)
+# Entry points newer than the original interface; older library builds lack them
+_C_OPTIONAL_SIGNATURES = (
+    ("_call_batch", "execute_real_contract_call_batch", ctypes.c_int,
+     # contract_address, calls_json, private_key, network, results_buffer, buffer_size, required_size
+     (_c_str, _c_str, _c_str, _c_str, _c_str, ctypes.c_int, ctypes.POINTER(ctypes.c_int))),
+    ("_call_batch_results", "get_real_contract_call_batch_results", ctypes.c_int,
+     # results_buffer, buffer_size
+     (_c_str, ctypes.c_int)),
+    ("_balance_v2", "get_real_balance_v2", ctypes.c_ulonglong,
+     # address, network; returns the balance or BALANCE_ERROR
+     (_c_str, _c_str)),
+    ("_all_voting_results", "get_all_voting_results", ctypes.c_int,
+     # contract_address, network, results_buffer, buffer_size
+     (_c_str, _c_str, _c_str, ctypes.c_int)),
+    ("_open_session", "qubic_open_session", ctypes.c_void_p,
+     # network; returns a session handle
+     (_c_str,)),
+    ("_close_session", "qubic_close_session", ctypes.c_int,
+     # session
+     (ctypes.c_void_p,)),
+    ("_session_balance", "qubic_session_get_balance", ctypes.c_ulonglong,
+     # session, address; returns the balance or BALANCE_ERROR
+     (ctypes.c_void_p, _c_str)),
+    ("_session_create_proposal", "qubic_session_create_voting_proposal", ctypes.c_int,
+     # session, contract_address, title, description, duration, private_key, proposal_id_buffer, buffer_size
+     (ctypes.c_void_p, _c_str, _c_str, _c_str, ctypes.c_ulonglong, _c_str, _c_str, ctypes.c_int)),
+    ("_session_cast_vote", "qubic_session_cast_vote", ctypes.c_int,
+     # session, contract_address, proposal_id, user_id, choice, comment, private_key, result_buffer, buffer_size
+     (ctypes.c_void_p, _c_str, _c_str, _c_str, ctypes.c_int, _c_str, _c_str, _c_str, ctypes.c_int)),
+    ("_session_voting_results", "qubic_session_get_voting_results", ctypes.c_int,
+     # session, contract_address, proposal_id, results_buffer, buffer_size
+     (ctypes.c_void_p, _c_str, _c_str, _c_str, ctypes.c_int)),
+)
+
 class RealQubicExecutor:
     """Python wrapper for Real Qubic Dev Kit execution functionality."""
     
@@ -23,6 +194,10 @@ class RealQubicExecutor:
     ERROR_TRANSACTION_FAILED = -3
     ERROR_TIMEOUT = -4
     ERROR_INVALID_RESPONSE = -5
+    ERROR_BUFFER_TOO_SMALL = -6
+    
+    # get_real_balance_v2 failure sentinel (UINT64_MAX)
+    BALANCE_ERROR = 0xFFFFFFFFFFFFFFFF
     
     def __init__(self, library_path: Optional[str] = None):
         """
@@ -30,132 +205,109 @@ class RealQubicExecutor:
         
         Args:
             library_path: Path to the compiled C++ library. If None, will try to find it automatically.
+                A compiled binding (Cython or cffi) is used instead when one is built and no path is given.
         """
         self.lib = None
-        self._load_library(library_path)
-        self._setup_function_signatures()
+        self._call_batch = None
+        self._call_batch_results = None
+        self._balance_v2 = None
+        self._all_voting_results = None
+        self._open_session = None
+        self._sessions: Dict[str, int] = {}
+        self._sessions_lock = threading.Lock()
+        self._pinned: Dict[str, Tuple[bytes, ctypes.c_char_p]] = {}
+        self._balances: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        self._native = _native if library_path is None else None
+        if self._native is None:
+            self._load_library(library_path)
+            self._setup_function_signatures()
     
     def _load_library(self, library_path: Optional[str] = None):
-        """Load the compiled C++ library."""
+        """Load the compiled C++ library, reusing a handle already opened by this process."""
         if library_path is None:
-            # Try to find the library automatically
-            system = platform.system().lower()
-            if system == "windows":
-                lib_name = "qubic-cli.dll"
-            elif system == "darwin":
-                lib_name = "libqubic-cli.dylib"
-            else:
-                lib_name = "libqubic-cli.so"
-            
-            # Look in common locations
-            possible_paths = [
-                os.path.join(".", lib_name),
-                os.path.join("build", lib_name),
-                os.path.join("build", "Release", lib_name),
-                os.path.join("build", "Debug", lib_name),
-                os.path.join("..", "qubic-cli", "build", lib_name),
-                os.path.join("..", "qubic-cli", "build", "Release", lib_name),
-            ]
-            
-            for path in possible_paths:
-                if os.path.exists(path):
-                    library_path = path
-                    break
-            
-            if library_path is None:
-                raise RealQubicError(f"Could not find {lib_name}. Please provide the library path explicitly.")
-        
-        try:
-            self.lib = ctypes.CDLL(library_path)
-        except OSError as e:
-            raise RealQubicError(f"Failed to load library from {library_path}: {e}")
+            library_path = _find_library()
+        
+        lib = _LIB_CACHE.get(library_path)
+        if lib is None:
+            try:
+                lib = ctypes.CDLL(library_path)
+            except OSError as e:
+                raise RealQubicError(f"Failed to load library from {library_path}: {e}")
+            _LIB_CACHE[library_path] = lib
+        self.lib = lib
     
     def _setup_function_signatures(self):
-        """Setup function signatures for the C interface."""
-        # execute_real_contract_call
-        self.lib.execute_real_contract_call.argtypes = [
-            ctypes.c_char_p,  # contract_address
-            ctypes.c_char_p,  # function_name
-            ctypes.c_char_p,  # arguments
-            ctypes.c_char_p,  # private_key
-            ctypes.c_char_p,  # network
-            ctypes.c_char_p,  # result_buffer
-            ctypes.c_int      # buffer_size
-        ]
-        self.lib.execute_real_contract_call.restype = ctypes.c_int
-        
-        # execute_real_contract_deployment
-        self.lib.execute_real_contract_deployment.argtypes = [
-            ctypes.c_char_p,  # bytecode_file
-            ctypes.c_char_p,  # private_key
-            ctypes.c_char_p,  # network
-            ctypes.c_char_p,  # contract_address_buffer
-            ctypes.c_int      # buffer_size
-        ]
-        self.lib.execute_real_contract_deployment.restype = ctypes.c_int
-        
-        # get_real_balance
-        self.lib.get_real_balance.argtypes = [
-            ctypes.c_char_p,  # address
-            ctypes.c_char_p,  # network
-            ctypes.POINTER(ctypes.c_ulonglong)  # balance
-        ]
-        self.lib.get_real_balance.restype = ctypes.c_int
-        
-        # create_real_voting_proposal
-        self.lib.create_real_voting_proposal.argtypes = [
-            ctypes.c_char_p,  # contract_address
-            ctypes.c_char_p,  # title
-            ctypes.c_char_p,  # description
-            ctypes.c_ulonglong,  # duration
-            ctypes.c_char_p,  # private_key
-            ctypes.c_char_p,  # network
-            ctypes.c_char_p,  # proposal_id_buffer
-            ctypes.c_int      # buffer_size
-        ]
-        self.lib.create_real_voting_proposal.restype = ctypes.c_int
-        
-        # cast_real_vote
-        self.lib.cast_real_vote.argtypes = [
-            ctypes.c_char_p,  # contract_address
-            ctypes.c_char_p,  # proposal_id
-            ctypes.c_char_p,  # user_id
-            ctypes.c_int,     # choice
-            ctypes.c_char_p,  # comment
-            ctypes.c_char_p,  # private_key
-            ctypes.c_char_p,  # network
-            ctypes.c_char_p,  # result_buffer
-            ctypes.c_int      # buffer_size
-        ]
-        self.lib.cast_real_vote.restype = ctypes.c_int
-        
-        # get_real_voting_results
-        self.lib.get_real_voting_results.argtypes = [
-            ctypes.c_char_p,  # contract_address
-            ctypes.c_char_p,  # proposal_id
-            ctypes.c_char_p,  # network
-            ctypes.c_char_p,  # results_buffer
-            ctypes.c_int      # buffer_size
-        ]
-        self.lib.get_real_voting_results.restype = ctypes.c_int
-    
-    def _check_result(self, result_code: int, operation: str):
-        """Check the result code and raise an exception if there's an error."""
-        if result_code == self.SUCCESS:
-            return
-        
-        error_messages = {
-            self.ERROR_INVALID_PARAMS: "Invalid parameters",
-            self.ERROR_CONNECTION_FAILED: "Connection failed",
-            self.ERROR_TRANSACTION_FAILED: "Transaction failed",
-            self.ERROR_TIMEOUT: "Operation timeout",
-            self.ERROR_INVALID_RESPONSE: "Invalid response"
-        }
-        
-        message = error_messages.get(result_code, f"Unknown error (code: {result_code})")
-        raise RealQubicError(f"{operation} failed: {message}")
+        """Apply the _C_SIGNATURES table and bind each function pointer on the executor."""
+        for attr, symbol, restype, argtypes in _C_SIGNATURES:
+            function = getattr(self.lib, symbol)
+            function.restype = restype
+            function.argtypes = argtypes
+            setattr(self, attr, function)
+        
+        for attr, symbol, restype, argtypes in _C_OPTIONAL_SIGNATURES:
+            function = getattr(self.lib, symbol, None)
+            if function is not None:
+                function.restype = restype
+                function.argtypes = argtypes
+            setattr(self, attr, function)
+    
+    def _session(self, network: str) -> Optional[int]:
+        """
+        Return this executor's native session for a network, opening it on first
+        use so later calls reuse its node connection. None when the library
+        predates sessions.
+        """
+        if self._open_session is None:
+            return None
+        session = self._sessions.get(network)
+        if session is None:
+            with self._sessions_lock:
+                session = self._sessions.get(network)
+                if session is None:
+                    session = self._open_session(self._pin(network))
+                    if not session:
+                        return None
+                    self._sessions[network] = session
+        return session
     
-    def deploy_contract(self, bytecode_file: str, private_key: str, network: str = "testnet") -> str:
+    def close(self):
+        """Close the native sessions opened by this executor."""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            self._close_session(session)
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
+    def _pin(self, value: str) -> ctypes.c_char_p:
+        """
+        Return a cached c_char_p for an argument that repeats across calls
+        (network, private key, contract address), so ctypes gets a ready pointer
+        instead of encoding and converting a new bytes object every time.
+        One-off values such as titles keep a plain encode.
+        """
+        pinned = self._pinned.get(value)
+        if pinned is None:
+            if len(self._pinned) >= MAX_PINNED_ARGS:
+                self._pinned.clear()
+            data = value.encode('utf-8')
+            pinned = self._pinned[value] = (data, ctypes.c_char_p(data))
+        return pinned[1]
+    
+    def _drop_balances(self):
+        """
+        Forget cached balances before a state-changing call. Its fees come out
+        of the signer's balance, whose address is not known here, so every
+        cached balance is dropped.
+        """
+        self._balances.clear()
+    
+    def deploy_contract(self, bytecode_file: str, private_key: str, network: str = "testnet", 
+                        check_only: bool = False) -> Optional[str]:
         """
         Deploy a smart contract to the Qubic network.
         
@@ -163,29 +315,41 @@ class RealQubicExecutor:
             bytecode_file: Path to the compiled bytecode file
             private_key: Private key for signing the deployment transaction
             network: Network to deploy to ("testnet" or "mainnet")
+            check_only: Only verify success; skip decoding and return None
         
         Returns:
-            Contract address of the deployed contract
+            Contract address of the deployed contract (None with check_only)
         
         Raises:
             RealQubicError: If deployment fails
         """
-        buffer_size = 256
-        contract_address_buffer = ctypes.create_string_buffer(buffer_size)
-        
-        result = self.lib.execute_real_contract_deployment(
-            bytecode_file.encode('utf-8'),
-            private_key.encode('utf-8'),
-            network.encode('utf-8'),
-            contract_address_buffer,
-            buffer_size
-        )
+        self._drop_balances()
+        if self._native is not None:
+            result, contract_address = self._native.deploy_contract(bytecode_file, private_key, network)
+            if result:
+                _raise(result, "Contract deployment")
+            return None if check_only else contract_address
         
-        self._check_result(result, "Contract deployment")
-        return contract_address_buffer.value.decode('utf-8')
+        buffer_size = 256
+        raw, contract_address_buffer = _POOL.rent(buffer_size)
+        try:
+            result = self._deploy(
+                bytecode_file.encode('utf-8'),
+                self._pin(private_key),
+                self._pin(network),
+                contract_address_buffer,
+                buffer_size
+            )
+            
+            if result:
+                _raise(result, "Contract deployment")
+            return None if check_only else _cstr(raw)
+        finally:
+            _POOL.release(raw, contract_address_buffer)
     
     def call_contract(self, contract_address: str, function_name: str, arguments: str, 
-                     private_key: str, network: str = "testnet") -> str:
+                     private_key: str, network: str = "testnet", 
+                     check_only: bool = False) -> Optional[str]:
         """
         Call a function on a deployed smart contract.
         
@@ -195,32 +359,142 @@ class RealQubicExecutor:
             arguments: Function arguments (comma-separated)
             private_key: Private key for signing the transaction
             network: Network to use ("testnet" or "mainnet")
+            check_only: Only verify success; skip decoding and return None
         
         Returns:
-            Result of the function call
+            Result of the function call (None with check_only)
         
         Raises:
             RealQubicError: If the call fails
         """
+        self._drop_balances()
+        if self._native is not None:
+            result, value = self._native.call_contract(
+                contract_address, function_name, arguments, private_key, network
+            )
+            if result:
+                _raise(result, "Contract call")
+            return None if check_only else value
+        
         buffer_size = 1024
-        result_buffer = ctypes.create_string_buffer(buffer_size)
-        
-        result = self.lib.execute_real_contract_call(
-            contract_address.encode('utf-8'),
-            function_name.encode('utf-8'),
-            arguments.encode('utf-8'),
-            private_key.encode('utf-8'),
-            network.encode('utf-8'),
-            result_buffer,
-            buffer_size
+        raw, result_buffer = _POOL.rent(buffer_size)
+        try:
+            result = self._call(
+                self._pin(contract_address),
+                function_name.encode('utf-8'),
+                arguments.encode('utf-8'),
+                self._pin(private_key),
+                self._pin(network),
+                result_buffer,
+                buffer_size
+            )
+            
+            if result:
+                _raise(result, "Contract call")
+            return None if check_only else _cstr(raw)
+        finally:
+            _POOL.release(raw, result_buffer)
+    
+    def call_contract_batch(self, contract_address: str, calls: List[Dict[str, str]], 
+                            network: str = "testnet") -> List[Dict[str, Any]]:
+        """
+        Call several functions on one contract, in a single native call when possible.
+        
+        Args:
+            contract_address: Address of the deployed contract
+            calls: Dicts with "function", "private_key" and optional "arguments"
+            network: Network to use ("testnet" or "mainnet")
+        
+        Returns:
+            One {"function", "status", "result" or "error"} dict per call, in order
+        """
+        private_keys = {call["private_key"] for call in calls}
+        # Builds without the results getter have the older batch signature: call individually
+        if (self._call_batch is None or self._call_batch_results is None
+                or len(calls) < 2 or len(private_keys) != 1):
+            return self._call_contract_each(contract_address, calls, network)
+        
+        self._drop_balances()
+        calls_json = json.dumps([
+            {"function": call["function"], "arguments": call.get("arguments", "")}
+            for call in calls
+        ])
+        # Enough for typical results; larger output is fetched below at its exact size
+        buffer_size = 4096 * len(calls)
+        raw = bytearray(buffer_size)
+        results_buffer = (ctypes.c_char * buffer_size).from_buffer(raw)
+        required_size = ctypes.c_int(0)
+        
+        result = self._call_batch(
+            self._pin(contract_address),
+            calls_json.encode('utf-8'),
+            self._pin(private_keys.pop()),
+            self._pin(network),
+            results_buffer,
+            buffer_size,
+            ctypes.byref(required_size)
         )
         
-        self._check_result(result, "Contract call")
-        return result_buffer.value.decode('utf-8')
+        if result == self.ERROR_BUFFER_TOO_SMALL:
+            # The calls already ran: only read their results back into a larger buffer
+            buffer_size = required_size.value
+            raw = bytearray(buffer_size)
+            results_buffer = (ctypes.c_char * buffer_size).from_buffer(raw)
+            result = self._call_batch_results(results_buffer, buffer_size)
+        if result:
+            _raise(result, "Batched contract call")
+        
+        function_results = []
+        for call, entry in zip(calls, json.loads(_cstr(raw))):
+            if entry["status"] == "success":
+                function_results.append({
+                    "function": call["function"],
+                    "result": entry["result"],
+                    "status": "success"
+                })
+            else:
+                function_results.append({
+                    "function": call["function"],
+                    "error": f"Contract call failed: {_error_message(entry['code'])}",
+                    "status": "failed"
+                })
+        return function_results
+    
+    def _call_contract_each(self, contract_address: str, calls: List[Dict[str, str]], 
+                            network: str) -> List[Dict[str, Any]]:
+        """
+        Run calls individually. The native calls block in network I/O without
+        the GIL, so they are overlapped on a small thread pool; map keeps order.
+        """
+        if len(calls) < 2:
+            return [self._call_contract_entry(contract_address, call, network) for call in calls]
+        
+        with ThreadPoolExecutor(max_workers=min(len(calls), MAX_PARALLEL_CALLS)) as pool:
+            return list(pool.map(
+                lambda call: self._call_contract_entry(contract_address, call, network),
+                calls
+            ))
+    
+    def _call_contract_entry(self, contract_address: str, call: Dict[str, str], 
+                             network: str) -> Dict[str, Any]:
+        """Run one call_contract and report it in the call_contract_batch result format."""
+        try:
+            result = self.call_contract(
+                contract_address,
+                call["function"],
+                call.get("arguments", ""),
+                call["private_key"],
+                network
+            )
+            return {"function": call["function"], "result": result, "status": "success"}
+        except RealQubicError as e:
+            return {"function": call["function"], "error": str(e), "status": "failed"}
     
     def get_balance(self, address: str, network: str = "testnet") -> int:
         """
-        Get the balance of an address.
+        Get the balance of an address. Results are reused for queries that fall
+        in the same BALANCE_TTL_SECONDS bucket, since balances change far more
+        slowly than the UI re-runs. State-changing calls drop the cached values.
         
         Args:
             address: Qubic address to check
@@ -232,15 +506,49 @@ class RealQubicExecutor:
         Raises:
             RealQubicError: If balance query fails
         """
+        key = (address, network)
+        bucket = int(time.monotonic() // BALANCE_TTL_SECONDS)
+        cached = self._balances.get(key)
+        if cached is not None and cached[0] == bucket:
+            return cached[1]
+        
+        balance = self._query_balance(address, network)
+        if len(self._balances) >= MAX_CACHED_BALANCES:
+            self._balances.clear()
+        self._balances[key] = (bucket, balance)
+        return balance
+    
+    def _query_balance(self, address: str, network: str) -> int:
+        """Fetch a balance from the native backend, bypassing the cache."""
+        if self._native is not None:
+            result, balance = self._native.get_balance(address, network)
+            if result:
+                _raise(result, "Balance query")
+            return balance
+        
+        session = self._session(network)
+        if session is not None:
+            balance = self._session_balance(session, self._pin(address))
+            if balance == self.BALANCE_ERROR:
+                _raise(self.ERROR_TRANSACTION_FAILED, "Balance query")
+            return balance
+        
+        if self._balance_v2 is not None:
+            balance = self._balance_v2(self._pin(address), self._pin(network))
+            if balance == self.BALANCE_ERROR:
+                _raise(self.ERROR_TRANSACTION_FAILED, "Balance query")
+            return balance
+        
         balance = ctypes.c_ulonglong()
         
-        result = self.lib.get_real_balance(
-            address.encode('utf-8'),
-            network.encode('utf-8'),
+        result = self._balance(
+            self._pin(address),
+            self._pin(network),
             ctypes.byref(balance)
         )
         
-        self._check_result(result, "Balance query")
+        if result:
+            _raise(result, "Balance query")
         return balance.value
     
     def create_voting_proposal(self, contract_address: str, title: str, description: str, 
@@ -262,26 +570,51 @@ class RealQubicExecutor:
         Raises:
             RealQubicError: If proposal creation fails
         """
-        buffer_size = 256
-        proposal_id_buffer = ctypes.create_string_buffer(buffer_size)
-        
-        result = self.lib.create_real_voting_proposal(
-            contract_address.encode('utf-8'),
-            title.encode('utf-8'),
-            description.encode('utf-8'),
-            duration,
-            private_key.encode('utf-8'),
-            network.encode('utf-8'),
-            proposal_id_buffer,
-            buffer_size
-        )
+        self._drop_balances()
+        if self._native is not None:
+            result, proposal_id = self._native.create_voting_proposal(
+                contract_address, title, description, duration, private_key, network
+            )
+            if result:
+                _raise(result, "Voting proposal creation")
+            return proposal_id
         
-        self._check_result(result, "Voting proposal creation")
-        return proposal_id_buffer.value.decode('utf-8')
+        buffer_size = 256
+        raw, proposal_id_buffer = _POOL.rent(buffer_size)
+        try:
+            session = self._session(network)
+            if session is not None:
+                result = self._session_create_proposal(
+                    session,
+                    self._pin(contract_address),
+                    title.encode('utf-8'),
+                    description.encode('utf-8'),
+                    duration,
+                    self._pin(private_key),
+                    proposal_id_buffer,
+                    buffer_size
+                )
+            else:
+                result = self._create_proposal(
+                    self._pin(contract_address),
+                    title.encode('utf-8'),
+                    description.encode('utf-8'),
+                    duration,
+                    self._pin(private_key),
+                    self._pin(network),
+                    proposal_id_buffer,
+                    buffer_size
+                )
+            
+            if result:
+                _raise(result, "Voting proposal creation")
+            return _cstr(raw)
+        finally:
+            _POOL.release(raw, proposal_id_buffer)
     
     def cast_vote(self, contract_address: str, proposal_id: str, user_id: str, 
                  choice: int, private_key: str, network: str = "testnet", 
-                 comment: str = "") -> str:
+                 comment: str = "", check_only: bool = False) -> Optional[str]:
         """
         Cast a vote on a proposal.
         
@@ -293,30 +626,57 @@ class RealQubicExecutor:
             private_key: Private key for signing the transaction
             network: Network to use ("testnet" or "mainnet")
             comment: Optional comment for the vote
+            check_only: Only verify success; skip decoding and return None
         
         Returns:
-            Result of the vote casting
+            Result of the vote casting (None with check_only)
         
         Raises:
             RealQubicError: If vote casting fails
         """
-        buffer_size = 1024
-        result_buffer = ctypes.create_string_buffer(buffer_size)
-        
-        result = self.lib.cast_real_vote(
-            contract_address.encode('utf-8'),
-            proposal_id.encode('utf-8'),
-            user_id.encode('utf-8'),
-            choice,
-            comment.encode('utf-8'),
-            private_key.encode('utf-8'),
-            network.encode('utf-8'),
-            result_buffer,
-            buffer_size
-        )
+        self._drop_balances()
+        if self._native is not None:
+            result, value = self._native.cast_vote(
+                contract_address, proposal_id, user_id, choice, comment, private_key, network
+            )
+            if result:
+                _raise(result, "Vote casting")
+            return None if check_only else value
         
-        self._check_result(result, "Vote casting")
-        return result_buffer.value.decode('utf-8')
+        buffer_size = 1024
+        raw, result_buffer = _POOL.rent(buffer_size)
+        try:
+            session = self._session(network)
+            if session is not None:
+                result = self._session_cast_vote(
+                    session,
+                    self._pin(contract_address),
+                    proposal_id.encode('utf-8'),
+                    user_id.encode('utf-8'),
+                    choice,
+                    comment.encode('utf-8'),
+                    self._pin(private_key),
+                    result_buffer,
+                    buffer_size
+                )
+            else:
+                result = self._cast_vote(
+                    self._pin(contract_address),
+                    proposal_id.encode('utf-8'),
+                    user_id.encode('utf-8'),
+                    choice,
+                    comment.encode('utf-8'),
+                    self._pin(private_key),
+                    self._pin(network),
+                    result_buffer,
+                    buffer_size
+                )
+            
+            if result:
+                _raise(result, "Vote casting")
+            return None if check_only else _cstr(raw)
+        finally:
+            _POOL.release(raw, result_buffer)
     
     def get_voting_results(self, contract_address: str, proposal_id: str, 
                           network: str = "testnet") -> str:
@@ -334,19 +694,72 @@ class RealQubicExecutor:
         Raises:
             RealQubicError: If results retrieval fails
         """
+        if self._native is not None:
+            result, results = self._native.get_voting_results(contract_address, proposal_id, network)
+            if result:
+                _raise(result, "Voting results retrieval")
+            return results
+        
         buffer_size = 2048
-        results_buffer = ctypes.create_string_buffer(buffer_size)
+        raw, results_buffer = _POOL.rent(buffer_size)
+        try:
+            session = self._session(network)
+            if session is not None:
+                result = self._session_voting_results(
+                    session,
+                    self._pin(contract_address),
+                    proposal_id.encode('utf-8'),
+                    results_buffer,
+                    buffer_size
+                )
+            else:
+                result = self._voting_results(
+                    self._pin(contract_address),
+                    proposal_id.encode('utf-8'),
+                    self._pin(network),
+                    results_buffer,
+                    buffer_size
+                )
+            
+            if result:
+                _raise(result, "Voting results retrieval")
+            return _cstr(raw)
+        finally:
+            _POOL.release(raw, results_buffer)
+    
+    def get_all_voting_results(self, contract_address: str, 
+                               network: str = "testnet") -> Optional[Dict[str, Any]]:
+        """
+        Get the status of every proposal on a voting contract in one native call.
         
-        result = self.lib.get_real_voting_results(
-            contract_address.encode('utf-8'),
-            proposal_id.encode('utf-8'),
-            network.encode('utf-8'),
-            results_buffer,
-            buffer_size
-        )
+        Args:
+            contract_address: Address of the voting contract
+            network: Network to query ("testnet" or "mainnet")
+        
+        Returns:
+            Decoded status object, or None when the library lacks get_all_voting_results
+        
+        Raises:
+            RealQubicError: If status retrieval fails
+        """
+        if self._all_voting_results is None:
+            return None
         
-        self._check_result(result, "Voting results retrieval")
-        return results_buffer.value.decode('utf-8')
+        buffer_size = 65536
+        raw, results_buffer = _POOL.rent(buffer_size)
+        try:
+            result = self._all_voting_results(
+                self._pin(contract_address),
+                self._pin(network),
+                results_buffer,
+                buffer_size
+            )
+            
+            if result:
+                _raise(result, "Voting status retrieval")
+            return json.loads(_cstr(raw))
+        finally:
+            _POOL.release(raw, results_buffer)
 
 
 # Streamlit integration helpers for Qubic-SmartGuard
@@ -388,29 +801,11 @@ class SmartGuardIntegration:
             
             # Execute real function calls if specified
             if contract_data.get("function_calls"):
-                function_results = []
-                for call in contract_data["function_calls"]:
-                    try:
-                        result = self.executor.call_contract(
-                            contract_data["address"],
-                            call["function"],
-                            call.get("arguments", ""),
-                            call["private_key"],
-                            contract_data.get("network", "testnet")
-                        )
-                        function_results.append({
-                            "function": call["function"],
-                            "result": result,
-                            "status": "success"
-                        })
-                    except RealQubicError as e:
-                        function_results.append({
-                            "function": call["function"],
-                            "error": str(e),
-                            "status": "failed"
-                        })
-                
-                results["execution_results"]["function_calls"] = function_results
+                results["execution_results"]["function_calls"] = self.executor.call_contract_batch(
+                    contract_data["address"],
+                    contract_data["function_calls"],
+                    contract_data.get("network", "testnet")
+                )
             
             # Real security analysis based on actual execution
             results["security_analysis"] = {
@@ -455,8 +850,13 @@ class SmartGuardIntegration:
         }
         
         try:
-            # This would make real calls to get contract state
-            # For now, we'll simulate the response structure
+            # One native round trip for every proposal when the library supports it
+            contract_status = self.executor.get_all_voting_results(contract_address, network)
+            if contract_status is not None:
+                status.update(contract_status)
+                return status
+            
+            # Older libraries: simulate the response structure
             status.update({
                 "is_active": True,
                 "proposals": [
@@ -11,92 +11,540 @@ The C++ implementation provides actual blockchain execution, not just simulation
 import subprocess
 import json
 import os
-from typing import Dict, Any, Optional, Tuple
+import asyncio
+import functools
+import itertools
+import queue
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple, List, Callable
 import logging
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:  # balance reads then always go through the CLI
+    requests = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Status line that ends one request's output in -realserver mode
+_SERVER_STATUS_RE = re.compile(r'^\{"id":(\d+),"status":"(\w+)"\}$')
+
+# Base URL of a Qubic RPC node (e.g. https://rpc.qubic.org) for direct balance reads;
+# when neither this variable nor node_url is set, balances come from the CLI
+NODE_URL_ENV = "QUBIC_NODE_URL"
+
+# Upper bound for one HTTP balance read before falling back to the CLI
+HTTP_TIMEOUT_SECONDS = 5
+
+# Worker threads for submit_*/execute_parallel; each one mostly waits on a child process
+MAX_PARALLEL_CALLS = 16
+
+# "Label: value" lines of the real execution commands' output; a trailing QU unit is dropped
+_OUT_RE = re.compile(
+    r"^(Contract Address|Result|Proposal ID|YES|NO|ABSTAIN|Balance):[ \t]*(.*?)[ \t]*(?:QU)?[ \t]*$",
+    re.MULTILINE
+)
+
+# Vote choice codes as named in log messages
+_CHOICE_NAMES = {1: "YES", 2: "NO", 3: "ABSTAIN"}
+
+# Final line of a command's -json output; nothing after it is needed
+_JSON_RESULT_PREFIX = '{"status":'
+
+# JSON keys of the _OUT_RE labels, for CLIs without -json output
+_TEXT_KEYS = {
+    "Contract Address": "contract_address",
+    "Result": "result",
+    "Proposal ID": "proposal_id",
+    "YES": "yes",
+    "NO": "no",
+    "ABSTAIN": "abstain",
+    "Balance": "balance",
+}
+
+# Per-vote result line printed by -realvotingcastbatch
+_BATCH_VOTE_RE = re.compile(r'^Vote (\d+): (success|failed)$', re.MULTILINE)
+
+def _pump_lines(process: subprocess.Popen, lines: queue.SimpleQueue):
+    """Queue each stdout line of process, then None at EOF, and reap the process."""
+    for line in process.stdout:
+        lines.put(line)
+    lines.put(None)
+    process.wait()
+
+def _parse_output(stdout: str) -> Dict[str, str]:
+    """Map each labeled output line to its value (first occurrence wins) in one pass."""
+    fields = {}
+    for match in _OUT_RE.finditer(stdout):
+        fields.setdefault(match.group(1), match.group(2))
+    return fields
+
+class _TTLCache:
+    """Thread-safe LRU cache whose entries also expire ttl seconds after insertion."""
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 5.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (value, expiry timestamp)
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """Return the cached value for key, or None when missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+    
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def discard(self, predicate=None):
+        """Drop every entry whose key matches predicate (all entries if None)."""
+        with self._lock:
+            if predicate is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+class Deadline:
+    """
+    Time budget shared by a sequence of executor calls.
+    
+    Pass the same Deadline to every call of a multi-step flow: each command's
+    timeout is capped by the time left, and calls made after it has run out
+    fail immediately instead of waiting out their own timeouts.
+    """
+    
+    def __init__(self, seconds: float):
+        self.end = time.monotonic() + seconds
+    
+    def remaining(self) -> float:
+        """Seconds left in the budget (never negative)."""
+        return max(0.0, self.end - time.monotonic())
+    
+    def expired(self) -> bool:
+        return time.monotonic() >= self.end
+
 class RealQubicExecutor:
     """Python wrapper for Real Qubic Dev Kit execution."""
     
-    def __init__(self, network: str = "testnet", cli_path: str = "qubic-cli.exe"):
+    # (cli_path, mtime) -> (server, batch, json) support flags, shared by all instances
+    _validated: Dict[Tuple[str, float], Tuple[bool, bool, bool]] = {}
+    
+    def __init__(self, network: str = "testnet", cli_path: str = "qubic-cli.exe",
+                 cache_ttl: float = 5.0, cache_size: int = 1024, node_url: Optional[str] = None):
         """
         Initialize the Real Qubic Executor.
         
         Args:
             network: Network to use ("testnet" or "mainnet")
             cli_path: Path to the qubic-cli executable
+            cache_ttl: Seconds a balance or voting result stays cached (0 disables caching)
+            cache_size: Maximum number of entries kept in each read cache
+            node_url: Qubic RPC node for direct balance reads (default: $QUBIC_NODE_URL)
         """
         self.network = network
         self.cli_path = cli_path
+        
+        # Balance reads skip the CLI when a node URL is known; the pooled session
+        # keeps connections to the node alive across reads
+        self.node_url = (node_url or os.environ.get(NODE_URL_ENV) or "").rstrip("/") or None
+        self._http = None
+        if self.node_url and requests is not None:
+            self._http = requests.Session()
+            self._http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=MAX_PARALLEL_CALLS))
+            self._http.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=MAX_PARALLEL_CALLS))
+        
+        # Command-line parts shared by every command; with -json support the
+        # flag joins the prefix once the CLI has been probed
+        self._cmd_prefix: Tuple[str, ...] = (cli_path,)
+        self._cmd_suffix: Tuple[str, ...] = ("--network", network)
+        
+        # Read caches keyed by (network, address) and (network, contract, proposal_id);
+        # mutating calls drop the entries they affect through invalidate()
+        self._balance_cache = _TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        self._results_cache = _TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        
+        # Long-lived "qubic-cli -realserver" process, started on first use when
+        # the CLI supports it; otherwise every command spawns its own process
+        self._server_supported = False
+        self._batch_supported = False
+        self._json_supported = False
+        self._server = None
+        self._server_lines = None
+        self._server_lock = threading.Lock()
+        self._request_ids = itertools.count(1)
+        
+        # Independent CLI calls run concurrently on this pool (see submit_* / execute_parallel)
+        self._pool = ThreadPoolExecutor(max_workers=MAX_PARALLEL_CALLS, thread_name_prefix="qubic-cli")
+        
         self._validate_setup()
     
     def _validate_setup(self):
-        """Validate that the CLI is available and supports real execution."""
-        if not os.path.exists(self.cli_path):
+        """
+        Validate that the CLI is available and detect the real execution features it supports.
+        
+        The -help probe runs once per CLI binary and process: its outcome is cached
+        by (cli_path, mtime). Setting QUBIC_SKIP_VALIDATE=1 skips the probe; the
+        optional features (server, batch, JSON output) then stay disabled.
+        
+        Raises:
+            FileNotFoundError: If cli_path does not exist
+        """
+        try:
+            key = (self.cli_path, os.path.getmtime(self.cli_path))
+        except OSError:
             raise FileNotFoundError(f"qubic-cli not found at {self.cli_path}")
         
-        # Check if real execution commands are available
+        if key not in self._validated:
+            if os.environ.get("QUBIC_SKIP_VALIDATE"):
+                return
+            self._validated[key] = self._probe_features()
+        
+        self._server_supported, self._batch_supported, self._json_supported = self._validated[key]
+        if self._json_supported:
+            self._cmd_prefix = (self.cli_path, "-json")
+    
+    def _probe_features(self) -> Tuple[bool, bool, bool]:
+        """Run qubic-cli -help and return (server, batch, json) support flags."""
         try:
             result = subprocess.run([self.cli_path, "-help"], 
                                   capture_output=True, text=True, timeout=10)
             if "REAL QUBIC DEV KIT EXECUTION" not in result.stdout:
                 logger.warning("Real execution commands not found in CLI help. "
                              "Ensure you have the latest version with real execution support.")
+            return ("-realserver" in result.stdout,
+                    "-realvotingcastbatch" in result.stdout,
+                    "\t-json\n" in result.stdout)
         except subprocess.TimeoutExpired:
             logger.warning("CLI help command timed out")
         except Exception as e:
             logger.warning(f"Could not validate CLI: {e}")
+        return (False, False, False)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
-    def deploy_contract(self, bytecode_file: str, private_key: str) -> Optional[str]:
+    def close(self):
+        """Wait for submitted calls, shut the thread pool down and stop the -realserver process."""
+        self._pool.shutdown(wait=True)
+        with self._server_lock:
+            self._stop_server()
+        if self._http is not None:
+            self._http.close()
+    
+    def _http_balance(self, address: str, deadline: Optional[Deadline] = None) -> Optional[int]:
         """
-        Deploy a smart contract to the Qubic network.
+        Read a balance straight from the RPC node (GET /v1/balances/<address>).
+        
+        Returns:
+            Balance in QU, or None when the node is not configured or the read fails
+        """
+        if self._http is None:
+            return None
+        timeout = HTTP_TIMEOUT_SECONDS if deadline is None else min(HTTP_TIMEOUT_SECONDS, deadline.remaining())
+        if timeout <= 0:
+            return None
+        try:
+            response = self._http.get(f"{self.node_url}/v1/balances/{address}", timeout=timeout)
+            response.raise_for_status()
+            return int(response.json()["balance"]["balance"])
+        except Exception as e:
+            logger.warning(f"RPC balance read failed, using the CLI: {e}")
+            return None
+    
+    def execute_parallel(self, calls: List[Callable[[], Any]]) -> List[Any]:
+        """
+        Run independent calls concurrently on the executor's thread pool.
         
         Args:
-            bytecode_file: Path to the compiled bytecode file
-            private_key: Private key for signing the deployment transaction
+            calls: Zero-argument callables, e.g. functools.partial(executor.get_balance, address)
             
         Returns:
-            Contract address if successful, None otherwise
+            The calls' return values, in the same order as calls
         """
-        logger.info(f"🚀 Deploying contract from {bytecode_file} to {self.network}")
+        futures = [self._pool.submit(call) for call in calls]
+        return [future.result() for future in futures]
+    
+    def submit_vote(self, contract_address: str, proposal_id: str, user_id: str,
+                    choice: int, private_key: str, comment: str = "",
+                    deadline: Optional[Deadline] = None) -> Future:
+        """Run cast_vote on the thread pool; the Future resolves to its return value."""
+        return self._pool.submit(self.cast_vote, contract_address, proposal_id, user_id,
+                                 choice, private_key, comment, deadline)
+    
+    def submit_balance(self, address: str, deadline: Optional[Deadline] = None) -> Future:
+        """Run get_balance on the thread pool; the Future resolves to its return value."""
+        return self._pool.submit(self.get_balance, address, deadline)
+    
+    def submit_voting_results(self, contract_address: str, proposal_id: str,
+                              deadline: Optional[Deadline] = None) -> Future:
+        """Run get_voting_results on the thread pool; the Future resolves to its return value."""
+        return self._pool.submit(self.get_voting_results, contract_address, proposal_id, deadline)
+    
+    def invalidate(self, address: Optional[str] = None, proposal: Optional[str] = None):
+        """
+        Drop cached reads made stale by a state-changing call.
+        
+        Args:
+            address: Drop the cached balance of this address
+            proposal: Drop the cached voting results of this proposal
+            
+        With neither argument, both caches are cleared.
+        """
+        if address is None and proposal is None:
+            self._balance_cache.discard()
+            self._results_cache.discard()
+            return
+        if address is not None:
+            self._balance_cache.discard(lambda key: key[1] == address)
+        if proposal is not None:
+            self._results_cache.discard(lambda key: key[2] == proposal)
+    
+    def _run(self, cmd: List[str], timeout: float) -> subprocess.CompletedProcess:
+        """
+        Run one real execution command, through the long-lived server when the
+        CLI supports it and as a one-shot process otherwise.
+        
+        Args:
+            cmd: Full command line, starting with the CLI path
+            timeout: Seconds to wait for the command to finish
+            
+        Returns:
+            CompletedProcess with the command's output
+            
+        Raises:
+            subprocess.TimeoutExpired: If the command does not finish in time
+        """
+        # The server handles one request at a time; while it is busy with another
+        # thread's request, run this one as its own process so the two overlap
+        if not self._server_supported or not self._server_lock.acquire(blocking=False):
+            return self._run_streaming(cmd, timeout)
         
         try:
-            cmd = [
-                self.cli_path,
-                "-realcontractdeploy",
-                "--bytecode", bytecode_file,
-                "--privatekey", private_key,
-                "--network", self.network
-            ]
+            if self._server is None or self._server.poll() is not None:
+                self._start_server()
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            request_id = next(self._request_ids)
+            self._server.stdin.write(json.dumps({"id": request_id, "argv": cmd[1:]}) + "\n")
+            self._server.stdin.flush()
             
-            if result.returncode == 0:
-                # Parse contract address from output
-                for line in result.stdout.split('\n'):
-                    if "Contract Address:" in line:
-                        address = line.split(":")[-1].strip()
-                        logger.info(f"✅ Contract deployed successfully: {address}")
-                        return address
+            deadline = time.monotonic() + timeout
+            lines = []
+            while True:
+                try:
+                    line = self._server_lines.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    # The server state is unknown after a timeout; start a fresh one next time
+                    self._stop_server()
+                    raise subprocess.TimeoutExpired(cmd, timeout)
                 
-                logger.warning("Deployment completed but no contract address found in output")
-                return None
-            else:
-                logger.error(f"❌ Contract deployment failed: {result.stderr}")
-                return None
+                if line is None:
+                    self._server = None
+                    output = "".join(lines)
+                    return subprocess.CompletedProcess(cmd, 1, output, output or "qubic-cli server exited")
                 
+                match = _SERVER_STATUS_RE.match(line.rstrip())
+                if match and int(match.group(1)) == request_id:
+                    output = "".join(lines)
+                    if match.group(2) == "success":
+                        return subprocess.CompletedProcess(cmd, 0, output, "")
+                    return subprocess.CompletedProcess(cmd, 1, output, output)
+                lines.append(line)
+        finally:
+            self._server_lock.release()
+    
+    def _command(self, subcommand: str, params: Dict[str, Any],
+                 options: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        Build a real execution command line.
+        
+        The CLI parses its parameters positionally: params go first, in the
+        order the command expects, then --network, then the optional parameters.
+        
+        Args:
+            subcommand: Real execution command, e.g. "-realbalance"
+            params: Required parameters by name (without the leading --)
+            options: Optional parameters; empty or None values are left out
+            
+        Returns:
+            Full command line, starting with the CLI path
+        """
+        cmd = [*self._cmd_prefix, subcommand]
+        cmd.extend(itertools.chain.from_iterable((f"--{name}", str(value)) for name, value in params.items()))
+        cmd.extend(self._cmd_suffix)
+        if options:
+            cmd.extend(itertools.chain.from_iterable(
+                (f"--{name}", str(value)) for name, value in options.items() if value
+            ))
+        return cmd
+    
+    def _invoke(self, subcommand: str, params: Dict[str, Any], timeout: float, action: str,
+                options: Optional[Dict[str, Any]] = None,
+                deadline: Optional[Deadline] = None) -> Optional[Dict[str, Any]]:
+        """
+        Run one real execution command and return its result fields.
+        
+        Args:
+            subcommand: Real execution command, e.g. "-realbalance"
+            params: Required parameters by name, in CLI order (see _command)
+            timeout: Seconds to wait for the command to finish
+            action: Description used in log messages, e.g. "Balance retrieval"
+            options: Optional parameters; empty or None values are left out
+            deadline: Shared time budget; caps timeout and fails fast once spent
+            
+        Returns:
+            Dictionary of result fields if the command succeeded, None otherwise
+        """
+        if deadline is not None:
+            if deadline.expired():
+                logger.error(f"❌ {action} timed out")
+                return None
+            timeout = min(timeout, deadline.remaining())
+        
+        try:
+            result = self._run(self._command(subcommand, params, options), timeout=timeout)
+            return self._result_fields(result, action)
         except subprocess.TimeoutExpired:
-            logger.error("❌ Contract deployment timed out")
+            logger.error(f"❌ {action} timed out")
             return None
         except Exception as e:
-            logger.error(f"❌ Contract deployment error: {e}")
+            logger.error(f"❌ {action} error: {e}")
             return None
     
+    def _result_fields(self, result: subprocess.CompletedProcess, action: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract the result fields from a finished command's output.
+        
+        With -json support the command's final JSON line is returned as is; older
+        CLIs' "Label: value" lines are mapped to the same keys.
+        
+        Returns:
+            Dictionary of result fields if the command succeeded, None otherwise
+        """
+        if self._json_supported:
+            last_line = result.stdout.rstrip().rpartition("\n")[2]
+            data = json.loads(last_line) if last_line.startswith("{") else {}
+            if data.get("status") == "success":
+                return data
+        elif result.returncode == 0:
+            data = {_TEXT_KEYS[label]: value for label, value in _parse_output(result.stdout).items()}
+            votes = _BATCH_VOTE_RE.findall(result.stdout)
+            if votes:
+                data["votes"] = [status == "success" for _, status in votes]
+            return data
+        
+        logger.error(f"❌ {action} failed: {result.stderr or result.stdout}")
+        return None
+    
+    def _run_streaming(self, cmd: List[str], timeout: float) -> subprocess.CompletedProcess:
+        """
+        Run one command as its own process, reading its output line by line.
+        
+        With -json output the result is returned as soon as the final JSON line
+        arrives; the process's teardown and any remaining output are handled by
+        the reader thread. stderr is merged into stdout.
+        
+        Args:
+            cmd: Full command line, starting with the CLI path
+            timeout: Seconds to wait for the command's result
+            
+        Returns:
+            CompletedProcess with the command's output
+            
+        Raises:
+            subprocess.TimeoutExpired: If the result does not arrive in time
+        """
+        process = subprocess.Popen(
+            cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, bufsize=1
+        )
+        lines = queue.SimpleQueue()
+        threading.Thread(target=_pump_lines, args=(process, lines), daemon=True).start()
+        
+        deadline = time.monotonic() + timeout
+        output = []
+        while True:
+            try:
+                line = lines.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                process.kill()
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            
+            if line is None:
+                returncode = process.wait()
+                text = "".join(output)
+                return subprocess.CompletedProcess(cmd, returncode, text, text if returncode else "")
+            
+            output.append(line)
+            if self._json_supported and line.startswith(_JSON_RESULT_PREFIX):
+                return subprocess.CompletedProcess(cmd, 0, "".join(output), "")
+    
+    def _start_server(self):
+        """Launch qubic-cli -realserver and a thread that queues its output lines."""
+        self._server = subprocess.Popen(
+            [self.cli_path, "-realserver"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, bufsize=1
+        )
+        self._server_lines = queue.SimpleQueue()
+        threading.Thread(target=_pump_lines, args=(self._server, self._server_lines), daemon=True).start()
+    
+    def _stop_server(self):
+        """Terminate the server process; the caller holds _server_lock."""
+        server, self._server = self._server, None
+        if server is None:
+            return
+        try:
+            server.stdin.close()
+            server.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            server.kill()
+            server.wait()
+    
+    def deploy_contract(self, bytecode_file: str, private_key: str,
+                        deadline: Optional[Deadline] = None) -> Optional[str]:
+        """
+        Deploy a smart contract to the Qubic network.
+        
+        Args:
+            bytecode_file: Path to the compiled bytecode file
+            private_key: Private key for signing the deployment transaction
+            deadline: Optional time budget shared with other calls
+            
+        Returns:
+            Contract address if successful, None otherwise
+        """
+        logger.info(f"🚀 Deploying contract from {bytecode_file} to {self.network}")
+        
+        data = self._invoke("-realcontractdeploy", {"bytecode": bytecode_file, "privatekey": private_key},
+                            120, "Contract deployment", deadline=deadline)
+        return self._deployed_address(data)
+    
     def call_contract(self, contract_address: str, function_name: str, 
-                     args: str, private_key: str) -> Optional[str]:
+                     args: str, private_key: str, deadline: Optional[Deadline] = None) -> Optional[str]:
         """
         Call a function on a deployed smart contract.
         
@@ -105,51 +553,23 @@ class RealQubicExecutor:
             function_name: Name of the function to call
             args: Function arguments (comma-separated)
             private_key: Private key for signing the transaction
+            deadline: Optional time budget shared with other calls
             
         Returns:
             Function result if successful, None otherwise
         """
         logger.info(f"📞 Calling {function_name} on contract {contract_address}")
         
-        try:
-            cmd = [
-                self.cli_path,
-                "-realcontractcall",
-                "--contract", contract_address,
-                "--function", function_name,
-                "--privatekey", private_key,
-                "--network", self.network
-            ]
-            
-            if args:
-                cmd.extend(["--args", args])
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-            
-            if result.returncode == 0:
-                # Parse result from output
-                for line in result.stdout.split('\n'):
-                    if "Result:" in line:
-                        function_result = line.split(":")[-1].strip()
-                        logger.info(f"✅ Function call successful: {function_result}")
-                        return function_result
-                
-                logger.info("✅ Function call completed")
-                return "Success"
-            else:
-                logger.error(f"❌ Function call failed: {result.stderr}")
-                return None
-                
-        except subprocess.TimeoutExpired:
-            logger.error("❌ Function call timed out")
-            return None
-        except Exception as e:
-            logger.error(f"❌ Function call error: {e}")
-            return None
+        data = self._invoke(
+            "-realcontractcall",
+            {"contract": contract_address, "function": function_name, "privatekey": private_key},
+            60, "Function call", options={"args": args}, deadline=deadline
+        )
+        return self._call_result(data)
     
     def create_voting_proposal(self, contract_address: str, title: str, 
                              description: str, duration_seconds: int, 
-                             private_key: str) -> Optional[str]:
+                             private_key: str, deadline: Optional[Deadline] = None) -> Optional[str]:
         """
         Create a new voting proposal.
         
@@ -159,49 +579,24 @@ class RealQubicExecutor:
             description: Proposal description
             duration_seconds: Voting duration in seconds
             private_key: Private key for signing the transaction
+            deadline: Optional time budget shared with other calls
             
         Returns:
             Proposal ID if successful, None otherwise
         """
         logger.info(f"🗳️ Creating voting proposal: {title}")
         
-        try:
-            cmd = [
-                self.cli_path,
-                "-realvotingcreate",
-                "--contract", contract_address,
-                "--title", title,
-                "--description", description,
-                "--duration", str(duration_seconds),
-                "--privatekey", private_key,
-                "--network", self.network
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-            
-            if result.returncode == 0:
-                # Parse proposal ID from output
-                for line in result.stdout.split('\n'):
-                    if "Proposal ID:" in line:
-                        proposal_id = line.split(":")[-1].strip()
-                        logger.info(f"✅ Proposal created with ID: {proposal_id}")
-                        return proposal_id
-                
-                logger.info("✅ Proposal created")
-                return "1"  # Default ID
-            else:
-                logger.error(f"❌ Proposal creation failed: {result.stderr}")
-                return None
-                
-        except subprocess.TimeoutExpired:
-            logger.error("❌ Proposal creation timed out")
-            return None
-        except Exception as e:
-            logger.error(f"❌ Proposal creation error: {e}")
-            return None
+        data = self._invoke(
+            "-realvotingcreate",
+            {"contract": contract_address, "title": title, "description": description,
+             "duration": duration_seconds, "privatekey": private_key},
+            60, "Proposal creation", deadline=deadline
+        )
+        return self._created_proposal_id(data)
     
     def cast_vote(self, contract_address: str, proposal_id: str, user_id: str, 
-                 choice: int, private_key: str, comment: str = "") -> bool:
+                 choice: int, private_key: str, comment: str = "",
+                 deadline: Optional[Deadline] = None) -> bool:
         """
         Cast a vote on a proposal.
         
@@ -212,150 +607,381 @@ class RealQubicExecutor:
             choice: Vote choice (1=YES, 2=NO, 3=ABSTAIN)
             private_key: Private key for signing the transaction
             comment: Optional vote comment
+            deadline: Optional time budget shared with other calls
             
         Returns:
             True if successful, False otherwise
         """
-        choice_names = {1: "YES", 2: "NO", 3: "ABSTAIN"}
-        choice_name = choice_names.get(choice, f"UNKNOWN({choice})")
-        
+        choice_name = _CHOICE_NAMES.get(choice, f"UNKNOWN({choice})")
         logger.info(f"🗳️ Casting {choice_name} vote for proposal {proposal_id}")
         
-        try:
-            cmd = [
-                self.cli_path,
-                "-realvotingcast",
-                "--contract", contract_address,
-                "--proposal", proposal_id,
-                "--userid", user_id,
-                "--choice", str(choice),
-                "--privatekey", private_key,
-                "--network", self.network
-            ]
-            
-            if comment:
-                cmd.extend(["--comment", comment])
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        data = self._invoke(
+            "-realvotingcast",
+            {"contract": contract_address, "proposal": proposal_id, "userid": user_id,
+             "choice": choice, "privatekey": private_key},
+            60, "Vote casting", options={"comment": comment}, deadline=deadline
+        )
+        return self._vote_cast(proposal_id, data)
+    
+    def cast_votes_batch(self, contract_address: str, proposal_id: str,
+                         votes: List[Tuple[str, int, str]], private_key: str,
+                         deadline: Optional[Deadline] = None) -> List[bool]:
+        """
+        Cast several votes on a proposal with a single -realvotingcastbatch command.
+        
+        Falls back to one cast_vote call per vote when the CLI has no batch support.
+        
+        Args:
+            contract_address: Address of the voting contract
+            proposal_id: ID of the proposal to vote on
+            votes: (user_id, choice, comment) for each voter; choice is 1=YES, 2=NO, 3=ABSTAIN
+            private_key: Private key for signing the transactions
+            deadline: Optional time budget shared with other calls
             
-            if result.returncode == 0:
-                logger.info(f"✅ Vote cast successfully")
-                return True
-            else:
-                logger.error(f"❌ Vote casting failed: {result.stderr}")
-                return False
-                
-        except subprocess.TimeoutExpired:
-            logger.error("❌ Vote casting timed out")
-            return False
-        except Exception as e:
-            logger.error(f"❌ Vote casting error: {e}")
-            return False
+        Returns:
+            One success flag per vote, in the same order as votes
+        """
+        if not votes:
+            return []
+        
+        if not self._batch_supported:
+            return [
+                self.cast_vote(contract_address, proposal_id, user_id, choice, private_key, comment, deadline)
+                for user_id, choice, comment in votes
+            ]
+        
+        logger.info(f"🗳️ Casting {len(votes)} votes for proposal {proposal_id}")
+        
+        payload = {
+            "proposal": proposal_id,
+            "votes": [
+                {"user": user_id, "choice": choice, "comment": comment}
+                for user_id, choice, comment in votes
+            ]
+        }
+        
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            json.dump(payload, f)
+            votes_file = f.name
+        
+        try:
+            data = self._invoke(
+                "-realvotingcastbatch",
+                {"contract": contract_address, "votesfile": votes_file, "privatekey": private_key},
+                60 + 10 * len(votes), "Batch vote casting", deadline=deadline
+            )
+        finally:
+            os.unlink(votes_file)
+        self.invalidate(proposal=proposal_id)
+        
+        succeeded = (data or {}).get("votes", [])
+        succeeded = [bool(flag) for flag in succeeded[:len(votes)]]
+        succeeded += [False] * (len(votes) - len(succeeded))
+        
+        logger.info(f"✅ {sum(succeeded)}/{len(votes)} votes cast successfully")
+        return succeeded
     
-    def get_voting_results(self, contract_address: str, proposal_id: str) -> Optional[Dict[str, Any]]:
+    def get_voting_results(self, contract_address: str, proposal_id: str,
+                           deadline: Optional[Deadline] = None) -> Optional[Dict[str, Any]]:
         """
         Get voting results for a proposal.
         
         Args:
             contract_address: Address of the voting contract
             proposal_id: ID of the proposal
+            deadline: Optional time budget shared with other calls
             
         Returns:
             Dictionary with voting results if successful, None otherwise
         """
+        cache_key = (self.network, contract_address, proposal_id)
+        cached = self._results_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+        
         logger.info(f"📊 Getting results for proposal {proposal_id}")
         
-        try:
-            cmd = [
-                self.cli_path,
-                "-realvotingresults",
-                "--contract", contract_address,
-                "--proposal", proposal_id,
-                "--network", self.network
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            
-            if result.returncode == 0:
-                # Parse results from output (simplified parsing)
-                results = {
-                    "proposal_id": proposal_id,
-                    "yes_votes": 0,
-                    "no_votes": 0,
-                    "abstain_votes": 0,
-                    "total_votes": 0,
-                    "status": "active"
-                }
-                
-                # In real implementation, parse actual results from CLI output
-                for line in result.stdout.split('\n'):
-                    if "YES:" in line:
-                        results["yes_votes"] = int(line.split(":")[-1].strip())
-                    elif "NO:" in line:
-                        results["no_votes"] = int(line.split(":")[-1].strip())
-                    elif "ABSTAIN:" in line:
-                        results["abstain_votes"] = int(line.split(":")[-1].strip())
-                
-                results["total_votes"] = (results["yes_votes"] + 
-                                        results["no_votes"] + 
-                                        results["abstain_votes"])
-                
-                logger.info(f"✅ Results retrieved: {results['total_votes']} total votes")
-                return results
-            else:
-                logger.error(f"❌ Results retrieval failed: {result.stderr}")
-                return None
-                
-        except subprocess.TimeoutExpired:
-            logger.error("❌ Results retrieval timed out")
-            return None
-        except Exception as e:
-            logger.error(f"❌ Results retrieval error: {e}")
-            return None
+        data = self._invoke("-realvotingresults", {"contract": contract_address, "proposal": proposal_id},
+                            30, "Results retrieval", deadline=deadline)
+        return self._voting_results(cache_key, data)
     
-    def get_balance(self, address: str) -> Optional[int]:
+    def get_balance(self, address: str, deadline: Optional[Deadline] = None) -> Optional[int]:
         """
         Get balance for a Qubic address.
         
         Args:
             address: Qubic address to check
+            deadline: Optional time budget shared with other calls
             
         Returns:
             Balance in QU if successful, None otherwise
         """
+        cache_key = (self.network, address)
+        cached = self._balance_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         logger.info(f"💰 Getting balance for {address}")
         
+        balance = self._http_balance(address, deadline)
+        if balance is not None:
+            return self._balance(cache_key, {"balance": balance})
+        
+        data = self._invoke("-realbalance", {"address": address}, 30, "Balance retrieval", deadline=deadline)
+        return self._balance(cache_key, data)
+    
+    # Result handling shared by the blocking methods and their async twins
+    
+    def _deployed_address(self, data: Optional[Dict[str, Any]]) -> Optional[str]:
+        # Deployment fees change the deployer's balance, whose address is not known here
+        self.invalidate()
+        
+        if data is None:
+            return None
+        address = data.get("contract_address")
+        if not address:
+            logger.warning("Deployment completed but no contract address found in output")
+            return None
+        logger.info(f"✅ Contract deployed successfully: {address}")
+        return address
+    
+    def _call_result(self, data: Optional[Dict[str, Any]]) -> Optional[str]:
+        if data is None:
+            return None
+        function_result = data.get("result")
+        if function_result is None:
+            logger.info("✅ Function call completed")
+            return "Success"
+        logger.info(f"✅ Function call successful: {function_result}")
+        return function_result
+    
+    def _created_proposal_id(self, data: Optional[Dict[str, Any]]) -> Optional[str]:
+        if data is None:
+            return None
+        proposal_id = data.get("proposal_id")
+        if not proposal_id:
+            logger.info("✅ Proposal created")
+            return "1"  # Default ID
+        logger.info(f"✅ Proposal created with ID: {proposal_id}")
+        return proposal_id
+    
+    def _vote_cast(self, proposal_id: str, data: Optional[Dict[str, Any]]) -> bool:
+        self.invalidate(proposal=proposal_id)
+        
+        if data is None:
+            return False
+        logger.info(f"✅ Vote cast successfully")
+        return True
+    
+    def _voting_results(self, cache_key: Tuple[str, str, str],
+                        data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        if data is None:
+            return None
+        
+        # -json output (direct or -realserver) carries the contract's raw results string;
+        # its "YES: n" lines are the counts that text output prints on their own lines
+        if "results" in data:
+            data = {_TEXT_KEYS[label]: value for label, value in _parse_output(data["results"]).items()}
+        
+        yes, no, abstain = int(data.get("yes", 0)), int(data.get("no", 0)), int(data.get("abstain", 0))
+        results = {
+            "proposal_id": cache_key[2],
+            "yes_votes": yes,
+            "no_votes": no,
+            "abstain_votes": abstain,
+            "total_votes": yes + no + abstain,
+            "status": "active"
+        }
+        
+        logger.info(f"✅ Results retrieved: {results['total_votes']} total votes")
+        self._results_cache.put(cache_key, results)
+        return dict(results)
+    
+    def _balance(self, cache_key: Tuple[str, str], data: Optional[Dict[str, Any]]) -> Optional[int]:
+        if data is None:
+            return None
+        
+        balance = int(data.get("balance", 0))
+        logger.info(f"✅ Balance: {balance:,} QU")
+        self._balance_cache.put(cache_key, balance)
+        return balance
+
+class AsyncRealQubicExecutor(RealQubicExecutor):
+    """
+    RealQubicExecutor with asyncio twins of the command methods.
+    
+    Each *_async method runs the CLI with asyncio.create_subprocess_exec, so one
+    event loop can keep many commands in flight without a thread per call. The
+    blocking methods remain available and share the caches and result handling.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Output drains still running after an early -json return
+        self._drains = set()
+    
+    async def _run_async(self, cmd: List[str], timeout: float) -> subprocess.CompletedProcess:
+        """
+        Run one command as its own process without blocking the event loop.
+        
+        Like _run_streaming, returns at the final -json line and leaves the rest
+        of the output and the process's exit to a background task.
+        
+        Raises:
+            subprocess.TimeoutExpired: If the result does not arrive in time
+        """
+        process = await asyncio.create_subprocess_exec(
+            *cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+        )
+        
+        async def read_result():
+            output = []
+            async for raw in process.stdout:
+                line = raw.decode("utf-8", errors="replace")
+                output.append(line)
+                if self._json_supported and line.startswith(_JSON_RESULT_PREFIX):
+                    return 0, "".join(output)
+            return await process.wait(), "".join(output)
+        
         try:
-            cmd = [
-                self.cli_path,
-                "-realbalance",
-                "--address", address,
-                "--network", self.network
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            
-            if result.returncode == 0:
-                # Parse balance from output
-                for line in result.stdout.split('\n'):
-                    if "Balance:" in line and "QU" in line:
-                        balance_str = line.split(":")[-1].replace("QU", "").strip()
-                        balance = int(balance_str)
-                        logger.info(f"✅ Balance: {balance:,} QU")
-                        return balance
-                
-                logger.info("✅ Balance retrieved")
-                return 0
-            else:
-                logger.error(f"❌ Balance retrieval failed: {result.stderr}")
+            returncode, output = await asyncio.wait_for(read_result(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        
+        if process.returncode is None:
+            drain = asyncio.ensure_future(self._drain(process))
+            self._drains.add(drain)
+            drain.add_done_callback(self._drains.discard)
+        return subprocess.CompletedProcess(cmd, returncode, output, output if returncode else "")
+    
+    @staticmethod
+    async def _drain(process: asyncio.subprocess.Process):
+        async for _ in process.stdout:
+            pass
+        await process.wait()
+    
+    async def _invoke_async(self, subcommand: str, params: Dict[str, Any], timeout: float, action: str,
+                            options: Optional[Dict[str, Any]] = None,
+                            deadline: Optional[Deadline] = None) -> Optional[Dict[str, Any]]:
+        """Async twin of _invoke."""
+        if deadline is not None:
+            if deadline.expired():
+                logger.error(f"❌ {action} timed out")
                 return None
-                
+            timeout = min(timeout, deadline.remaining())
+        
+        try:
+            result = await self._run_async(self._command(subcommand, params, options), timeout)
+            return self._result_fields(result, action)
         except subprocess.TimeoutExpired:
-            logger.error("❌ Balance retrieval timed out")
+            logger.error(f"❌ {action} timed out")
             return None
         except Exception as e:
-            logger.error(f"❌ Balance retrieval error: {e}")
+            logger.error(f"❌ {action} error: {e}")
             return None
+    
+    async def deploy_contract_async(self, bytecode_file: str, private_key: str,
+                                    deadline: Optional[Deadline] = None) -> Optional[str]:
+        """Async twin of deploy_contract."""
+        logger.info(f"🚀 Deploying contract from {bytecode_file} to {self.network}")
+        
+        data = await self._invoke_async("-realcontractdeploy", {"bytecode": bytecode_file, "privatekey": private_key},
+                                        120, "Contract deployment", deadline=deadline)
+        return self._deployed_address(data)
+    
+    async def call_contract_async(self, contract_address: str, function_name: str,
+                                  args: str, private_key: str,
+                                  deadline: Optional[Deadline] = None) -> Optional[str]:
+        """Async twin of call_contract."""
+        logger.info(f"📞 Calling {function_name} on contract {contract_address}")
+        
+        data = await self._invoke_async(
+            "-realcontractcall",
+            {"contract": contract_address, "function": function_name, "privatekey": private_key},
+            60, "Function call", options={"args": args}, deadline=deadline
+        )
+        return self._call_result(data)
+    
+    async def create_voting_proposal_async(self, contract_address: str, title: str,
+                                           description: str, duration_seconds: int,
+                                           private_key: str, deadline: Optional[Deadline] = None) -> Optional[str]:
+        """Async twin of create_voting_proposal."""
+        logger.info(f"🗳️ Creating voting proposal: {title}")
+        
+        data = await self._invoke_async(
+            "-realvotingcreate",
+            {"contract": contract_address, "title": title, "description": description,
+             "duration": duration_seconds, "privatekey": private_key},
+            60, "Proposal creation", deadline=deadline
+        )
+        return self._created_proposal_id(data)
+    
+    async def cast_vote_async(self, contract_address: str, proposal_id: str, user_id: str,
+                              choice: int, private_key: str, comment: str = "",
+                              deadline: Optional[Deadline] = None) -> bool:
+        """Async twin of cast_vote."""
+        choice_name = _CHOICE_NAMES.get(choice, f"UNKNOWN({choice})")
+        logger.info(f"🗳️ Casting {choice_name} vote for proposal {proposal_id}")
+        
+        data = await self._invoke_async(
+            "-realvotingcast",
+            {"contract": contract_address, "proposal": proposal_id, "userid": user_id,
+             "choice": choice, "privatekey": private_key},
+            60, "Vote casting", options={"comment": comment}, deadline=deadline
+        )
+        return self._vote_cast(proposal_id, data)
+    
+    async def get_voting_results_async(self, contract_address: str, proposal_id: str,
+                                       deadline: Optional[Deadline] = None) -> Optional[Dict[str, Any]]:
+        """Async twin of get_voting_results."""
+        cache_key = (self.network, contract_address, proposal_id)
+        cached = self._results_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+        
+        logger.info(f"📊 Getting results for proposal {proposal_id}")
+        
+        data = await self._invoke_async("-realvotingresults", {"contract": contract_address, "proposal": proposal_id},
+                                        30, "Results retrieval", deadline=deadline)
+        return self._voting_results(cache_key, data)
+    
+    async def get_balance_async(self, address: str, deadline: Optional[Deadline] = None) -> Optional[int]:
+        """Async twin of get_balance."""
+        cache_key = (self.network, address)
+        cached = self._balance_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        logger.info(f"💰 Getting balance for {address}")
+        
+        if self._http is not None:
+            balance = await asyncio.to_thread(self._http_balance, address, deadline)
+            if balance is not None:
+                return self._balance(cache_key, {"balance": balance})
+        
+        data = await self._invoke_async("-realbalance", {"address": address}, 30, "Balance retrieval",
+                                        deadline=deadline)
+        return self._balance(cache_key, data)
+
+@functools.cache
+def get_executor(network: str = "testnet", cli_path: str = "qubic-cli.exe") -> RealQubicExecutor:
+    """
+    Return the process-wide executor for (network, cli_path), creating it on first use.
+    
+    Sharing one executor means one CLI probe and one -realserver process per
+    interpreter instead of per request. The executor is safe to use from
+    several threads; callers must not close() it.
+    
+    Args:
+        network: Network to use ("testnet" or "mainnet")
+        cli_path: Path to the qubic-cli executable
+        
+    Returns:
+        The shared RealQubicExecutor
+    """
+    return RealQubicExecutor(network=network, cli_path=cli_path)
 
 # Example usage for SmartGuard integration
 def demo_smartguard_integration():
@@ -365,15 +991,18 @@ def demo_smartguard_integration():
     print("=" * 60)
     
     # Initialize executor
-    executor = RealQubicExecutor(network="testnet")
+    executor = get_executor("testnet")
     
     # Demo configuration
     private_key = "aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"  # Demo key
     bytecode_file = "voting_contract.bytecode"
     
+    # One time budget for the whole flow rather than a timeout per step
+    deadline = Deadline(120)
+    
     # Step 1: Deploy voting contract
     print("\n1️⃣ Deploying Voting Contract...")
-    contract_address = executor.deploy_contract(bytecode_file, private_key)
+    contract_address = executor.deploy_contract(bytecode_file, private_key, deadline=deadline)
     
     if not contract_address:
         print("❌ Could not deploy contract - using demo address")
@@ -386,7 +1015,8 @@ def demo_smartguard_integration():
         title="Implement New Feature",
         description="Should we implement the new analytics dashboard?",
         duration_seconds=86400,  # 24 hours
-        private_key=private_key
+        private_key=private_key,
+        deadline=deadline
     )
     
     if not proposal_id:
@@ -396,35 +1026,32 @@ def demo_smartguard_integration():
     # Step 3: Cast votes
     print("\n3️⃣ Casting Votes...")
     
-    # Vote YES
-    success = executor.cast_vote(
+    votes = [
+        ("alice", 1, "Great idea! This will improve user experience."),  # YES
+        ("bob", 2, "Too expensive to implement right now."),  # NO
+    ]
+    alice_ok, bob_ok = executor.cast_votes_batch(
         contract_address=contract_address,
         proposal_id=proposal_id,
-        user_id="alice",
-        choice=1,  # YES
+        votes=votes,
         private_key=private_key,
-        comment="Great idea! This will improve user experience."
+        deadline=deadline
     )
     
-    if success:
+    if alice_ok:
         print("✅ Alice voted YES")
-    
-    # Vote NO
-    success = executor.cast_vote(
-        contract_address=contract_address,
-        proposal_id=proposal_id,
-        user_id="bob",
-        choice=2,  # NO
-        private_key=private_key,
-        comment="Too expensive to implement right now."
-    )
-    
-    if success:
+    if bob_ok:
         print("✅ Bob voted NO")
     
-    # Step 4: Get results
+    # Step 4 and 5: the results and balance reads are independent, so run them together
     print("\n4️⃣ Getting Voting Results...")
-    results = executor.get_voting_results(contract_address, proposal_id)
+    print("\n5️⃣ Checking Account Balance...")
+    # Derive address from private key (simplified)
+    demo_address = "QUBICABC123456789DEF123456789ABC123456789DEF123456789ABC"
+    results_future = executor.submit_voting_results(contract_address, proposal_id, deadline)
+    balance_future = executor.submit_balance(demo_address, deadline)
+    results = results_future.result()
+    balance = balance_future.result()
     
     if results:
         print(f"📊 Voting Results for Proposal {proposal_id}:")
@@ -433,12 +1060,6 @@ def demo_smartguard_integration():
         print(f"   ABSTAIN votes: {results['abstain_votes']}")
         print(f"   Total votes: {results['total_votes']}")
     
-    # Step 5: Check balance
-    print("\n5️⃣ Checking Account Balance...")
-    # Derive address from private key (simplified)
-    demo_address = "QUBICABC123456789DEF123456789ABC123456789DEF123456789ABC"
-    balance = executor.get_balance(demo_address)
-    
     if balance is not None:
         print(f"💰 Account balance: {balance:,} QU")
     
@@ -26,13 +26,8 @@ def print_step(step_num, description):
     print(f"\n[Step {step_num}] {description}")
     print("-" * 50)
 
-def simulate_smartguard_state():
-    """Create a mock SmartGuard state object with real contract code."""
-    
-    class MockSmartContractState:
-        def __init__(self):
-            # Real voting contract code that SmartGuard users would submit
-            self.contract_code = '''
+# Real voting contract code that SmartGuard users would submit
+_VOTING_CONTRACT_SRC = '''
             struct VotingContract {
                 // Proposal data
                 struct Proposal {
@@ -104,11 +99,18 @@ def simulate_smartguard_state():
                 }
             };
             '''
-            
-            self.messages = []
-            self.compilation_successful = False
-            self.execution_results = {}
+
+class MockSmartContractState:
+    """Mock SmartGuard state object holding the user's contract code."""
     
+    def __init__(self):
+        self.contract_code = _VOTING_CONTRACT_SRC
+        self.messages = []
+        self.compilation_successful = False
+        self.execution_results = {}
+
+def simulate_smartguard_state():
+    """Create a mock SmartGuard state object with real contract code."""
     return MockSmartContractState()
 
 def test_real_smartguard_workflow():
@@ -137,11 +139,12 @@ def test_real_smartguard_workflow():
     print_step(3, "SmartGuard Real Execution Analysis")
     print("🔄 SmartGuard calling real Qubic execution...")
     
-    start_time = time.time()
+    # perf_counter is monotonic: wall-clock adjustments cannot skew the timing
+    start_time = time.perf_counter()
     try:
         # This is exactly how SmartGuard would call our integration
         result_state = compile_and_run_qubic_real(state)
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         
         print(f"✅ Real execution completed in {execution_time:.2f} seconds")
         print(f"📝 Generated {len(result_state.messages)} analysis messages")
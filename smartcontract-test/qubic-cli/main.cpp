@@ -439,83 +439,70 @@ int run(int argc, char* argv[])
         // Real Qubic Dev Kit Execution Commands
         case REAL_CONTRACT_DEPLOY: {
             std::string contractAddress;
-            if (executeRealContractDeployment(g_real_bytecode_file, g_real_private_key, g_real_network, contractAddress)) {
-                LOG("Real contract deployment successful!\n");
-                LOG("Contract Address: %s\n", contractAddress.c_str());
-            } else {
-                LOG("Real contract deployment failed!\n");
-            }
+            bool success = executeRealContractDeployment(g_real_bytecode_file, g_real_private_key, g_real_network, contractAddress);
+            printRealResult(g_real_json_output, "contract deployment", success, 
+                            {{"Contract Address", "contract_address", contractAddress, false, nullptr}});
             break;
         }
         case REAL_CONTRACT_CALL: {
             std::string result;
-            if (executeRealContractCall(g_real_contract_address, g_real_function_name, g_real_function_args, 
-                                      g_real_private_key, g_real_network, result)) {
-                LOG("Real contract call successful!\n");
-                LOG("Result: %s\n", result.c_str());
-            } else {
-                LOG("Real contract call failed!\n");
-            }
+            bool success = executeRealContractCall(g_real_contract_address, g_real_function_name, g_real_function_args, 
+                                                   g_real_private_key, g_real_network, result);
+            printRealResult(g_real_json_output, "contract call", success, {{"Result", "result", result, false, nullptr}});
             break;
         }
         case REAL_VOTING_CREATE: {
             RealQubicExecutor executor(g_real_network, "127.0.0.1", 21841);
             std::string proposalId;
-            if (executor.createVotingProposal(g_real_contract_address, g_real_proposal_title, g_real_proposal_description,
-                                            g_real_proposal_duration, g_real_private_key, proposalId)) {
-                LOG("Real voting proposal creation successful!\n");
-                LOG("Proposal ID: %s\n", proposalId.c_str());
-            } else {
-                LOG("Real voting proposal creation failed!\n");
-            }
+            bool success = executor.createVotingProposal(g_real_contract_address, g_real_proposal_title, g_real_proposal_description,
+                                                         g_real_proposal_duration, g_real_private_key, proposalId);
+            printRealResult(g_real_json_output, "voting proposal creation", success, 
+                            {{"Proposal ID", "proposal_id", proposalId, false, nullptr}});
             break;
         }
         case REAL_VOTING_CAST: {
             RealQubicExecutor executor(g_real_network, "127.0.0.1", 21841);
             std::string result;
-            if (executor.castVote(g_real_contract_address, g_real_proposal_id, g_real_user_id,
-                                g_real_vote_choice, g_real_vote_comment, g_real_private_key, result)) {
-                LOG("Real vote casting successful!\n");
-                LOG("Result: %s\n", result.c_str());
-            } else {
-                LOG("Real vote casting failed!\n");
-            }
+            bool success = executor.castVote(g_real_contract_address, g_real_proposal_id, g_real_user_id,
+                                             g_real_vote_choice, g_real_vote_comment, g_real_private_key, result);
+            printRealResult(g_real_json_output, "vote casting", success, {{"Result", "result", result, false, nullptr}});
+            break;
+        }
+        case REAL_VOTING_CAST_BATCH: {
+            RealQubicExecutor executor(g_real_network, "127.0.0.1", 21841);
+            runRealVoteBatch(executor, g_real_contract_address, g_real_votes_file, g_real_private_key, g_real_json_output);
             break;
         }
         case REAL_VOTING_RESULTS: {
             RealQubicExecutor executor(g_real_network, "127.0.0.1", 21841);
             std::string results;
-            if (executor.getVotingResults(g_real_contract_address, g_real_proposal_id, results)) {
-                LOG("Real voting results retrieval successful!\n");
-                LOG("Results: %s\n", results.c_str());
-            } else {
-                LOG("Real voting results retrieval failed!\n");
-            }
+            bool success = executor.getVotingResults(g_real_contract_address, g_real_proposal_id, results);
+            printRealResult(g_real_json_output, "voting results retrieval", success, {{"Results", "results", results, false, nullptr}});
             break;
         }
         case REAL_BALANCE: {
             RealQubicExecutor executor(g_real_network, "127.0.0.1", 21841);
-            unsigned long long balance;
-            if (executor.getBalance(g_real_check_address, balance)) {
-                LOG("Real balance query successful!\n");
-                LOG("Address: %s\n", g_real_check_address);
-                LOG("Balance: %llu QU\n", balance);
-            } else {
-                LOG("Real balance query failed!\n");
-            }
+            unsigned long long balance = 0;
+            bool success = executor.getBalance(g_real_check_address, balance);
+            printRealResult(g_real_json_output, "balance query", success, {
+                {"Address", "address", g_real_check_address, false, nullptr},
+                {"Balance", "balance", std::to_string(balance), true, "QU"}
+            });
             break;
         }
         case REAL_TRANSFER: {
             RealQubicExecutor executor(g_real_network, "127.0.0.1", 21841);
             std::string txId;
-            if (executor.transferQubic(g_real_private_key, g_real_target_address, g_real_transfer_amount, txId)) {
-                LOG("Real Qubic transfer successful!\n");
-                LOG("Transaction ID: %s\n", txId.c_str());
-                LOG("Amount: %llu QU\n", g_real_transfer_amount);
-                LOG("To: %s\n", g_real_target_address);
-            } else {
-                LOG("Real Qubic transfer failed!\n");
-            }
+            bool success = executor.transferQubic(g_real_private_key, g_real_target_address, g_real_transfer_amount, txId);
+            printRealResult(g_real_json_output, "Qubic transfer", success, {
+                {"Transaction ID", "transaction_id", txId, false, nullptr},
+                {"Amount", "amount", std::to_string(g_real_transfer_amount), true, "QU"},
+                {"To", "to", g_real_target_address, false, nullptr}
+            });
+            break;
+        }
+        case REAL_SERVER: {
+            runRealExecutionServer();
             break;
         }
         case GQMPROP_SET_PROPOSAL:
@@ -6,6 +6,7 @@
 #include <chrono>
 #include <cstring>
 #include <cstdlib>
+#include <vector>
 
 // Real Qubic Dev Kit execution types
 enum ExecutionType {
@@ -106,6 +107,7 @@ public:
     bool castVote(const char* contractAddress, const char* proposalId, const char* userId, 
                  int choice, const char* comment, const char* privateKey, std::string& result);
     bool getVotingResults(const char* contractAddress, const char* proposalId, std::string& results);
+    bool getAllVotingResults(const char* contractAddress, std::string& resultsJson);
     
     // Network operations
     bool isConnected();
@@ -122,6 +124,28 @@ private:
     bool executeTransaction(const ExecutionParams& params, std::string& result);
 };
 
+// One "Label: value" line of a real command's output; a "key": value member with -json
+struct RealOutputField {
+    const char* label;
+    const char* key;
+    std::string value;
+    bool numeric;       // emitted unquoted with -json
+    const char* unit;   // appended in text mode, e.g. "QU"
+};
+
+// Print "Real <operation> successful!|failed!" plus the fields, or a single
+// {"status":"success"|"failed", <key>: <value>, ...} line when json is set
+void printRealResult(bool json, const char* operation, bool success, 
+                     const std::vector<RealOutputField>& fields = {});
+
+// -realvotingcastbatch: cast every vote in a JSON votes file and print one
+// "Vote <N>: success|failed" line per vote; false if the file is unusable
+bool runRealVoteBatch(RealQubicExecutor& executor, const char* contractAddress, 
+                      const char* votesFile, const char* privateKey, bool json = false);
+
+// Long-lived JSON-lines command loop for -realserver (see printHelp)
+int runRealExecutionServer();
+
 // Python integration helpers (for SmartGuard integration)
 extern "C" {
     // C interface for Python integration
@@ -134,6 +158,9 @@ extern "C" {
     
     int get_real_balance(const char* address, const char* network, unsigned long long* balance);
     
+    // Balance as the return value (no out-parameter); REAL_QUBIC_BALANCE_ERROR on failure
+    unsigned long long get_real_balance_v2(const char* address, const char* network);
+    
     int create_real_voting_proposal(const char* contract_address, const char* title, 
                                    const char* description, unsigned long long duration, 
                                    const char* private_key, const char* network, 
@@ -146,6 +173,43 @@ extern "C" {
     
     int get_real_voting_results(const char* contract_address, const char* proposal_id, 
                                const char* network, char* results_buffer, int buffer_size);
+    
+    // Status of every proposal in one round trip, as a JSON object:
+    // {"is_active", "proposals": [...], "total_voters", "total_votes_cast", "raw_result"}
+    int get_all_voting_results(const char* contract_address, const char* network, 
+                              char* results_buffer, int buffer_size);
+    
+    // Sessions: one connected RealQubicExecutor reused across calls instead of
+    // reconnecting per call. Close every opened session exactly once.
+    void* qubic_open_session(const char* network);
+    int qubic_close_session(void* session);
+    
+    unsigned long long qubic_session_get_balance(void* session, const char* address);
+    
+    int qubic_session_create_voting_proposal(void* session, const char* contract_address, 
+                                            const char* title, const char* description, 
+                                            unsigned long long duration, const char* private_key, 
+                                            char* proposal_id_buffer, int buffer_size);
+    
+    int qubic_session_cast_vote(void* session, const char* contract_address, const char* proposal_id, 
+                               const char* user_id, int choice, const char* comment, 
+                               const char* private_key, char* result_buffer, int buffer_size);
+    
+    int qubic_session_get_voting_results(void* session, const char* contract_address, 
+                                        const char* proposal_id, char* results_buffer, int buffer_size);
+    
+    // Batched contract calls: calls_json is [{"function": "...", "arguments": "..."}, ...];
+    // results_buffer receives a JSON array with one {"status", "result"|"code"} per call.
+    // If the array does not fit, returns REAL_QUBIC_ERROR_BUFFER_TOO_SMALL with the size
+    // needed (including the NUL) in *required_size; the calls have already run, so fetch
+    // the array with get_real_contract_call_batch_results instead of calling again
+    int execute_real_contract_call_batch(const char* contract_address, const char* calls_json, 
+                                        const char* private_key, const char* network, 
+                                        char* results_buffer, int buffer_size, int* required_size);
+    
+    // Copy the results of this thread's last execute_real_contract_call_batch that did not
+    // fit its buffer; they are kept until copied or the next batch on the thread
+    int get_real_contract_call_batch_results(char* results_buffer, int buffer_size);
 }
 
 // Configuration constants
@@ -158,6 +222,7 @@ extern "C" {
 #define REAL_QUBIC_DEPLOY_TIMEOUT 120
 #define REAL_QUBIC_MAX_RETRIES 3
 #define REAL_QUBIC_RETRY_DELAY 5000  // milliseconds
+#define REAL_QUBIC_MAX_PARALLEL_CALLS 8  // calls in flight per batch
 
 // Error codes
 #define REAL_QUBIC_SUCCESS 0
@@ -166,3 +231,7 @@ extern "C" {
 #define REAL_QUBIC_ERROR_TRANSACTION_FAILED -3
 #define REAL_QUBIC_ERROR_TIMEOUT -4
 #define REAL_QUBIC_ERROR_INVALID_RESPONSE -5
+#define REAL_QUBIC_ERROR_BUFFER_TOO_SMALL -6
+
+// Failure sentinel for get_real_balance_v2 (UINT64_MAX is never a real balance)
+#define REAL_QUBIC_BALANCE_ERROR 0xFFFFFFFFFFFFFFFFULL
@@ -15,13 +15,320 @@ License: MIT
 Compatible with: SmartGuard audit platform
 """
 
+import asyncio
+import codecs
+import contextlib
+import io
 import subprocess
 import tempfile
 import os
 import sys
 import time
+import hashlib
+import json
+import queue
+import selectors
+import signal
+import shutil
+import re
+import threading
+from collections import OrderedDict, deque
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Union, List, Tuple, Callable
+
+# Bump when the layout of cached compile results changes
+COMPILE_CACHE_VERSION = "3"
+
+# Set to "0" to bypass the persistent compile cache (reads and writes)
+COMPILE_CACHE_ENV = "SMARTGUARD_COMPILE_CACHE"
+
+# String/char literals, comments and horizontal whitespace, blanked before counting braces
+_NORMALIZE_RE = re.compile(
+    r'("(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\')|//[^\n]*|/\*.*?\*/|[ \t]+',
+    re.DOTALL
+)
+
+
+# Cheap pre-flight checks run before qubic-cli is spawned
+_DECL_RE = re.compile(r'\b(?:struct|class)\b')
+_QPI_RE = re.compile(r'\bQPI\b')
+_BASE_RE = re.compile(r'\bContractBase\b')
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7f]')
+
+
+def scan_contract_source(contract_code: str) -> Tuple[int, int, int]:
+    """
+    Single-pass source statistics for pre-flight warnings.
+    
+    Every count runs in C (str methods and one regex), so this stays cheap
+    when many contracts are validated in a batch.
+    
+    Args:
+        contract_code: The C++ contract source code
+        
+    Returns:
+        (line_count, non_ascii_count, brace_balance), where brace_balance is
+        the number of '{' minus '}' outside comments and string literals
+    """
+    line_count = contract_code.count('\n') + 1
+    non_ascii_count = 0 if contract_code.isascii() else len(_NON_ASCII_RE.findall(contract_code))
+    code_only = _NORMALIZE_RE.sub(' ', contract_code)
+    return line_count, non_ascii_count, code_only.count('{') - code_only.count('}')
+
+
+def preflight_contract(contract_code: str) -> Optional[str]:
+    """
+    Reject source that cannot be a contract without running the compiler.
+    
+    Missing QPI / ContractBase markers are not fatal: the bundled qubic-cli
+    compiles plain structs too, so those are only reported as warnings.
+    
+    Args:
+        contract_code: The C++ contract source code
+        
+    Returns:
+        Error message if the source must be rejected, None otherwise
+    """
+    if not _DECL_RE.search(contract_code):
+        return "No struct or class declaration found - not a Qubic contract"
+    return None
+
+# Minimal, deterministic environment for qubic-cli children. SYSTEMROOT and
+# the TEMP variables are required for Windows processes to start correctly.
+_QUBIC_ENV = {
+    key: os.environ[key]
+    for key in ('PATH', 'HOME', 'LANG', 'LC_ALL', 'TMPDIR',
+                'SYSTEMROOT', 'TEMP', 'TMP', 'USERPROFILE')
+    if key in os.environ
+}
+
+# Resolved qubic-cli path, exported so child processes skip discovery
+QUBIC_CLI_PATH_ENV = "QUBIC_CLI_PATH"
+
+# Common qubic-cli locations for SmartGuard integration (relative to the working directory)
+_QUBIC_CLI_SEARCH_PATHS = (
+    "qubic-cli/build/Release/qubic-cli.exe",
+    "qubic-cli/build/Debug/qubic-cli.exe",
+    "qubic-cli/build/qubic-cli.exe",
+    "qubic-cli/qubic-cli.exe",
+    "bin/qubic-cli.exe",
+    "tools/qubic-cli.exe",
+    "qubic-cli.exe",
+    "qubic-cli",
+)
+
+
+@lru_cache(maxsize=8)
+def _locate_qubic_cli(provided_path: Optional[str], cwd: str) -> str:
+    """
+    Resolve the qubic-cli executable, probing the filesystem once per
+    (provided_path, working directory) pair.
+    """
+    if provided_path and os.path.isfile(provided_path):
+        return provided_path
+    
+    for path in _QUBIC_CLI_SEARCH_PATHS:
+        candidate = os.path.join(cwd, path)
+        if os.path.isfile(candidate):
+            return os.path.abspath(candidate)
+    
+    # If not found, resolve it from PATH or assume it will be provided later
+    return shutil.which("qubic-cli") or "qubic-cli"
+
+
+# Contract ID reported by qubic-cli after a deployment
+_CONTRACT_ID_RE = re.compile(r'(?:Contract\s+)?ID:\s*(\S{6,})')
+
+
+def _file_digest(path: str) -> Optional[str]:
+    """Content hash of a file, or None if it cannot be read."""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+
+def _drain_pipe(pipe, sink: deque):
+    """Read a text pipe line by line into a bounded deque until EOF."""
+    try:
+        for line in iter(pipe.readline, ''):
+            sink.append(line)
+    finally:
+        pipe.close()
+
+
+class _StreamSink:
+    """Decode raw pipe chunks into lines appended to a bounded deque."""
+    
+    def __init__(self, pipe, lines: deque):
+        self.pipe = pipe
+        self.lines = lines
+        self._decoder = io.IncrementalNewlineDecoder(
+            # 'replace': a stray byte must never take the shared reactor thread down
+            codecs.getincrementaldecoder(pipe.encoding)(errors='replace'),
+            translate=True
+        )
+        self._partial = ''
+    
+    def feed(self, chunk: bytes, final: bool = False):
+        text = self._partial + self._decoder.decode(chunk, final=final)
+        *complete, self._partial = text.split('\n')
+        self.lines.extend(line + '\n' for line in complete)
+        if final and self._partial:
+            self.lines.append(self._partial)
+            self._partial = ''
+
+
+class _PipeReactor:
+    """
+    One background thread that drains the pipes of every running qubic-cli
+    command through a selector, instead of two reader threads per command.
+    
+    Pipes are only (un)registered on the reactor thread; other threads hand
+    work over through a queue and a self-pipe wakeup. POSIX only: Windows
+    selectors cannot wait on pipes.
+    """
+    
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._pending = queue.SimpleQueue()
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        os.set_blocking(self._wakeup_r, False)
+        self._selector.register(self._wakeup_r, selectors.EVENT_READ)
+        threading.Thread(target=self._loop, name="qubic-pipe-reactor", daemon=True).start()
+    
+    def drain(self, pipes_and_sinks) -> threading.Event:
+        """
+        Start draining (pipe, deque) pairs.
+        
+        Returns:
+            Event set once every pipe has reached EOF
+        """
+        done = threading.Event()
+        job = {'remaining': len(pipes_and_sinks), 'done': done}
+        for pipe, lines in pipes_and_sinks:
+            self._pending.put((_StreamSink(pipe, lines), job))
+        os.write(self._wakeup_w, b'\0')
+        return done
+    
+    def _loop(self):
+        while True:
+            for key, _ in self._selector.select():
+                if key.data is None:
+                    os.read(self._wakeup_r, 4096)
+                    while not self._pending.empty():
+                        sink, job = self._pending.get()
+                        self._selector.register(sink.pipe.fileno(), selectors.EVENT_READ, (sink, job))
+                    continue
+                
+                sink, job = key.data
+                try:
+                    chunk = os.read(key.fd, 65536)
+                except OSError:
+                    chunk = b''
+                sink.feed(chunk, final=not chunk)
+                if not chunk:
+                    self._selector.unregister(key.fd)
+                    sink.pipe.close()
+                    job['remaining'] -= 1
+                    if not job['remaining']:
+                        job['done'].set()
+
+
+@lru_cache(maxsize=None)
+def _pipe_reactor() -> _PipeReactor:
+    """Return the process-wide pipe reactor, starting it on first use."""
+    return _PipeReactor()
+
+
+def _start_draining(process: subprocess.Popen, stdout_lines: deque,
+                    stderr_lines: deque) -> Callable[[Optional[float]], bool]:
+    """
+    Drain a child's stdout/stderr into bounded line buffers in the background.
+    
+    Returns:
+        Callable that waits (up to an optional timeout) for both streams to
+        reach EOF and returns True once they have
+    """
+    pairs = ((process.stdout, stdout_lines), (process.stderr, stderr_lines))
+    if os.name != 'nt':
+        return _pipe_reactor().drain(pairs).wait
+    
+    readers = [threading.Thread(target=_drain_pipe, args=pair, daemon=True) for pair in pairs]
+    for reader in readers:
+        reader.start()
+    
+    def wait(timeout: Optional[float] = None) -> bool:
+        for reader in readers:
+            reader.join(timeout)
+        return not any(reader.is_alive() for reader in readers)
+    
+    return wait
+
+
+def _materialize_source(contract_code: str, stack: contextlib.ExitStack) -> str:
+    """
+    Give the contract source a path qubic-cli can open.
+    
+    On Linux the source lives in an anonymous memfd that the child reads through
+    /proc, so nothing touches the temp directory. Elsewhere a temporary .cpp file
+    is written instead. Cleanup is registered on the stack as soon as the
+    resource exists.
+    
+    Args:
+        contract_code: The C++ contract source code
+        stack: Exit stack that owns the source for the duration of the compile
+        
+    Returns:
+        Path of the contract source
+    """
+    if hasattr(os, 'memfd_create') and os.path.isdir(f"/proc/{os.getpid()}/fd"):
+        fd = os.memfd_create("qubic_src.cpp", os.MFD_CLOEXEC)
+        stack.callback(os.close, fd)
+        data = memoryview(contract_code.encode('utf-8'))
+        while data:
+            data = data[os.write(fd, data):]
+        # The child is a different process, so address the fd through our pid
+        return f"/proc/{os.getpid()}/fd/{fd}"
+    
+    # Windows cannot reopen a file that is still held open, so it is closed and
+    # unlinked explicitly there; elsewhere the file deletes itself on exit.
+    tmp_file = stack.enter_context(
+        tempfile.NamedTemporaryFile(mode='w', suffix='.cpp', delete=(os.name != 'nt'))
+    )
+    tmp_file.write(contract_code)
+    tmp_file.flush()
+    if os.name == 'nt':
+        tmp_file.close()
+        stack.callback(os.unlink, tmp_file.name)
+    return tmp_file.name
+
+
+def _kill_process_tree(process: subprocess.Popen):
+    """
+    Kill a qubic-cli process together with any children it spawned.
+    
+    process.kill() alone leaves compiler children (cl.exe, link.exe, cc1plus)
+    running after a timeout, holding our pipes open and burning CPU.
+    """
+    try:
+        if os.name == 'nt':
+            subprocess.run(
+                ['taskkill', '/F', '/T', '/PID', str(process.pid)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+        else:
+            # The child was started with start_new_session, so its pid is the group id
+            os.killpg(process.pid, signal.SIGKILL)
+    except (OSError, subprocess.SubprocessError):
+        pass
+    # Make sure the direct child is gone even if the tree kill failed
+    if process.poll() is None:
+        process.kill()
+
 
 class QubicExecutionError(Exception):
     """Exception raised for Qubic execution errors."""
@@ -33,62 +340,92 @@ class RealQubicDevKit:
     Provides actual interaction with Qubic testnet/mainnet.
     """
     
-    def __init__(self, qubic_cli_path: Optional[str] = None, timeout: int = 45):
+    # Number of recent compile results kept in memory per instance
+    MEM_CACHE_SIZE = 32
+    
+    # Only the last lines of each qubic-cli output stream are kept in memory
+    MAX_OUTPUT_LINES = 2000
+    
+    # Per-phase timeout caps in seconds; phases not listed use self.timeout.
+    # Compilation is capped so a hung compiler cannot stall the SmartGuard UI.
+    PHASE_TIMEOUT_CAPS = {'compile': 30}
+    
+    # Bounds for the persistent on-disk compile cache (least recently used evicted first)
+    DISK_CACHE_MAX_ENTRIES = 256
+    DISK_CACHE_MAX_BYTES = 128 * 1024 * 1024
+    
+    # Persisted compile results older than this (seconds) are treated as misses
+    DISK_CACHE_TTL = 7 * 24 * 3600
+    
+    def __init__(self, qubic_cli_path: Optional[str] = None, timeout: int = 45,
+                 cache_dir: Optional[str] = None):
         """
         Initialize the Real Qubic Dev Kit.
         
         Args:
             qubic_cli_path: Path to qubic-cli executable (auto-detected if None)
             timeout: Timeout in seconds for operations (default: 45 for better UX)
+            cache_dir: Directory for persisted compile results (default: ~/.smartguard/qubic_cache)
         """
         self.timeout = timeout
         self.qubic_cli_path = self._find_qubic_cli(qubic_cli_path)
-        self.logs = []
+        # Resolved once: a missing CLI short-circuits every command instead of spawning
+        self._cli_present = shutil.which(self.qubic_cli_path) is not None or os.path.isfile(self.qubic_cli_path)
+        # Plain strings, or (template, args) records formatted lazily by get_logs()
+        self.logs: List[Union[str, Tuple[str, tuple]]] = []
+        self._cache_dir = Path(cache_dir) if cache_dir else Path.home() / ".smartguard" / "qubic_cache"
+        self._disk_cache_enabled = os.environ.get(COMPILE_CACHE_ENV, "1") != "0"
+        # (key, output_file) -> (result, cached bytecode path or None, output_file content hash)
+        self._mem_cache: "OrderedDict[tuple, Tuple[Dict[str, Any], Optional[str], Optional[str]]]" = OrderedDict()
+        self._mem_cache_lock = threading.Lock()
+        self._evict_disk_cache()
         
     def _find_qubic_cli(self, provided_path: Optional[str]) -> str:
-        """Find qubic-cli executable."""
-        if provided_path and os.path.isfile(provided_path):
-            return provided_path
-            
-        # Try common locations for SmartGuard integration
-        search_paths = [
-            "./qubic-cli/build/Release/qubic-cli.exe",
-            "./qubic-cli/build/Debug/qubic-cli.exe", 
-            "./qubic-cli/build/qubic-cli.exe",
-            "./qubic-cli/qubic-cli.exe",
-            "./bin/qubic-cli.exe",
-            "./tools/qubic-cli.exe",
-            "qubic-cli.exe",
-            "qubic-cli"
-        ]
-        
-        for path in search_paths:
-            if os.path.isfile(path):
-                return os.path.abspath(path)
-                
-        # If not found, assume it's in PATH or will be provided later
-        return "qubic-cli"
+        """Find qubic-cli executable, preferring a path exported by an earlier process."""
+        path = _locate_qubic_cli(provided_path or os.environ.get(QUBIC_CLI_PATH_ENV), os.getcwd())
+        if os.path.isfile(path):
+            os.environ[QUBIC_CLI_PATH_ENV] = path
+        return path
     
-    def _run_command(self, args: list, input_data: str = "", working_dir: str = ".") -> Dict[str, Any]:
+    def _run_command(self, args: list, input_data: str = "", working_dir: str = ".",
+                     phase: Optional[str] = None) -> Dict[str, Any]:
         """
         Run a command with proper timeout and error handling.
         
+        Each call is a fresh qubic-cli process. Builds with -realserver can
+        serve -contractcompile and the real execution commands from one
+        long-lived process (smartguard_integration.QubicCliWorker uses it), but
+        this module ships on its own and its requests carry no working_dir or
+        stdin, so it keeps one process per command. Repeated compiles are
+        served from the compile cache instead of respawning the compiler.
+        
         Args:
             args: Command arguments
             input_data: Input data to send to the process
             working_dir: Working directory for the command
+            phase: Workflow phase ('compile', 'deploy' or 'call') used to pick the timeout
             
         Returns:
             Dict with stdout, stderr, returncode, success, and timeout info
         """
+        if not self._cli_present:
+            self._log("❌ qubic-cli not found at: %s", self.qubic_cli_path)
+            return {
+                'stdout': "",
+                'stderr': f"qubic-cli executable not found: {self.qubic_cli_path}",
+                'returncode': -2,
+                'success': False,
+                'timeout': False,
+                'elapsed_time': 0
+            }
+        
         full_command = [self.qubic_cli_path] + args
         
         try:
-            # Use shorter timeout for compilation to avoid hanging
-            actual_timeout = min(self.timeout, 30) if 'contractcompile' in ' '.join(args) else self.timeout
+            actual_timeout = min(self.timeout, self.PHASE_TIMEOUT_CAPS.get(phase, self.timeout))
             
-            self.logs.append(f"Running: {' '.join(full_command)}")
-            self.logs.append(f"Timeout: {actual_timeout}s (optimized for SmartGuard UI)")
+            self._log("Running: %s", ' '.join(full_command))
+            self._log("Timeout: %ss (optimized for SmartGuard UI)", actual_timeout)
             
             start_time = time.time()
             
@@ -99,11 +436,31 @@ class RealQubicDevKit:
                 stderr=subprocess.PIPE,
                 text=True,
                 cwd=working_dir,
-                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if os.name == 'nt' else 0
+                env=_QUBIC_ENV,
+                # Python's own fds are non-inheritable (PEP 446), so skip the close-all loop
+                close_fds=os.name == 'nt',
+                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if os.name == 'nt' else 0,
+                # Own process group, so a timeout can take down compiler children too
+                start_new_session=os.name != 'nt'
             )
             
+            # Drain both pipes concurrently into bounded buffers (no deadlock, capped memory)
+            stdout_lines = deque(maxlen=self.MAX_OUTPUT_LINES)
+            stderr_lines = deque(maxlen=self.MAX_OUTPUT_LINES)
+            wait_drained = _start_draining(process, stdout_lines, stderr_lines)
+            
             try:
-                stdout, stderr = process.communicate(input=input_data, timeout=actual_timeout)
+                if input_data:
+                    process.stdin.write(input_data)
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+            
+            try:
+                process.wait(timeout=actual_timeout)
+                wait_drained()
+                stdout = ''.join(stdout_lines)
+                stderr = ''.join(stderr_lines)
                 elapsed_time = time.time() - start_time
                 
                 result = {
@@ -115,20 +472,21 @@ class RealQubicDevKit:
                     'elapsed_time': elapsed_time
                 }
                 
-                self.logs.append(f"Completed in {elapsed_time:.2f}s")
+                self._log("Completed in %.2fs", elapsed_time)
                 if result['success']:
                     self.logs.append("✅ Command succeeded")
                 else:
-                    self.logs.append(f"❌ Command failed (exit code: {process.returncode})")
+                    self._log("❌ Command failed (exit code: %s)", process.returncode)
                 
                 return result
                 
             except subprocess.TimeoutExpired:
-                process.kill()
+                _kill_process_tree(process)
                 process.wait()
+                wait_drained(1)
                 elapsed_time = time.time() - start_time
                 
-                self.logs.append(f"⏰ Command timed out after {elapsed_time:.2f}s")
+                self._log("⏰ Command timed out after %.2fs", elapsed_time)
                 
                 return {
                     'stdout': f"Command timed out after {actual_timeout} seconds",
@@ -140,7 +498,7 @@ class RealQubicDevKit:
                 }
                 
         except FileNotFoundError:
-            self.logs.append(f"❌ qubic-cli not found at: {self.qubic_cli_path}")
+            self._log("❌ qubic-cli not found at: %s", self.qubic_cli_path)
             return {
                 'stdout': "",
                 'stderr': f"qubic-cli executable not found: {self.qubic_cli_path}",
@@ -150,7 +508,7 @@ class RealQubicDevKit:
                 'elapsed_time': 0
             }
         except Exception as e:
-            self.logs.append(f"❌ Unexpected error: {str(e)}")
+            self._log("❌ Unexpected error: %s", e)
             return {
                 'stdout': "",
                 'stderr': f"Unexpected error: {str(e)}",
@@ -160,6 +518,179 @@ class RealQubicDevKit:
                 'elapsed_time': 0
             }
     
+    def _toolchain_tag(self) -> bytes:
+        """Identify the qubic-cli build so cached results are dropped when it changes."""
+        try:
+            stat = os.stat(self.qubic_cli_path)
+            tag = f"{self.qubic_cli_path}:{stat.st_size}:{stat.st_mtime_ns}"
+        except OSError:
+            tag = self.qubic_cli_path
+        return f"{COMPILE_CACHE_VERSION}|{tag}".encode('utf-8')
+    
+    def _compile_cache_key(self, contract_code: str) -> str:
+        """Content-addressed key for a contract source and the current toolchain."""
+        return hashlib.blake2b(
+            contract_code.encode('utf-8') + self._toolchain_tag(),
+            digest_size=16
+        ).hexdigest()
+    
+    def _load_cached_compile(self, key: str, output_file: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a cached compilation result and restore its bytecode to output_file.
+        
+        Returns:
+            The cached result dict, or None on a miss, stale or unreadable entry
+        """
+        if not self._disk_cache_enabled:
+            return None
+        
+        entry_path = self._cache_dir / f"{key}.json"
+        if not entry_path.is_file():
+            return None
+        
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            
+            if time.time() - cached['cached_at'] > self.DISK_CACHE_TTL:
+                return None
+            
+            if cached['success']:
+                bytecode_path = cached.get('bytecode_path')
+                if not bytecode_path or not os.path.isfile(bytecode_path):
+                    return None
+                shutil.copyfile(bytecode_path, output_file)
+        except (OSError, ValueError, KeyError):
+            return None
+        
+        # The entry's mtime doubles as its last-used time for LRU eviction
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        
+        cached['cached'] = True
+        return cached
+    
+    def _evict_disk_cache(self):
+        """Trim the on-disk compile cache to its entry and size caps, oldest first."""
+        try:
+            with os.scandir(self._cache_dir) as entries:
+                files = {entry.name: entry.stat() for entry in entries if entry.is_file()}
+        except OSError:
+            return
+        
+        total_bytes = sum(stat.st_size for stat in files.values())
+        by_last_used = sorted(
+            (stat.st_mtime, name[:-len('.json')])
+            for name, stat in files.items() if name.endswith('.json')
+        )
+        remaining = len(by_last_used)
+        
+        for _, key in by_last_used:
+            if remaining <= self.DISK_CACHE_MAX_ENTRIES and total_bytes <= self.DISK_CACHE_MAX_BYTES:
+                break
+            for name in (f"{key}.json", f"{key}.bytecode"):
+                if name in files:
+                    try:
+                        os.unlink(self._cache_dir / name)
+                        total_bytes -= files[name].st_size
+                    except OSError:
+                        pass
+            remaining -= 1
+    
+    def _store_cached_compile(self, key: str, result: Dict[str, Any], output_file: str) -> Optional[str]:
+        """
+        Persist a compilation result (and its bytecode) using atomic replaces.
+        
+        Returns:
+            Path of the cached bytecode copy, or None if none was written
+        """
+        if not self._disk_cache_enabled:
+            return None
+        
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            entry = dict(result, bytecode_path=None, cached_at=time.time())
+            
+            if result['success']:
+                bytecode_path = self._cache_dir / f"{key}.bytecode"
+                fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix='.tmp')
+                os.close(fd)
+                shutil.copyfile(output_file, tmp_path)
+                os.replace(tmp_path, bytecode_path)
+                entry['bytecode_path'] = str(bytecode_path)
+            
+            fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._cache_dir / f"{key}.json")
+            return entry['bytecode_path']
+        except OSError as e:
+            self._log("⚠️ Could not write compile cache: %s", e)
+            return None
+    
+    def _lookup_compile_cache(self, mem_key: tuple, output_file: str) -> Optional[Dict[str, Any]]:
+        """Look up a (key, output_file) pair in the in-memory LRU, then on disk."""
+        with self._mem_cache_lock:
+            entry = self._mem_cache.get(mem_key)
+            if entry is not None:
+                self._mem_cache.move_to_end(mem_key)
+        if entry is not None:
+            cached, bytecode_path, digest = entry
+            # output_file may have been overwritten by another compile since
+            if not cached['success'] or self._restore_bytecode(output_file, bytecode_path, digest):
+                self._log("♻️ Reusing in-memory compilation result (%s)", mem_key[0])
+                return cached
+            with self._mem_cache_lock:
+                self._mem_cache.pop(mem_key, None)
+        
+        cached = self._load_cached_compile(mem_key[0], output_file)
+        if cached is not None:
+            self._remember_compile(mem_key, cached, cached.get('bytecode_path'))
+            self._log("♻️ Reusing cached compilation result (%s)", mem_key[0])
+        return cached
+    
+    @staticmethod
+    def _restore_bytecode(output_file: str, bytecode_path: Optional[str], digest: Optional[str]) -> bool:
+        """
+        Make output_file hold the bytecode of a remembered successful compile.
+        
+        Returns:
+            True if output_file now holds that bytecode, False if it cannot be restored
+        """
+        if digest is not None and _file_digest(output_file) == digest:
+            return True
+        if bytecode_path:
+            try:
+                shutil.copyfile(bytecode_path, output_file)
+                return True
+            except OSError:
+                pass
+        return False
+    
+    def _remember_compile(self, mem_key: tuple, result: Dict[str, Any],
+                          bytecode_path: Optional[str] = None):
+        """
+        Insert a result into the in-memory LRU, evicting the oldest entry.
+        
+        For a successful compile, the hash of the bytecode now in output_file
+        is kept, plus bytecode_path (a cached copy) to restore it from.
+        """
+        digest = _file_digest(mem_key[1]) if result['success'] else None
+        with self._mem_cache_lock:
+            self._mem_cache[mem_key] = (result, bytecode_path, digest)
+            self._mem_cache.move_to_end(mem_key)
+            if len(self._mem_cache) > self.MEM_CACHE_SIZE:
+                self._mem_cache.popitem(last=False)
+    
+    def clear_cache(self):
+        """Drop all cached compilation results, in memory and on disk."""
+        with self._mem_cache_lock:
+            self._mem_cache.clear()
+        shutil.rmtree(self._cache_dir, ignore_errors=True)
+        self.logs.append("🧹 Compilation cache cleared")
+    
     def compile_contract(self, contract_code: str, output_file: str = "contract.bytecode") -> Dict[str, Any]:
         """
         Compile a Qubic smart contract using real qubic-cli.
@@ -173,29 +704,49 @@ class RealQubicDevKit:
         """
         self.logs.append("🔨 Starting REAL contract compilation...")
         
-        # Create temporary source file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.cpp', delete=False) as tmp_file:
-            tmp_file.write(contract_code)
-            source_file = tmp_file.name
+        preflight_error = preflight_contract(contract_code)
+        if preflight_error:
+            self._log("❌ Pre-flight check failed: %s", preflight_error)
+            return {
+                'stdout': "",
+                'stderr': preflight_error,
+                'returncode': -4,
+                'success': False,
+                'timeout': False,
+                'elapsed_time': 0
+            }
+        if not (_QPI_RE.search(contract_code) and _BASE_RE.search(contract_code)):
+            self.logs.append("⚠️ No QPI namespace / ContractBase inheritance found")
+        _, non_ascii_count, brace_balance = scan_contract_source(contract_code)
+        if brace_balance:
+            self._log("⚠️ Unbalanced braces in source ('{' minus '}' = %s)", brace_balance)
+        if non_ascii_count:
+            self._log("⚠️ %s non-ASCII characters in source", non_ascii_count)
+        
+        cache_key = self._compile_cache_key(contract_code)
+        mem_key = (cache_key, output_file)
+        cached = self._lookup_compile_cache(mem_key, output_file)
+        if cached is not None:
+            return cached
         
         try:
-            # Compile the contract with correct qubic-cli syntax
-            result = self._run_command([
-                '-contractcompile',
-                source_file,
-                output_file
-            ])
-            
-            # Clean up
-            os.unlink(source_file)
+            # The source is released as soon as the compiler exits
+            with contextlib.ExitStack() as stack:
+                source_file = _materialize_source(contract_code, stack)
+                
+                # Compile the contract with correct qubic-cli syntax
+                result = self._run_command([
+                    '-contractcompile',
+                    source_file,
+                    output_file
+                ], phase='compile')
             
             if result['success']:
-                self.logs.append(f"✅ Contract compiled successfully: {output_file}")
+                self._log("✅ Contract compiled successfully: %s", output_file)
                 # Check if bytecode file was actually created
                 if os.path.isfile(output_file):
-                    with open(output_file, 'rb') as f:
-                        bytecode_size = len(f.read())
-                    self.logs.append(f"📦 Bytecode size: {bytecode_size} bytes")
+                    bytecode_size = os.path.getsize(output_file)
+                    self._log("📦 Bytecode size: %s bytes", bytecode_size)
                 else:
                     self.logs.append("⚠️ Bytecode file not found after compilation")
                     result['success'] = False
@@ -204,13 +755,20 @@ class RealQubicDevKit:
                 self.logs.append("❌ Contract compilation failed")
                 if result['timeout']:
                     self.logs.append("💡 Compilation timed out - this proves real execution!")
+            
+            # Only cache deterministic outcomes: a built contract or a real compiler error.
+            # Keys are the exact source: qubic-cli embeds the raw source in the bytecode
+            if result['success']:
+                bytecode_path = self._store_cached_compile(cache_key, result, output_file)
+                self._remember_compile(mem_key, result, bytecode_path)
+            elif result['returncode'] > 0:
+                self._store_cached_compile(cache_key, result, output_file)
+                self._remember_compile(mem_key, result)
                 
             return result
             
         except Exception as e:
-            if os.path.isfile(source_file):
-                os.unlink(source_file)
-            self.logs.append(f"❌ Compilation error: {str(e)}")
+            self._log("❌ Compilation error: %s", e)
             return {
                 'stdout': "",
                 'stderr': f"Compilation error: {str(e)}",
@@ -231,10 +789,10 @@ class RealQubicDevKit:
         Returns:
             Dict with deployment results
         """
-        self.logs.append(f"🚀 Deploying contract to Qubic testnet: {contract_name}")
+        self._log("🚀 Deploying contract to Qubic testnet: %s", contract_name)
         
         if not os.path.isfile(bytecode_file):
-            self.logs.append(f"❌ Bytecode file not found: {bytecode_file}")
+            self._log("❌ Bytecode file not found: %s", bytecode_file)
             return {
                 'stdout': "",
                 'stderr': f"Bytecode file not found: {bytecode_file}",
@@ -250,15 +808,15 @@ class RealQubicDevKit:
             '--bytecode', bytecode_file,
             '--privatekey', 'smartguard_demo_key',  # Demo key for testing
             '--network', 'testnet'
-        ])
+        ], phase='deploy')
         
         if result['success']:
             self.logs.append("✅ Contract deployed successfully to Qubic testnet!")
-            # Try to extract contract ID from output
-            lines = result['stdout'].split('\n')
-            for line in lines:
-                if 'Contract ID:' in line or 'ID:' in line:
-                    self.logs.append(f"🆔 {line.strip()}")
+            # Extract the contract ID with a single scan over the output
+            match = _CONTRACT_ID_RE.search(result['stdout'])
+            if match:
+                result['contract_id'] = match.group(1)
+                self._log("🆔 Contract ID: %s", match.group(1))
         else:
             self.logs.append("⚠️ Contract deployment failed or timed out")
             if result['timeout']:
@@ -278,7 +836,7 @@ class RealQubicDevKit:
         Returns:
             Dict with function call results
         """
-        self.logs.append(f"📞 Calling function on live contract: {function_name}")
+        self._log("📞 Calling function on live contract: %s", function_name)
         
         cmd_args = [
             '-realcontractcall',
@@ -292,7 +850,7 @@ class RealQubicDevKit:
             args_str = ','.join(str(arg) for arg in args)
             cmd_args.extend(['--args', args_str])
         
-        result = self._run_command(cmd_args)
+        result = self._run_command(cmd_args, phase='call')
         
         if result['success']:
             self.logs.append("✅ Function call successful on live contract!")
@@ -303,15 +861,50 @@ class RealQubicDevKit:
         
         return result
     
+    def _log(self, template: str, *args: Any):
+        """
+        Record a log line whose formatting is deferred to get_logs().
+        
+        Args:
+            template: %-style message template
+            args: Values for the template placeholders
+        """
+        self.logs.append((template, args))
+    
     def get_logs(self) -> str:
         """Get formatted execution logs."""
-        return '\n'.join(self.logs)
+        return '\n'.join(
+            entry if isinstance(entry, str) else entry[0] % entry[1]
+            for entry in self.logs
+        )
     
     def clear_logs(self):
         """Clear execution logs."""
         self.logs.clear()
 
 
+# Serializes workflows on the shared dev kit (shared logs and contract.bytecode)
+_WORKFLOW_LOCK = threading.RLock()
+
+
+@lru_cache(maxsize=None)
+def get_devkit(timeout: int = 30) -> RealQubicDevKit:
+    """
+    Get the process-wide RealQubicDevKit for a given timeout.
+    
+    The instance is created once and reused by every call (and every Streamlit
+    session in the process), so qubic-cli discovery and the in-memory compile
+    cache are shared instead of rebuilt per invocation.
+    
+    Args:
+        timeout: Timeout in seconds for operations
+        
+    Returns:
+        Shared RealQubicDevKit instance
+    """
+    return RealQubicDevKit(timeout=timeout)
+
+
 def compile_and_run_qubic_real(state: Any) -> Any:
     """
     DROP-IN REPLACEMENT for SmartGuard's compile_and_run_qubic function.
@@ -326,11 +919,103 @@ def compile_and_run_qubic_real(state: Any) -> Any:
         Modified state object with REAL execution results
     """
     
-    # Initialize the real dev kit with SmartGuard-optimized settings
-    devkit = RealQubicDevKit(timeout=30)  # UI-friendly timeout
+    # Reuse the shared dev kit (default 30s UI-friendly timeout)
+    devkit = get_devkit()
+    
+    with _WORKFLOW_LOCK:
+        devkit.clear_logs()
+        return _run_real_workflow(devkit, state)
+
+
+async def compile_and_run_qubic_real_async(states: list, concurrency: int = 2) -> list:
+    """
+    Run the real execution workflow for several SmartGuard states concurrently.
+    
+    Compile -> deploy -> call stays sequential per contract; different contracts
+    overlap. Each contract gets its own dev kit and bytecode file so their logs
+    and artifacts never mix.
+    
+    Args:
+        states: SmartGuard state objects (same shape as for compile_and_run_qubic_real)
+        concurrency: Maximum number of workflows in flight (default: 2)
+        
+    Returns:
+        List with the updated state, or the raised exception, for each input state
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def run_one(index: int, state: Any) -> Any:
+        async with semaphore:
+            devkit = RealQubicDevKit(timeout=30)
+            return await asyncio.to_thread(
+                _run_real_workflow, devkit, state, f"contract_{index}.bytecode"
+            )
+    
+    return await asyncio.gather(
+        *(run_one(index, state) for index, state in enumerate(states)),
+        return_exceptions=True
+    )
+
+
+# State attributes that may carry the contract source, in priority order.
+# 'contract_code' is what older SmartGuard versions (and the test scripts) use.
+_SOURCE_ATTRS = ('commented', 'input_code', 'contract_code')
+
+
+def _resolve_contract_code(state: Any) -> str:
+    """
+    Return the first non-empty contract source found on a SmartGuard state.
+    
+    Resolution is per instance rather than per class: mock states set these
+    attributes in __init__, where a class-level lookup cannot see them.
+    """
+    for attr in _SOURCE_ATTRS:
+        value = getattr(state, attr, None)
+        if value:
+            return value
+    return ''
+
+
+# Static log sections, built once at import time
+_TIMEOUT_PROOF_LOGS = (
+    "",
+    "🎯 REAL EXECUTION PROOF:",
+    "   • qubic-cli is actually running!",
+    "   • C++ compilation was attempted!",
+    "   • This proves REAL execution vs simulation!",
+    "   • Timeout prevents SmartGuard UI from hanging",
+    "",
+    "💡 SmartGuard Integration Success:",
+    "   ✅ Real execution workflow active",
+    "   ✅ Actual qubic-cli integration working",
+    "   ✅ Users get professional development feedback",
+    "   ✅ SmartGuard now supports real blockchain interaction"
+)
+
+_SUMMARY_TMPL = "\n📊 REAL Execution Summary:\n✅ Real Compilation: {compile}{deploy_line}{call_line}"
+_DEPLOY_SUMMARY_LINES = {
+    True: "\n✅ Live Deployment: SUCCESS",
+    False: "\n✅ Live Deployment: ATTEMPTED (proves network calls)"
+}
+_CALL_SUMMARY_LINES = {
+    True: "\n✅ Function Call: SUCCESS",
+    False: "\n✅ Function Call: PARTIAL"
+}
+
+_STATUS_FOOTER_LOGS = (
+    "",
+    "🎯 SmartGuard Integration Status: SUCCESSFUL!",
+    "📋 This is REAL Qubic testnet interaction, not simulation.",
+    "🚀 SmartGuard now has professional blockchain development capabilities!"
+)
+
+
+def _run_real_workflow(devkit: RealQubicDevKit, state: Any,
+                       bytecode_file: str = "contract.bytecode") -> Any:
+    """Run compile -> deploy -> call on the given dev kit and update state."""
     
     # Get contract code from SmartGuard state
-    contract_code = getattr(state, 'commented', None) or getattr(state, 'input_code', '')
+    contract_code = _resolve_contract_code(state)
     
     if not contract_code or not contract_code.strip():
         # No contract code provided
@@ -348,97 +1033,78 @@ Please provide valid Qubic contract source code.
         state.compilation_success = False
         return state
     
-    devkit.logs.append("=== QUBIC REAL EXECUTION FOR SMARTGUARD ===")
-    devkit.logs.append("")
-    devkit.logs.append("🚀 Starting REAL Qubic execution workflow...")
-    devkit.logs.append(f"📝 Contract code length: {len(contract_code)} characters")
-    devkit.logs.append("⚡ Using SmartGuard-optimized timeouts")
-    devkit.logs.append("🎯 Integration: SmartGuard ↔ Real Qubic Network")
-    devkit.logs.append("")
-    
-    # Step 1: Real Contract Compilation
-    devkit.logs.append("📝 Step 1: REAL Contract Compilation")
-    devkit.logs.append("🔧 Using actual qubic-cli for C++ compilation...")
-    compile_result = devkit.compile_contract(contract_code)
+    devkit.logs.extend((
+        "=== QUBIC REAL EXECUTION FOR SMARTGUARD ===",
+        "",
+        "🚀 Starting REAL Qubic execution workflow...",
+        ("📝 Contract code length: %s characters", (len(contract_code),)),
+        "⚡ Using SmartGuard-optimized timeouts",
+        "🎯 Integration: SmartGuard ↔ Real Qubic Network",
+        "",
+        # Step 1: Real Contract Compilation
+        "📝 Step 1: REAL Contract Compilation",
+        "🔧 Using actual qubic-cli for C++ compilation..."
+    ))
+    compile_result = devkit.compile_contract(contract_code, bytecode_file)
     
     compilation_success = compile_result['success']
+    deploy_success = call_success = False
     
     if compilation_success:
-        devkit.logs.append("✅ REAL compilation successful!")
-        devkit.logs.append("")
-        devkit.logs.append("📝 Step 2: Live Qubic Testnet Deployment")
-        devkit.logs.append("🌐 Attempting deployment to live Qubic network...")
+        devkit.logs.extend((
+            "✅ REAL compilation successful!",
+            "",
+            "📝 Step 2: Live Qubic Testnet Deployment",
+            "🌐 Attempting deployment to live Qubic network..."
+        ))
         
         # Step 2: Real Network Deployment
-        deploy_result = devkit.deploy_contract('contract.bytecode')
+        deploy_result = devkit.deploy_contract(bytecode_file)
+        deploy_success = deploy_result['success']
         
         if deploy_result['success']:
-            devkit.logs.append("✅ LIVE deployment successful!")
-            devkit.logs.append("")
-            devkit.logs.append("📝 Step 3: Real Function Call Test")
+            devkit.logs.extend(("✅ LIVE deployment successful!", "", "📝 Step 3: Real Function Call Test"))
             
             # Extract contract ID from deployment output if possible
-            contract_id = "SMARTGUARD_TEST_CONTRACT"  # Fallback ID
-            
-            lines = deploy_result['stdout'].split('\n')
-            for line in lines:
-                if 'ID:' in line and len(line.split(':')) > 1:
-                    potential_id = line.split(':')[1].strip()
-                    if potential_id and len(potential_id) > 5:
-                        contract_id = potential_id
-                        break
+            contract_id = deploy_result.get('contract_id', "SMARTGUARD_TEST_CONTRACT")  # Fallback ID
             
             # Test function call on live contract
-            devkit.logs.append(f"📞 Testing function call on live contract {contract_id}...")
+            devkit._log("📞 Testing function call on live contract %s...", contract_id)
             call_result = devkit.call_function(contract_id, "GetStats")
+            call_success = call_result['success']
             
             if call_result['success']:
-                devkit.logs.append("✅ Real function call successful!")
-                devkit.logs.append("🎉 COMPLETE REAL EXECUTION WORKFLOW VALIDATED!")
+                devkit.logs.extend(("✅ Real function call successful!", "🎉 COMPLETE REAL EXECUTION WORKFLOW VALIDATED!"))
             else:
-                devkit.logs.append("⚠️ Function call failed (normal - contract may not support GetStats)")
-                devkit.logs.append("✅ REAL compilation and deployment successful!")
+                devkit.logs.extend((
+                    "⚠️ Function call failed (normal - contract may not support GetStats)",
+                    "✅ REAL compilation and deployment successful!"
+                ))
         else:
-            devkit.logs.append("⚠️ Deployment failed or timed out")
-            devkit.logs.append("💡 This is normal - requires network connectivity and transaction fees")
-            devkit.logs.append("✅ REAL compilation was successful!")
+            devkit.logs.extend((
+                "⚠️ Deployment failed or timed out",
+                "💡 This is normal - requires network connectivity and transaction fees",
+                "✅ REAL compilation was successful!"
+            ))
     else:
         devkit.logs.append("⚠️ Compilation failed or timed out")
         
         if compile_result['timeout']:
-            devkit.logs.append("")
-            devkit.logs.append("🎯 REAL EXECUTION PROOF:")
-            devkit.logs.append("   • qubic-cli is actually running!")
-            devkit.logs.append("   • C++ compilation was attempted!")
-            devkit.logs.append("   • This proves REAL execution vs simulation!")
-            devkit.logs.append("   • Timeout prevents SmartGuard UI from hanging")
-            devkit.logs.append("")
-            devkit.logs.append("💡 SmartGuard Integration Success:")
-            devkit.logs.append("   ✅ Real execution workflow active")
-            devkit.logs.append("   ✅ Actual qubic-cli integration working")
-            devkit.logs.append("   ✅ Users get professional development feedback")
-            devkit.logs.append("   ✅ SmartGuard now supports real blockchain interaction")
+            devkit.logs.extend(_TIMEOUT_PROOF_LOGS)
         else:
-            devkit.logs.append("🔍 Compilation Error Details:")
-            devkit.logs.append(compile_result.get('stderr', 'No error details available'))
+            devkit.logs.extend((
+                "🔍 Compilation Error Details:",
+                compile_result.get('stderr', 'No error details available')
+            ))
     
-    # Add execution summary
-    devkit.logs.append("")
-    devkit.logs.append("📊 REAL Execution Summary:")
-    devkit.logs.append(f"✅ Real Compilation: {'SUCCESS' if compilation_success else 'ATTEMPTED (proves real execution)'}")
+    # Add execution summary (deployment/call lines only for the steps that ran)
+    devkit.logs.append(_SUMMARY_TMPL.format_map({
+        'compile': 'SUCCESS' if compilation_success else 'ATTEMPTED (proves real execution)',
+        'deploy_line': _DEPLOY_SUMMARY_LINES[deploy_success] if compilation_success else '',
+        'call_line': _CALL_SUMMARY_LINES[call_success] if deploy_success else ''
+    }))
     
-    if compilation_success:
-        deploy_success = 'deploy_result' in locals() and deploy_result['success']
-        devkit.logs.append(f"✅ Live Deployment: {'SUCCESS' if deploy_success else 'ATTEMPTED (proves network calls)'}")
-        
-        if deploy_success:
-            call_success = 'call_result' in locals() and call_result['success']
-            devkit.logs.append(f"✅ Function Call: {'SUCCESS' if call_success else 'PARTIAL'}")
-    
-    devkit.logs.append("")
-    devkit.logs.append("🎯 SmartGuard Integration Status: SUCCESSFUL!")
-    devkit.logs.append("📋 This is REAL Qubic testnet interaction, not simulation.")
-    devkit.logs.append("🚀 SmartGuard now has professional blockchain development capabilities!")
+    devkit.logs.extend(_STATUS_FOOTER_LOGS)
     
     # Update SmartGuard state with results
     # Mark as success even with timeouts because timeout proves real execution is working
@@ -456,12 +1122,19 @@ def real_execution_available() -> bool:
         True if qubic-cli is available, False otherwise
     """
     try:
-        devkit = RealQubicDevKit()
+        devkit = get_devkit()
         return os.path.isfile(devkit.qubic_cli_path) or devkit.qubic_cli_path == "qubic-cli"
     except:
         return False
 
 
+# Contract used by test_integration(); a constant so repeat runs hit the compile cache
+_TEST_CONTRACT = '''using namespace QPI;
+struct SmartGuardTest : public ContractBase {
+    PUBLIC_FUNCTION(GetVersion) return 1; _
+};'''
+
+
 def test_integration():
     """
     Test the SmartGuard integration with real execution.
@@ -472,10 +1145,7 @@ def test_integration():
     # Mock SmartGuard state
     class MockSmartGuardState:
         def __init__(self):
-            self.commented = '''using namespace QPI;
-struct SmartGuardTest : public ContractBase {
-    PUBLIC_FUNCTION(GetVersion) return 1; _
-};'''
+            self.commented = _TEST_CONTRACT
             self.qubic_logs = ""
             self.compilation_success = False
     
@@ -37,6 +37,8 @@ void print_help()
     printf("\t\tOffset number of scheduled tick that will perform a transaction (default: 20)\n");
     printf("\t-force\n");
     printf("\t\tDo action although an error has been detected. Currently only implemented for proposals.\n");
+    printf("\t-json\n");
+    printf("\t\tReal execution commands end their output with one JSON line instead of \"Label: value\" lines, e.g. {\"status\":\"success\",\"balance\":1000}.\n");
 
     printf("Command:\n");
     printf("[WALLET COMMANDS]\n");
@@ -95,12 +97,18 @@ void print_help()
     printf("\t\tREAL creation of voting proposal with actual blockchain transaction.\n");
     printf("\t-realvotingcast --contract <ADDRESS> --proposal <ID> --userid <USER> --choice <1-3> --privatekey <KEY> --network <NETWORK> [--comment <TEXT>]\n");
     printf("\t\tREAL voting transaction (1=YES, 2=NO, 3=ABSTAIN) with actual vote recording on blockchain.\n");
+    printf("\t-realvotingcastbatch --contract <ADDRESS> --votesfile <FILE> --privatekey <KEY> --network <NETWORK>\n");
+    printf("\t\tREAL voting transactions for several voters in one run. <FILE> is JSON: {\"proposal\": \"<ID>\", \"votes\": [{\"user\": \"<USER>\", \"choice\": <1-3>, \"comment\": \"<TEXT>\"}, ...]}.\n");
+    printf("\t\tPrints one \"Vote <N>: success|failed\" line per vote, in file order (with -json: {\"status\":\"success\",\"votes\":[true,false,...]}).\n");
     printf("\t-realvotingresults --contract <ADDRESS> --proposal <ID> --network <NETWORK>\n");
     printf("\t\tREAL retrieval of voting results from deployed contract on Qubic network.\n");
     printf("\t-realbalance --address <ADDRESS> --network <NETWORK>\n");
     printf("\t\tREAL balance query from Qubic network nodes.\n");
     printf("\t-realtransfer --to <ADDRESS> --amount <AMOUNT> --privatekey <KEY> --network <NETWORK>\n");
     printf("\t\tREAL Qubic transfer transaction with actual network execution.\n");
+    printf("\t-realserver\n");
+    printf("\t\tServe the real execution commands above and -contractcompile from stdin, one JSON request per line: {\"id\": <N>, \"argv\": [\"-realbalance\", \"--address\", ...]}.\n");
+    printf("\t\tA leading \"-json\" in argv selects JSON output. Each command prints its usual output followed by {\"id\":<N>,\"status\":\"success\"|\"failed\"}; connections are kept across requests.\n");
 
     printf("\n[BLOCKCHAIN/PROTOCOL COMMANDS]\n");
     printf("\t-gettickdata <TICK_NUMBER> <OUTPUT_FILE_NAME>\n");
@@ -492,6 +500,12 @@ void parseArgument(int argc, char** argv)
             i+=2;
             continue;
         }
+        if (strcmp(argv[i], "-json") == 0)
+        {
+            g_real_json_output = true;
+            i++;
+            continue;
+        }
         if (strcmp(argv[i], "-waituntilfinish") == 0)
         {
             CHECK_NUMBER_OF_PARAMETERS(1)
@@ -1552,6 +1566,42 @@ void parseArgument(int argc, char** argv)
             break;
         }
         
+        if (strcmp(argv[i], "-realvotingcastbatch") == 0) {
+            g_cmd = REAL_VOTING_CAST_BATCH;
+            
+            if (i + 1 < argc && strcmp(argv[i + 1], "--contract") == 0) {
+                g_real_contract_address = argv[i + 2];
+            } else {
+                LOG("Error: --contract parameter required\n");
+                exit(1);
+            }
+            
+            if (i + 3 < argc && strcmp(argv[i + 3], "--votesfile") == 0) {
+                g_real_votes_file = argv[i + 4];
+            } else {
+                LOG("Error: --votesfile parameter required\n");
+                exit(1);
+            }
+            
+            if (i + 5 < argc && strcmp(argv[i + 5], "--privatekey") == 0) {
+                g_real_private_key = argv[i + 6];
+            } else {
+                LOG("Error: --privatekey parameter required\n");
+                exit(1);
+            }
+            
+            if (i + 7 < argc && strcmp(argv[i + 7], "--network") == 0) {
+                g_real_network = argv[i + 8];
+            } else {
+                LOG("Error: --network parameter required\n");
+                exit(1);
+            }
+            
+            i += 9;
+            CHECK_OVER_PARAMETERS
+            break;
+        }
+        
         if (strcmp(argv[i], "-realvotingresults") == 0) {
             g_cmd = REAL_VOTING_RESULTS;
             
@@ -1603,6 +1653,13 @@ void parseArgument(int argc, char** argv)
             break;
         }
         
+        if (strcmp(argv[i], "-realserver") == 0) {
+            g_cmd = REAL_SERVER;
+            i += 1;
+            CHECK_OVER_PARAMETERS
+            break;
+        }
+        
         if (strcmp(argv[i], "-realtransfer") == 0) {
             g_cmd = REAL_TRANSFER;
             
@@ -155,6 +155,8 @@ char* g_real_proposal_id = nullptr;
 char* g_real_user_id = nullptr;
 int g_real_vote_choice = 0;
 char* g_real_vote_comment = nullptr;
+char* g_real_votes_file = nullptr;
+bool g_real_json_output = false;
 char* g_real_target_address = nullptr;
 unsigned long long g_real_transfer_amount = 0;
 char* g_real_check_address = nullptr;
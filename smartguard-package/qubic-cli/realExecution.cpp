@@ -1,9 +1,15 @@
 #include "realExecution.h"
 #include "connection.h"
+#include "contractUtils.h"
 #include "keyUtils.h"
 #include "logger.h"
 #include <thread>
 #include <chrono>
+#include <atomic>
+#include <future>
+#include <iostream>
+#include <map>
+#include <memory>
 
 // Real Qubic Dev Kit execution implementation
 bool executeRealQubicTransaction(const ExecutionParams& params) {
@@ -412,8 +418,9 @@ unsigned long long getCurrentTimestamp() {
 TransactionStatus getTransactionStatus(const std::string& txId) {
     // Simulate transaction status checking
     // In real implementation, this would query the network
-    static int checkCount = 0;
-    checkCount++;
+    // Atomic: batched calls check status from several threads at once
+    static std::atomic<int> counter{0};
+    int checkCount = ++counter;
     
     if (checkCount < 3) {
         return TX_STATUS_PENDING;
@@ -618,6 +625,437 @@ bool RealQubicExecutor::executeTransaction(const ExecutionParams& params, std::s
     return executeRealQubicTransaction(params);
 }
 
+// Parse a JSON string literal starting at the opening quote; advances pos past the closing quote
+static bool parseJsonString(const std::string& json, size_t& pos, std::string& out) {
+    if (pos >= json.size() || json[pos] != '"') return false;
+    out.clear();
+    for (++pos; pos < json.size(); ++pos) {
+        char c = json[pos];
+        if (c == '"') {
+            ++pos;
+            return true;
+        }
+        if (c == '\\') {
+            if (++pos >= json.size()) return false;
+            switch (json[pos]) {
+                case 'n': out += '\n'; break;
+                case 't': out += '\t'; break;
+                case 'r': out += '\r'; break;
+                case 'b': out += '\b'; break;
+                case 'f': out += '\f'; break;
+                case 'u':
+                    // Contract names/arguments are ASCII; keep \uXXXX escapes verbatim
+                    out += "\\u";
+                    break;
+                default: out += json[pos]; break;
+            }
+        } else {
+            out += c;
+        }
+    }
+    return false;
+}
+
+// Parse [{"function": "...", "arguments": "..."}, ...] into call records
+static bool parseBatchCalls(const char* callsJson, std::vector<ContractCallData>& calls) {
+    std::string json(callsJson);
+    size_t pos = 0;
+    ContractCallData current;
+    std::string key, value;
+    bool inObject = false;
+    
+    while (pos < json.size()) {
+        char c = json[pos];
+        if (c == '{') {
+            memset(&current, 0, sizeof(ContractCallData));
+            inObject = true;
+            ++pos;
+        } else if (c == '}') {
+            if (!inObject || current.functionName[0] == '\0') return false;
+            calls.push_back(current);
+            inObject = false;
+            ++pos;
+        } else if (c == '"' && inObject) {
+            if (!parseJsonString(json, pos, key)) return false;
+            while (pos < json.size() && (json[pos] == ' ' || json[pos] == ':')) ++pos;
+            if (!parseJsonString(json, pos, value)) return false;
+            if (key == "function") {
+                strncpy(current.functionName, value.c_str(), sizeof(current.functionName) - 1);
+            } else if (key == "arguments") {
+                strncpy(current.arguments, value.c_str(), sizeof(current.arguments) - 1);
+            }
+        } else {
+            ++pos;
+        }
+    }
+    return !inObject;
+}
+
+static void appendJsonString(std::string& out, const std::string& value) {
+    out += '"';
+    for (char c : value) {
+        switch (c) {
+            case '"': out += "\\\""; break;
+            case '\\': out += "\\\\"; break;
+            case '\n': out += "\\n"; break;
+            case '\r': out += "\\r"; break;
+            case '\t': out += "\\t"; break;
+            default:
+                if (static_cast<unsigned char>(c) < 0x20) {
+                    char escaped[8];
+                    snprintf(escaped, sizeof(escaped), "\\u%04x", c);
+                    out += escaped;
+                } else {
+                    out += c;
+                }
+        }
+    }
+    out += '"';
+}
+
+void printRealResult(bool json, const char* operation, bool success, 
+                     const std::vector<RealOutputField>& fields) {
+    if (!json) {
+        LOG("Real %s %s!\n", operation, success ? "successful" : "failed");
+        if (!success) return;
+        for (const RealOutputField& field : fields) {
+            LOG("%s: %s%s%s\n", field.label, field.value.c_str(), field.unit ? " " : "", field.unit ? field.unit : "");
+        }
+        return;
+    }
+    
+    std::string line = success ? "{\"status\":\"success\"" : "{\"status\":\"failed\"";
+    if (success) {
+        for (const RealOutputField& field : fields) {
+            line += ",\"";
+            line += field.key;
+            line += "\":";
+            if (field.numeric) {
+                line += field.value;
+            } else {
+                appendJsonString(line, field.value);
+            }
+        }
+    }
+    LOG("%s}\n", line.c_str());
+}
+
+struct VoteData {
+    std::string userId;
+    int choice;
+    std::string comment;
+};
+
+// Parse {"proposal": "<ID>", "votes": [{"user": "...", "choice": N, "comment": "..."}, ...]}
+static bool parseVoteBatch(const std::string& json, std::string& proposalId, std::vector<VoteData>& votes) {
+    size_t pos = 0;
+    int depth = 0;
+    VoteData current;
+    std::string key, value;
+    
+    while (pos < json.size()) {
+        char c = json[pos];
+        if (c == '{') {
+            if (++depth == 2) current = VoteData{"", 0, ""};
+            ++pos;
+        } else if (c == '}') {
+            if (depth == 2) {
+                if (current.userId.empty() || current.choice < 1 || current.choice > 3) return false;
+                votes.push_back(current);
+            }
+            --depth;
+            ++pos;
+        } else if (c == '"') {
+            if (!parseJsonString(json, pos, key)) return false;
+            while (pos < json.size() && (json[pos] == ' ' || json[pos] == ':')) ++pos;
+            if (pos < json.size() && json[pos] == '"') {
+                if (!parseJsonString(json, pos, value)) return false;
+            } else if (key == "votes") {
+                continue;
+            } else {
+                size_t end = json.find_first_of(",}", pos);
+                value = json.substr(pos, end - pos);
+                pos = end;
+            }
+            
+            if (depth == 1 && key == "proposal") {
+                proposalId = value;
+            } else if (depth == 2 && key == "user") {
+                current.userId = value;
+            } else if (depth == 2 && key == "choice") {
+                current.choice = atoi(value.c_str());
+            } else if (depth == 2 && key == "comment") {
+                current.comment = value;
+            }
+        } else {
+            ++pos;
+        }
+    }
+    return depth == 0 && !proposalId.empty();
+}
+
+bool runRealVoteBatch(RealQubicExecutor& executor, const char* contractAddress, 
+                      const char* votesFile, const char* privateKey, bool json) {
+    std::string votesJson;
+    std::string proposalId;
+    std::vector<VoteData> votes;
+    if (!readBytecodeFromFile(votesFile, votesJson) || !parseVoteBatch(votesJson, proposalId, votes)) {
+        LOG("Error: Could not read votes from %s\n", votesFile);
+        printRealResult(json, "vote batch casting", false);
+        return false;
+    }
+    
+    // Overlap the votes' network waits in waves, as execute_real_contract_call_batch does
+    std::vector<char> succeeded(votes.size(), 0);
+    for (size_t start = 0; start < votes.size(); start += REAL_QUBIC_MAX_PARALLEL_CALLS) {
+        size_t end = std::min(votes.size(), start + static_cast<size_t>(REAL_QUBIC_MAX_PARALLEL_CALLS));
+        std::vector<std::future<bool>> pending;
+        for (size_t i = start; i < end; ++i) {
+            pending.push_back(std::async(std::launch::async, [&, i]() {
+                std::string result;
+                return executor.castVote(contractAddress, proposalId.c_str(), votes[i].userId.c_str(), 
+                                         votes[i].choice, votes[i].comment.c_str(), privateKey, result);
+            }));
+        }
+        for (size_t i = start; i < end; ++i) {
+            succeeded[i] = pending[i - start].get();
+        }
+    }
+    
+    if (json) {
+        std::string flags;
+        for (size_t i = 0; i < votes.size(); ++i) {
+            flags += i ? "," : "";
+            flags += succeeded[i] ? "true" : "false";
+        }
+        LOG("{\"status\":\"success\",\"votes\":[%s]}\n", flags.c_str());
+        return true;
+    }
+    for (size_t i = 0; i < votes.size(); ++i) {
+        LOG("Vote %zu: %s\n", i + 1, succeeded[i] ? "success" : "failed");
+    }
+    LOG("Real vote batch casting completed!\n");
+    return true;
+}
+
+// Parse {"id": <N>, "argv": ["-realxxx", "--key", "value", ...]} from one request line
+static bool parseServerRequest(const std::string& line, unsigned long long& id, std::vector<std::string>& argv) {
+    size_t pos = line.find("\"id\"");
+    if (pos == std::string::npos) return false;
+    pos = line.find(':', pos);
+    if (pos == std::string::npos) return false;
+    id = strtoull(line.c_str() + pos + 1, nullptr, 10);
+    
+    pos = line.find("\"argv\"");
+    if (pos == std::string::npos) return false;
+    pos = line.find('[', pos);
+    if (pos == std::string::npos) return false;
+    
+    argv.clear();
+    std::string value;
+    for (++pos; pos < line.size(); ) {
+        char c = line[pos];
+        if (c == ']') return !argv.empty();
+        if (c == '"') {
+            if (!parseJsonString(line, pos, value)) return false;
+            argv.push_back(value);
+        } else {
+            ++pos;
+        }
+    }
+    return false;
+}
+
+// Run one real execution command; prints the same output as the one-shot CLI command
+static bool runServerCommand(const std::vector<std::string>& argv, 
+                             std::map<std::string, std::unique_ptr<RealQubicExecutor>>& executors) {
+    // A leading "-json" selects JSON output, as on the command line
+    const bool json = argv[0] == "-json";
+    const size_t first = json ? 1 : 0;
+    if (first >= argv.size()) {
+        LOG("Error: missing server command\n");
+        return false;
+    }
+    
+    std::map<std::string, std::string> options;
+    for (size_t i = first + 1; i + 1 < argv.size(); i += 2) {
+        size_t nameStart = argv[i].find_first_not_of('-');
+        if (nameStart != std::string::npos) options[argv[i].substr(nameStart)] = argv[i + 1];
+    }
+    auto option = [&options](const char* name) -> const char* {
+        auto it = options.find(name);
+        return it == options.end() ? nullptr : it->second.c_str();
+    };
+    auto require = [&option](std::initializer_list<const char*> names) {
+        for (const char* name : names) {
+            if (!option(name)) {
+                LOG("Error: --%s parameter required\n", name);
+                return false;
+            }
+        }
+        return true;
+    };
+    
+    const std::string& command = argv[first];
+    
+    // Local compilation: positional arguments, no network connection
+    if (command == "-contractcompile") {
+        if (argv.size() != first + 3) {
+            LOG("Error: -contractcompile <SOURCE_FILE> <OUTPUT_FILE> required\n");
+            return false;
+        }
+        compileContract(argv[first + 1].c_str(), argv[first + 2].c_str());
+        return true;
+    }
+    
+    if (!require({"network"})) return false;
+    const char* network = option("network");
+    
+    // One connected executor per network, reused across requests
+    auto executorFor = [&executors, network]() -> RealQubicExecutor& {
+        std::unique_ptr<RealQubicExecutor>& executor = executors[network];
+        if (!executor) executor.reset(new RealQubicExecutor(network, "127.0.0.1", 21841));
+        return *executor;
+    };
+    
+    if (command == "-realcontractdeploy") {
+        if (!require({"bytecode", "privatekey"})) return false;
+        std::string contractAddress;
+        bool success = executeRealContractDeployment(option("bytecode"), option("privatekey"), network, contractAddress);
+        printRealResult(json, "contract deployment", success, {{"Contract Address", "contract_address", contractAddress, false, nullptr}});
+        return success;
+    }
+    if (command == "-realcontractcall") {
+        if (!require({"contract", "function", "privatekey"})) return false;
+        std::string result;
+        bool success = executeRealContractCall(option("contract"), option("function"), option("args") ? option("args") : "", 
+                                               option("privatekey"), network, result);
+        printRealResult(json, "contract call", success, {{"Result", "result", result, false, nullptr}});
+        return success;
+    }
+    if (command == "-realvotingcreate") {
+        if (!require({"contract", "title", "description", "duration", "privatekey"})) return false;
+        std::string proposalId;
+        bool success = executorFor().createVotingProposal(option("contract"), option("title"), option("description"), 
+                                                          strtoull(option("duration"), nullptr, 10), option("privatekey"), proposalId);
+        printRealResult(json, "voting proposal creation", success, {{"Proposal ID", "proposal_id", proposalId, false, nullptr}});
+        return success;
+    }
+    if (command == "-realvotingcast") {
+        if (!require({"contract", "proposal", "userid", "choice", "privatekey"})) return false;
+        std::string result;
+        bool success = executorFor().castVote(option("contract"), option("proposal"), option("userid"), atoi(option("choice")), 
+                                              option("comment") ? option("comment") : "", option("privatekey"), result);
+        printRealResult(json, "vote casting", success, {{"Result", "result", result, false, nullptr}});
+        return success;
+    }
+    if (command == "-realvotingcastbatch") {
+        if (!require({"contract", "votesfile", "privatekey"})) return false;
+        return runRealVoteBatch(executorFor(), option("contract"), option("votesfile"), option("privatekey"), json);
+    }
+    if (command == "-realvotingresults") {
+        if (!require({"contract", "proposal"})) return false;
+        std::string results;
+        bool success = executorFor().getVotingResults(option("contract"), option("proposal"), results);
+        printRealResult(json, "voting results retrieval", success, {{"Results", "results", results, false, nullptr}});
+        return success;
+    }
+    if (command == "-realbalance") {
+        if (!require({"address"})) return false;
+        unsigned long long balance = 0;
+        bool success = executorFor().getBalance(option("address"), balance);
+        printRealResult(json, "balance query", success, {
+            {"Address", "address", option("address"), false, nullptr},
+            {"Balance", "balance", std::to_string(balance), true, "QU"}
+        });
+        return success;
+    }
+    
+    LOG("Error: unsupported server command %s\n", command.c_str());
+    return false;
+}
+
+int runRealExecutionServer() {
+    std::map<std::string, std::unique_ptr<RealQubicExecutor>> executors;
+    std::vector<std::string> argv;
+    std::string line;
+    
+    while (std::getline(std::cin, line)) {
+        if (line.empty()) continue;
+        
+        unsigned long long id = 0;
+        bool success = false;
+        if (parseServerRequest(line, id, argv)) {
+            success = runServerCommand(argv, executors);
+        } else {
+            LOG("Error: malformed server request\n");
+        }
+        
+        // Status line terminates this request's output
+        LOG("{\"id\":%llu,\"status\":\"%s\"}\n", id, success ? "success" : "failed");
+    }
+    return 0;
+}
+
+bool RealQubicExecutor::getAllVotingResults(const char* contractAddress, std::string& resultsJson) {
+    LOG("=== Real Voting Status Retrieval ===\n");
+    LOG("Contract: %s\n", contractAddress);
+    
+    // Read-only call, same as getVotingResults
+    char dummyKey[] = "0000000000000000000000000000000000000000000000000000000";
+    
+    std::string result;
+    if (!executeRealContractCall(contractAddress, "getAllProposalResults", "", dummyKey, m_network.c_str(), result)) {
+        return false;
+    }
+    
+    // In real implementation, decode the proposal table from the contract response
+    resultsJson = "{\"is_active\":true,\"proposals\":[],\"total_voters\":0,\"total_votes_cast\":0,\"raw_result\":";
+    appendJsonString(resultsJson, result);
+    resultsJson += '}';
+    return true;
+}
+
+// Output of the calling thread's last execute_real_contract_call_batch that did not fit
+static thread_local std::string g_pendingBatchResults;
+
+// Operations shared by the per-call C functions and their session variants
+static int copyResultString(bool success, const std::string& value, char* buffer, int bufferSize) {
+    if (success && buffer && bufferSize > 0) {
+        strncpy(buffer, value.c_str(), bufferSize - 1);
+        buffer[bufferSize - 1] = '\0';
+        return REAL_QUBIC_SUCCESS;
+    }
+    
+    return REAL_QUBIC_ERROR_TRANSACTION_FAILED;
+}
+
+static int createProposalWith(RealQubicExecutor& executor, const char* contract_address, 
+                              const char* title, const char* description, unsigned long long duration, 
+                              const char* private_key, char* proposal_id_buffer, int buffer_size) {
+    std::string proposalId;
+    bool success = executor.createVotingProposal(contract_address, title, description, 
+                                               duration, private_key, proposalId);
+    return copyResultString(success, proposalId, proposal_id_buffer, buffer_size);
+}
+
+static int castVoteWith(RealQubicExecutor& executor, const char* contract_address, 
+                        const char* proposal_id, const char* user_id, int choice, 
+                        const char* comment, const char* private_key, 
+                        char* result_buffer, int buffer_size) {
+    std::string result;
+    bool success = executor.castVote(contract_address, proposal_id, user_id, 
+                                   choice, comment, private_key, result);
+    return copyResultString(success, result, result_buffer, buffer_size);
+}
+
+static int votingResultsWith(RealQubicExecutor& executor, const char* contract_address, 
+                             const char* proposal_id, char* results_buffer, int buffer_size) {
+    std::string results;
+    bool success = executor.getVotingResults(contract_address, proposal_id, results);
+    return copyResultString(success, results, results_buffer, buffer_size);
+}
+
 // C interface for Python integration
 extern "C" {
     int execute_real_contract_call(const char* contract_address, const char* function_name, 
@@ -655,22 +1093,21 @@ extern "C" {
         return executor.getBalance(address, *balance) ? REAL_QUBIC_SUCCESS : REAL_QUBIC_ERROR_TRANSACTION_FAILED;
     }
     
+    unsigned long long get_real_balance_v2(const char* address, const char* network) {
+        unsigned long long balance = 0;
+        if (get_real_balance(address, network, &balance) != REAL_QUBIC_SUCCESS) {
+            return REAL_QUBIC_BALANCE_ERROR;
+        }
+        return balance;
+    }
+    
     int create_real_voting_proposal(const char* contract_address, const char* title, 
                                    const char* description, unsigned long long duration, 
                                    const char* private_key, const char* network, 
                                    char* proposal_id_buffer, int buffer_size) {
         RealQubicExecutor executor(network, "127.0.0.1", 21841);
-        std::string proposalId;
-        bool success = executor.createVotingProposal(contract_address, title, description, 
-                                                   duration, private_key, proposalId);
-        
-        if (success && proposal_id_buffer && buffer_size > 0) {
-            strncpy(proposal_id_buffer, proposalId.c_str(), buffer_size - 1);
-            proposal_id_buffer[buffer_size - 1] = '\0';
-            return REAL_QUBIC_SUCCESS;
-        }
-        
-        return REAL_QUBIC_ERROR_TRANSACTION_FAILED;
+        return createProposalWith(executor, contract_address, title, description, duration, 
+                                  private_key, proposal_id_buffer, buffer_size);
     }
     
     int cast_real_vote(const char* contract_address, const char* proposal_id, 
@@ -678,31 +1115,133 @@ extern "C" {
                       const char* private_key, const char* network, 
                       char* result_buffer, int buffer_size) {
         RealQubicExecutor executor(network, "127.0.0.1", 21841);
-        std::string result;
-        bool success = executor.castVote(contract_address, proposal_id, user_id, 
-                                       choice, comment, private_key, result);
-        
-        if (success && result_buffer && buffer_size > 0) {
-            strncpy(result_buffer, result.c_str(), buffer_size - 1);
-            result_buffer[buffer_size - 1] = '\0';
-            return REAL_QUBIC_SUCCESS;
-        }
-        
-        return REAL_QUBIC_ERROR_TRANSACTION_FAILED;
+        return castVoteWith(executor, contract_address, proposal_id, user_id, choice, 
+                            comment, private_key, result_buffer, buffer_size);
     }
     
     int get_real_voting_results(const char* contract_address, const char* proposal_id, 
                                const char* network, char* results_buffer, int buffer_size) {
         RealQubicExecutor executor(network, "127.0.0.1", 21841);
+        return votingResultsWith(executor, contract_address, proposal_id, results_buffer, buffer_size);
+    }
+    
+    int get_all_voting_results(const char* contract_address, const char* network, 
+                              char* results_buffer, int buffer_size) {
+        RealQubicExecutor executor(network, "127.0.0.1", 21841);
         std::string results;
-        bool success = executor.getVotingResults(contract_address, proposal_id, results);
+        bool success = executor.getAllVotingResults(contract_address, results);
         
-        if (success && results_buffer && buffer_size > 0) {
-            strncpy(results_buffer, results.c_str(), buffer_size - 1);
-            results_buffer[buffer_size - 1] = '\0';
-            return REAL_QUBIC_SUCCESS;
+        // Truncated JSON cannot be parsed, so report a short buffer instead
+        if (success && buffer_size > 0 && results.size() >= static_cast<size_t>(buffer_size)) {
+            return REAL_QUBIC_ERROR_INVALID_RESPONSE;
+        }
+        return copyResultString(success, results, results_buffer, buffer_size);
+    }
+    
+    void* qubic_open_session(const char* network) {
+        if (!network) return nullptr;
+        return new RealQubicExecutor(network, "127.0.0.1", 21841);
+    }
+    
+    int qubic_close_session(void* session) {
+        if (!session) return REAL_QUBIC_ERROR_INVALID_PARAMS;
+        delete static_cast<RealQubicExecutor*>(session);
+        return REAL_QUBIC_SUCCESS;
+    }
+    
+    unsigned long long qubic_session_get_balance(void* session, const char* address) {
+        unsigned long long balance = 0;
+        if (!session || !static_cast<RealQubicExecutor*>(session)->getBalance(address, balance)) {
+            return REAL_QUBIC_BALANCE_ERROR;
+        }
+        return balance;
+    }
+    
+    int qubic_session_create_voting_proposal(void* session, const char* contract_address, 
+                                            const char* title, const char* description, 
+                                            unsigned long long duration, const char* private_key, 
+                                            char* proposal_id_buffer, int buffer_size) {
+        if (!session) return REAL_QUBIC_ERROR_INVALID_PARAMS;
+        return createProposalWith(*static_cast<RealQubicExecutor*>(session), contract_address, title, 
+                                  description, duration, private_key, proposal_id_buffer, buffer_size);
+    }
+    
+    int qubic_session_cast_vote(void* session, const char* contract_address, const char* proposal_id, 
+                               const char* user_id, int choice, const char* comment, 
+                               const char* private_key, char* result_buffer, int buffer_size) {
+        if (!session) return REAL_QUBIC_ERROR_INVALID_PARAMS;
+        return castVoteWith(*static_cast<RealQubicExecutor*>(session), contract_address, proposal_id, 
+                            user_id, choice, comment, private_key, result_buffer, buffer_size);
+    }
+    
+    int qubic_session_get_voting_results(void* session, const char* contract_address, 
+                                        const char* proposal_id, char* results_buffer, int buffer_size) {
+        if (!session) return REAL_QUBIC_ERROR_INVALID_PARAMS;
+        return votingResultsWith(*static_cast<RealQubicExecutor*>(session), contract_address, 
+                                 proposal_id, results_buffer, buffer_size);
+    }
+    
+    int execute_real_contract_call_batch(const char* contract_address, const char* calls_json, 
+                                        const char* private_key, const char* network, 
+                                        char* results_buffer, int buffer_size, int* required_size) {
+        g_pendingBatchResults.clear();
+        std::vector<ContractCallData> calls;
+        if (!calls_json || !results_buffer || buffer_size <= 0 || !parseBatchCalls(calls_json, calls)) {
+            return REAL_QUBIC_ERROR_INVALID_PARAMS;
         }
         
-        return REAL_QUBIC_ERROR_TRANSACTION_FAILED;
+        // Submit up to REAL_QUBIC_MAX_PARALLEL_CALLS calls at a time so their network
+        // waits overlap, then reap the completions in submission order
+        std::vector<std::string> results(calls.size());
+        std::vector<char> succeeded(calls.size(), 0);
+        for (size_t start = 0; start < calls.size(); start += REAL_QUBIC_MAX_PARALLEL_CALLS) {
+            size_t end = std::min(calls.size(), start + static_cast<size_t>(REAL_QUBIC_MAX_PARALLEL_CALLS));
+            std::vector<std::future<bool>> pending;
+            for (size_t i = start; i < end; ++i) {
+                pending.push_back(std::async(std::launch::async, [&, i]() {
+                    return executeRealContractCall(contract_address, calls[i].functionName, 
+                                                   calls[i].arguments, private_key, network, results[i]);
+                }));
+            }
+            for (size_t i = start; i < end; ++i) {
+                succeeded[i] = pending[i - start].get();
+            }
+        }
+        
+        std::string output = "[";
+        for (size_t i = 0; i < calls.size(); ++i) {
+            if (i > 0) output += ",";
+            if (succeeded[i]) {
+                output += "{\"status\":\"success\",\"result\":";
+                appendJsonString(output, results[i]);
+                output += "}";
+            } else {
+                output += "{\"status\":\"failed\",\"code\":" + std::to_string(REAL_QUBIC_ERROR_TRANSACTION_FAILED) + "}";
+            }
+        }
+        output += "]";
+        
+        // A truncated array would not parse. The calls must not be sent again, so keep
+        // the array for get_real_contract_call_batch_results and report the size it needs
+        if (output.size() >= static_cast<size_t>(buffer_size)) {
+            if (required_size) *required_size = static_cast<int>(output.size() + 1);
+            g_pendingBatchResults = std::move(output);
+            return REAL_QUBIC_ERROR_BUFFER_TOO_SMALL;
+        }
+        memcpy(results_buffer, output.c_str(), output.size() + 1);
+        return REAL_QUBIC_SUCCESS;
+    }
+    
+    int get_real_contract_call_batch_results(char* results_buffer, int buffer_size) {
+        if (!results_buffer || buffer_size <= 0 || g_pendingBatchResults.empty()) {
+            return REAL_QUBIC_ERROR_INVALID_PARAMS;
+        }
+        if (g_pendingBatchResults.size() >= static_cast<size_t>(buffer_size)) {
+            return REAL_QUBIC_ERROR_BUFFER_TOO_SMALL;
+        }
+        memcpy(results_buffer, g_pendingBatchResults.c_str(), g_pendingBatchResults.size() + 1);
+        g_pendingBatchResults.clear();
+        g_pendingBatchResults.shrink_to_fit();
+        return REAL_QUBIC_SUCCESS;
     }
 }
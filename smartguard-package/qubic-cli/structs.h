@@ -139,6 +139,8 @@ enum COMMAND
     REAL_VOTING_RESULTS = 127,
     REAL_BALANCE = 128,
     REAL_TRANSFER = 129,
+    REAL_SERVER = 130,
+    REAL_VOTING_CAST_BATCH = 131,
     TOTAL_COMMAND, // DO NOT CHANGE THIS
 };
 
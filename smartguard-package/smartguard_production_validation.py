@@ -6,14 +6,26 @@ SmartGuard Production Validation Script
 This script validates the real Qubic integration for the SmartGuard audit platform.
 Run this to ensure your installation is working correctly before deploying to production.
 
-Usage: python smartguard_production_validation.py
+Usage: python smartguard_production_validation.py [--fast]
 """
 
 import sys
 import os
+import io
+import argparse
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import time
 
+# Guards creation of the dev kit shared by the concurrently running steps
+_QDK_LOCK = threading.Lock()
+
+# Compile timeout (seconds) for validation runs; the dev kit kills the qubic-cli
+# process tree when it expires, so a stalled CLI cannot hold up the whole run
+COMPILE_TIMEOUT = int(os.environ.get('SMARTGUARD_COMPILE_TIMEOUT', '20'))
+
 def print_header(title):
     """Print a formatted header."""
     print(f"\n{'='*60}")
@@ -25,6 +37,49 @@ def print_step(step_num, description):
     print(f"\n[Step {step_num}] {description}")
     print("-" * 40)
 
+@lru_cache(maxsize=None)
+def _qre():
+    """Import qubic_real_execution on first use and return the module."""
+    import qubic_real_execution
+    return qubic_real_execution
+
+def _get_qdk():
+    """Return the dev kit shared by every validation step (qubic-cli is located once)."""
+    with _QDK_LOCK:
+        qdk = _qre().get_devkit()
+        qdk.PHASE_TIMEOUT_CAPS = dict(type(qdk).PHASE_TIMEOUT_CAPS, compile=COMPILE_TIMEOUT)
+        return qdk
+
+class _StepOutput:
+    """
+    sys.stdout stand-in for concurrently running steps.
+    
+    Writes from a thread inside run() go to that step's own buffer; every
+    other write passes straight through to the wrapped stream.
+    """
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+    
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (self.stream if buffer is None else buffer).write(text)
+    
+    def flush(self):
+        self.stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+    
+    def run(self, step):
+        """Run a step with its output captured; returns (result, output)."""
+        self._local.buffer = io.StringIO()
+        try:
+            return step(), self._local.buffer.getvalue()
+        finally:
+            del self._local.buffer
+
 def validate_files():
     """Validate that required files exist."""
     print_step(1, "Validating Required Files")
@@ -35,9 +90,13 @@ def validate_files():
         "SMARTGUARD_PRODUCTION_PACKAGE.md"
     ]
     
+    # One directory read instead of a stat per required file
+    with os.scandir('.') as entries:
+        present = {entry.name for entry in entries}
+    
     missing_files = []
     for file in required_files:
-        if os.path.exists(file):
+        if file in present:
             print(f"✅ {file} - Found")
         else:
             print(f"❌ {file} - Missing")
@@ -50,16 +109,54 @@ def validate_files():
     print("\n✅ All required files present")
     return True
 
+# Contract sources used by the compilation and integration steps
+_TEST_CONTRACT_SRC = '''
+        struct TestContract {
+            long value;
+            
+            void setValue(long newValue) {
+                value = newValue;
+            }
+            
+            long getValue() {
+                return value;
+            }
+        };
+        '''
+
+_VOTING_CONTRACT_SRC = '''
+                struct VotingContract {
+                    long voteCount;
+                    
+                    void vote() {
+                        voteCount++;
+                    }
+                    
+                    long getVotes() {
+                        return voteCount;
+                    }
+                };
+                '''
+
+class MockSmartContractState:
+    """Mock SmartGuard state object holding the contract code."""
+    
+    def __init__(self):
+        self.contract_code = _VOTING_CONTRACT_SRC
+        self.messages = []
+
 def test_import():
     """Test importing the integration module."""
     print_step(2, "Testing Module Import")
     
     try:
-        from qubic_real_execution import RealQubicDevKit, compile_and_run_qubic_real
+        qre = _qre()
+        # Touch both entry points so a missing name fails the step
+        qre.RealQubicDevKit, qre.compile_and_run_qubic_real
         print("✅ Successfully imported RealQubicDevKit")
         print("✅ Successfully imported compile_and_run_qubic_real")
         return True
-    except ImportError as e:
+    except (ImportError, AttributeError) as e:
         print(f"❌ Import failed: {e}")
         return False
 
@@ -68,8 +165,7 @@ def test_qubic_cli():
     print_step(3, "Testing Qubic CLI Availability")
     
     try:
-        from qubic_real_execution import RealQubicDevKit
-        qdk = RealQubicDevKit()
+        qdk = _get_qdk()
         print(f"✅ Qubic CLI found at: {qdk.qubic_cli_path}")
         return True
     except Exception as e:
@@ -81,31 +177,22 @@ def test_compilation():
     print_step(4, "Testing Real Contract Compilation")
     
     try:
-        from qubic_real_execution import RealQubicDevKit
-        
-        # Simple test contract
-        test_contract = '''
-        struct TestContract {
-            long value;
-            
-            void setValue(long newValue) {
-                value = newValue;
-            }
-            
-            long getValue() {
-                return value;
-            }
-        };
-        '''
-        
-        qdk = RealQubicDevKit()
+        qdk = _get_qdk()
         print("🔄 Compiling test contract...")
         
-        result = qdk.compile_contract(test_contract)
+        # Own output file: the integration step builds contract.bytecode concurrently
+        bytecode_file = "validation_test.bytecode"
+        start_time = time.monotonic()
+        result = qdk.compile_contract(_TEST_CONTRACT_SRC, bytecode_file)
+        print(f"⏱️ Compile time: {time.monotonic() - start_time:.2f}s")
         
-        if result['success']:
+        if result['timeout']:
+            print(f"❌ Compilation timed out after {COMPILE_TIMEOUT}s (qubic-cli was killed)")
+            return False
+        elif result['success']:
             print("✅ Compilation successful!")
-            print(f"📄 Bytecode length: {len(result.get('bytecode', ''))} bytes")
+            # Size read from the output file: compiler output is never held in full
+            print(f"📄 Bytecode length: {os.path.getsize(bytecode_file)} bytes")
             return True
         else:
             print(f"❌ Compilation failed: {result.get('error', 'Unknown error')}")
@@ -115,30 +202,49 @@ def test_compilation():
         print(f"❌ Compilation test failed: {e}")
         return False
 
+def test_compile_cache_output():
+    """Test that a cached compile rewrites the output file (A -> B -> A)."""
+    print_step(6, "Testing Compile Cache Output File")
+    
+    # Own output file, shared by the three compiles below
+    bytecode_file = "cache_check.bytecode"
+    try:
+        qdk = _get_qdk()
+        print("🔄 Compiling contract A, then B, then A again to one output file...")
+        
+        bytecodes = []
+        for source in (_TEST_CONTRACT_SRC, _VOTING_CONTRACT_SRC, _TEST_CONTRACT_SRC):
+            result = qdk.compile_contract(source, bytecode_file)
+            if not result['success']:
+                print(f"❌ Compilation failed: {result.get('stderr') or 'Unknown error'}")
+                return False
+            with open(bytecode_file, 'rb') as f:
+                bytecodes.append(f.read())
+        
+        if bytecodes[2] != bytecodes[0]:
+            print("❌ Second compile of A left another contract's bytecode in the output file")
+            return False
+        print("✅ Cached compile restored the right bytecode")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Compile cache test failed: {e}")
+        return False
+    finally:
+        try:
+            os.remove(bytecode_file)
+        except OSError:
+            pass
+
 def test_smartguard_integration():
     """Test SmartGuard-style integration."""
     print_step(5, "Testing SmartGuard Integration Pattern")
     
     try:
-        from qubic_real_execution import compile_and_run_qubic_real
+        compile_and_run_qubic_real = _qre().compile_and_run_qubic_real
         
-        # Mock SmartGuard state object
-        class MockSmartContractState:
-            def __init__(self):
-                self.contract_code = '''
-                struct VotingContract {
-                    long voteCount;
-                    
-                    void vote() {
-                        voteCount++;
-                    }
-                    
-                    long getVotes() {
-                        return voteCount;
-                    }
-                };
-                '''
-                self.messages = []
+        # Applies the validation compile timeout to the shared dev kit used below
+        _get_qdk()
         
         print("🔄 Testing SmartGuard integration pattern...")
         
@@ -158,6 +264,23 @@ def test_smartguard_integration():
         print(f"❌ SmartGuard integration test failed: {e}")
         return False
 
+# Closing summary text, written in one call
+_ALL_PASSED_TEXT = """
+🎉 ALL TESTS PASSED!
+✅ Your SmartGuard integration is ready for production!
+
+📋 Next Steps:
+   1. Copy qubic_real_execution.py to your SmartGuard project
+   2. Update your import in the QuBIC node file
+   3. Test in your SmartGuard environment
+   4. Deploy to production
+"""
+
+_SOME_FAILED_TEXT = """
+⚠️  Some tests failed. Please check the errors above.
+📖 See README_QUBIC_INTEGRATION.md for troubleshooting.
+"""
+
 def print_summary(results):
     """Print validation summary."""
     print_header("VALIDATION SUMMARY")
@@ -165,26 +288,20 @@ def print_summary(results):
     passed = sum(results.values())
     total = len(results)
     
-    print(f"\nTests Passed: {passed}/{total}")
-    
-    for test_name, result in results.items():
-        status = "✅ PASS" if result else "❌ FAIL"
-        print(f"  {status} - {test_name}")
-    
-    if passed == total:
-        print(f"\n🎉 ALL TESTS PASSED!")
-        print("✅ Your SmartGuard integration is ready for production!")
-        print("\n📋 Next Steps:")
-        print("   1. Copy qubic_real_execution.py to your SmartGuard project")
-        print("   2. Update your import in the QuBIC node file")
-        print("   3. Test in your SmartGuard environment")
-        print("   4. Deploy to production")
-    else:
-        print(f"\n⚠️  Some tests failed. Please check the errors above.")
-        print("📖 See README_QUBIC_INTEGRATION.md for troubleshooting.")
-
-def main():
+    rows = "\n".join(
+        f"  {'✅ PASS' if result else '❌ FAIL'} - {test_name}"
+        for test_name, result in results.items()
+    )
+    sys.stdout.write(f"\nTests Passed: {passed}/{total}\n{rows}\n")
+    sys.stdout.write(_ALL_PASSED_TEXT if passed == total else _SOME_FAILED_TEXT)
+
+def main(argv=None):
     """Run all validation tests."""
+    parser = argparse.ArgumentParser(description="Validate the SmartGuard Qubic integration.")
+    parser.add_argument('--fast', action='store_true',
+                        help="skip the Qubic CLI step; compilation already exercises qubic-cli")
+    args = parser.parse_args(argv)
+    
     print_header("SmartGuard Production Validation")
     print("Validating Qubic real execution integration for SmartGuard...")
     
@@ -193,9 +310,32 @@ def main():
     # Run all validation tests
     results["File Validation"] = validate_files()
     results["Module Import"] = test_import()
-    results["Qubic CLI"] = test_qubic_cli()
-    results["Contract Compilation"] = test_compilation()
-    results["SmartGuard Integration"] = test_smartguard_integration()
+    
+    # The remaining steps are independent: run them concurrently and print
+    # each step's buffered output in order as soon as it is available
+    steps = {
+        "Qubic CLI": test_qubic_cli,
+        "Contract Compilation": test_compilation,
+        "Compile Cache Output": test_compile_cache_output,
+        "SmartGuard Integration": test_smartguard_integration,
+    }
+    if args.fast:
+        del steps["Qubic CLI"]
+    output = _StepOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=len(steps)) as pool:
+            futures = {name: pool.submit(output.run, step) for name, step in steps.items()}
+            for name, future in futures.items():
+                results[name], text = future.result()
+                output.write(text)
+    finally:
+        sys.stdout = output.stream
+    
+    if args.fast:
+        # A successful compile proves qubic-cli runs; otherwise just check it was found
+        results["Qubic CLI"] = (results["Contract Compilation"]
+                                or os.path.isfile(_get_qdk().qubic_cli_path))
     
     # Print summary
     print_summary(results)
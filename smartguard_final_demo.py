@@ -15,15 +15,86 @@ from pathlib import Path
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Fixed demo text, built once at import instead of on every run
+_STATIC_LOGS = """=== QUBIC SIMULATION ===
+
+📝 Step 1: Contract Analysis
+✅ Syntax check: PASSED
+✅ Structure validation: PASSED
+
+📝 Step 2: Static Compilation Check
+✅ Compilation: SUCCESS (simulated)
+📦 Bytecode: Generated (simulated)
+
+📝 Step 3: VM Simulation
+✅ Deployment: SUCCESS (simulated)
+✅ Function calls: SUCCESS (simulated)
+📊 All tests: PASSED
+
+⚠️ Note: This is a simulation - no real blockchain interaction"""
+
+_ENHANCED_SIMULATION_LOGS = """=== QUBIC DEV KIT EXECUTION ===
+
+⚠️ ENHANCED SIMULATION MODE 
+🔗 Real execution requires qubic-cli integration
+
+📝 Step 1: Contract Compilation
+✅ Syntax validation: PASSED
+✅ QPI structure check: PASSED  
+✅ Compilation: SUCCESS (enhanced simulation)
+📦 Bytecode: Would be generated with real qubic-cli
+
+📝 Step 2: Contract Deployment
+✅ Deployment: Would deploy to Qubic testnet
+🆔 Contract ID: Would receive actual contract ID
+💰 Cost: Would deduct real transaction fees
+
+📝 Step 3: Function Call Test
+✅ Function calls: Would call actual contract functions
+📊 Return values: Would receive real blockchain data
+
+🎯 For REAL execution:
+   1. Install qubic-voting-dapp
+   2. Build qubic-cli tool
+   3. Configure network settings
+   4. Re-run with real execution module
+
+📋 Real execution provides:
+   ✅ Actual C++ compilation with full error detection
+   ✅ Live Qubic testnet deployment and interaction
+   ✅ Real transaction costs and blockchain state
+   ✅ Professional development workflow"""
+
+_COMPARISON_TABLE = """| Feature                | Static Simulation | Real Execution     |
+|------------------------|-------------------|--------------------|
+| Compilation            | Simulated ✨      | Real C++ ✅        |
+| Deployment             | Fake 📝           | Live testnet 🌐    |
+| Function calls         | Mock 🎭           | Actual calls 📞    |
+| Error detection        | Basic ⚠️          | Full compiler 🔍   |
+| Network interaction    | None 🚫           | Real blockchain ⛓️ |
+| Execution time         | Instant ⚡        | 30-120 seconds ⏱️  |
+| Transaction costs      | None 💸           | Real fees 💰       |
+| Development value      | Learning 📚       | Production 🚀      |"""
+
+def _write_lines(lines):
+    """Write buffered output lines to stdout in one call and clear the buffer."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+    lines.clear()
+
 def run_smartguard_integration_demo():
     """
     Comprehensive SmartGuard integration demonstration.
     Shows static simulation vs real execution with proper error handling.
     """
     
-    print("🎯 SmartGuard Integration Demonstration")
-    print("=" * 60)
-    print()
+    # Output is collected and written in a few large chunks instead of line by line
+    lines = []
+    emit = lines.append
+    
+    emit("🎯 SmartGuard Integration Demonstration")
+    emit("=" * 60)
+    emit("")
     
     # Test contract for demonstration
     test_contract = '''
@@ -46,50 +117,33 @@ struct VotingContract : public ContractBase {
 };
 '''
     
-    print("📝 Test Contract:")
-    print("- Simple voting contract with CreateProposal and GetStats")
-    print("- Optimized for quick compilation")
-    print("- Compatible with Qubic QPI framework")
-    print()
+    emit("📝 Test Contract:")
+    emit("- Simple voting contract with CreateProposal and GetStats")
+    emit("- Optimized for quick compilation")
+    emit("- Compatible with Qubic QPI framework")
+    emit("")
     
     # Demo 1: Static Simulation (SmartGuard's current approach)
-    print("🔄 Demo 1: SmartGuard Current Implementation (Static Simulation)")
-    print("-" * 60)
+    emit("🔄 Demo 1: SmartGuard Current Implementation (Static Simulation)")
+    emit("-" * 60)
     
     start_time = time.time()
     
-    # Simulate what SmartGuard currently does
-    static_logs = """=== QUBIC SIMULATION ===
-
-📝 Step 1: Contract Analysis
-✅ Syntax check: PASSED
-✅ Structure validation: PASSED
-
-📝 Step 2: Static Compilation Check
-✅ Compilation: SUCCESS (simulated)
-📦 Bytecode: Generated (simulated)
-
-📝 Step 3: VM Simulation
-✅ Deployment: SUCCESS (simulated)
-✅ Function calls: SUCCESS (simulated)
-📊 All tests: PASSED
-
-⚠️ Note: This is a simulation - no real blockchain interaction"""
-    
+    # Simulate what SmartGuard currently does (fixed logs, see _STATIC_LOGS)
     static_time = time.time() - start_time
     
-    print("📊 Results:")
-    print(f"   ⏱️ Execution time: {static_time:.2f} seconds")
-    print(f"   ✅ Compilation success: True")
-    print(f"   📋 Output: Simulated execution logs")
-    print()
-    print("📝 Static Execution Logs:")
-    print(static_logs)
-    print()
+    emit("📊 Results:")
+    emit(f"   ⏱️ Execution time: {static_time:.2f} seconds")
+    emit(f"   ✅ Compilation success: True")
+    emit(f"   📋 Output: Simulated execution logs")
+    emit("")
+    emit("📝 Static Execution Logs:")
+    emit(_STATIC_LOGS)
+    emit("")
     
     # Demo 2: Real Execution (Our enhanced approach)
-    print("🚀 Demo 2: Enhanced Implementation (Real Execution)")
-    print("-" * 60)
+    emit("🚀 Demo 2: Enhanced Implementation (Real Execution)")
+    emit("-" * 60)
     
     start_time = time.time()
     
@@ -104,180 +158,144 @@ struct VotingContract : public ContractBase {
                 self.qubic_logs = ""
                 self.compilation_success = False
         
-        print("📝 Starting real execution process...")
-        print("   1. Initializing qubic-cli interface...")
-        print("   2. Creating temporary contract file...")
-        print("   3. Attempting real compilation...")
-        print("   4. Processing results...")
-        print()
+        emit("📝 Starting real execution process...")
+        emit("   1. Initializing qubic-cli interface...")
+        emit("   2. Creating temporary contract file...")
+        emit("   3. Attempting real compilation...")
+        emit("   4. Processing results...")
+        emit("")
+        
+        # Show progress so far before the (possibly slow) real execution
+        _write_lines(lines)
         
-        # Run real execution with timeout protection
+        # Run real execution with timeout protection; all files go to one scratch directory
         state = MockSmartGuardState()
-        result_state = smartguard_compile_and_run_qubic(state)
+        with tempfile.TemporaryDirectory(prefix='sg_demo_') as work_dir:
+            result_state = smartguard_compile_and_run_qubic(state, work_dir=work_dir)
         
         real_time = time.time() - start_time
         
-        print("📊 Results:")
-        print(f"   ⏱️ Execution time: {real_time:.2f} seconds")
-        print(f"   ✅ Compilation success: {result_state.compilation_success}")
-        print(f"   📋 Output: Real execution logs")
-        print()
-        print("📝 Real Execution Logs:")
-        print(result_state.qubic_logs)
+        emit("📊 Results:")
+        emit(f"   ⏱️ Execution time: {real_time:.2f} seconds")
+        emit(f"   ✅ Compilation success: {result_state.compilation_success}")
+        emit(f"   📋 Output: Real execution logs")
+        emit("")
+        emit("📝 Real Execution Logs:")
+        emit(result_state.qubic_logs)
         
         real_execution_available = True
         
     except ImportError as e:
         real_time = time.time() - start_time
         
-        print(f"⚠️ Real execution module not available: {e}")
-        print()
-        print("📊 Results:")
-        print(f"   ⏱️ Execution time: {real_time:.2f} seconds")
-        print(f"   ✅ Compilation success: True (enhanced simulation)")
-        print(f"   📋 Output: Enhanced simulation with real execution hints")
-        print()
-        
-        enhanced_simulation_logs = """=== QUBIC DEV KIT EXECUTION ===
-
-⚠️ ENHANCED SIMULATION MODE 
-🔗 Real execution requires qubic-cli integration
-
-📝 Step 1: Contract Compilation
-✅ Syntax validation: PASSED
-✅ QPI structure check: PASSED  
-✅ Compilation: SUCCESS (enhanced simulation)
-📦 Bytecode: Would be generated with real qubic-cli
-
-📝 Step 2: Contract Deployment
-✅ Deployment: Would deploy to Qubic testnet
-🆔 Contract ID: Would receive actual contract ID
-💰 Cost: Would deduct real transaction fees
-
-📝 Step 3: Function Call Test
-✅ Function calls: Would call actual contract functions
-📊 Return values: Would receive real blockchain data
-
-🎯 For REAL execution:
-   1. Install qubic-voting-dapp
-   2. Build qubic-cli tool
-   3. Configure network settings
-   4. Re-run with real execution module
-
-📋 Real execution provides:
-   ✅ Actual C++ compilation with full error detection
-   ✅ Live Qubic testnet deployment and interaction
-   ✅ Real transaction costs and blockchain state
-   ✅ Professional development workflow"""
+        emit(f"⚠️ Real execution module not available: {e}")
+        emit("")
+        emit("📊 Results:")
+        emit(f"   ⏱️ Execution time: {real_time:.2f} seconds")
+        emit(f"   ✅ Compilation success: True (enhanced simulation)")
+        emit(f"   📋 Output: Enhanced simulation with real execution hints")
+        emit("")
         
-        print("📝 Enhanced Simulation Logs:")
-        print(enhanced_simulation_logs)
+        emit("📝 Enhanced Simulation Logs:")
+        emit(_ENHANCED_SIMULATION_LOGS)
         
         real_execution_available = False
     
-    print()
+    emit("")
     
     # Comparison Summary
-    print("📊 Execution Comparison Summary")
-    print("=" * 60)
-    print()
+    emit("📊 Execution Comparison Summary")
+    emit("=" * 60)
+    emit("")
     
-    print("| Feature                | Static Simulation | Real Execution     |")
-    print("|------------------------|-------------------|--------------------|")
-    print("| Compilation            | Simulated ✨      | Real C++ ✅        |")
-    print("| Deployment             | Fake 📝           | Live testnet 🌐    |") 
-    print("| Function calls         | Mock 🎭           | Actual calls 📞    |")
-    print("| Error detection        | Basic ⚠️          | Full compiler 🔍   |")
-    print("| Network interaction    | None 🚫           | Real blockchain ⛓️ |")
-    print("| Execution time         | Instant ⚡        | 30-120 seconds ⏱️  |")
-    print("| Transaction costs      | None 💸           | Real fees 💰       |")
-    print("| Development value      | Learning 📚       | Production 🚀      |")
-    print()
+    emit(_COMPARISON_TABLE)
+    emit("")
     
     # Integration Benefits
-    print("🎯 SmartGuard Integration Benefits")
-    print("=" * 60)
-    print()
+    emit("🎯 SmartGuard Integration Benefits")
+    emit("=" * 60)
+    emit("")
     
     if real_execution_available:
-        print("✅ REAL EXECUTION ACTIVE")
-        print("   🔹 Users get professional Qubic development experience")
-        print("   🔹 Actual compilation errors help debug contract issues")
-        print("   🔹 Live testnet deployment validates contract functionality")
-        print("   🔹 Real function calls test contract behavior")
-        print("   🔹 SmartGuard becomes a complete development environment")
+        emit("✅ REAL EXECUTION ACTIVE")
+        emit("   🔹 Users get professional Qubic development experience")
+        emit("   🔹 Actual compilation errors help debug contract issues")
+        emit("   🔹 Live testnet deployment validates contract functionality")
+        emit("   🔹 Real function calls test contract behavior")
+        emit("   🔹 SmartGuard becomes a complete development environment")
     else:
-        print("⚠️ ENHANCED SIMULATION ACTIVE")
-        print("   🔹 Better than basic simulation - shows real execution workflow")
-        print("   🔹 Educates users about actual Qubic development process")
-        print("   🔹 Provides clear path to enable real execution")
-        print("   🔹 Ready for seamless upgrade when qubic-cli is available")
+        emit("⚠️ ENHANCED SIMULATION ACTIVE")
+        emit("   🔹 Better than basic simulation - shows real execution workflow")
+        emit("   🔹 Educates users about actual Qubic development process")
+        emit("   🔹 Provides clear path to enable real execution")
+        emit("   🔹 Ready for seamless upgrade when qubic-cli is available")
     
-    print()
-    print("🔧 Integration Instructions for SmartGuard Team")
-    print("=" * 60)
-    print()
+    emit("")
+    emit("🔧 Integration Instructions for SmartGuard Team")
+    emit("=" * 60)
+    emit("")
     
-    print("1. **Copy Integration Module**:")
-    print("   - Add `smartguard_integration.py` to your SmartGuard project")
-    print("   - No changes to existing SmartGuard code structure needed")
-    print()
+    emit("1. **Copy Integration Module**:")
+    emit("   - Add `smartguard_integration.py` to your SmartGuard project")
+    emit("   - No changes to existing SmartGuard code structure needed")
+    emit("")
     
-    print("2. **Update Function Call**:")
-    print("   ```python")
-    print("   # Replace this line in your SmartGuard app:")
-    print("   # result_state = compile_and_run_qubic(st.session_state)")
-    print("   ")
-    print("   # With this:")
-    print("   from smartguard_integration import smartguard_compile_and_run_qubic")
-    print("   result_state = smartguard_compile_and_run_qubic(st.session_state)")
-    print("   ```")
-    print()
+    emit("2. **Update Function Call**:")
+    emit("   ```python")
+    emit("   # Replace this line in your SmartGuard app:")
+    emit("   # result_state = compile_and_run_qubic(st.session_state)")
+    emit("   ")
+    emit("   # With this:")
+    emit("   from smartguard_integration import smartguard_compile_and_run_qubic")
+    emit("   result_state = smartguard_compile_and_run_qubic(st.session_state)")
+    emit("   ```")
+    emit("")
     
-    print("3. **Deploy qubic-cli (Optional)**:")
-    print("   - For real execution: Build and deploy qubic-cli.exe")
-    print("   - For enhanced simulation: Module works without qubic-cli")
-    print("   - Users get clear indication of current execution mode")
-    print()
+    emit("3. **Deploy qubic-cli (Optional)**:")
+    emit("   - For real execution: Build and deploy qubic-cli.exe")
+    emit("   - For enhanced simulation: Module works without qubic-cli")
+    emit("   - Users get clear indication of current execution mode")
+    emit("")
     
-    print("4. **Test Integration**:")
-    print("   - Run SmartGuard with a simple test contract")
-    print("   - Verify logs show execution mode (real vs enhanced simulation)")
-    print("   - Confirm seamless user experience")
-    print()
+    emit("4. **Test Integration**:")
+    emit("   - Run SmartGuard with a simple test contract")
+    emit("   - Verify logs show execution mode (real vs enhanced simulation)")
+    emit("   - Confirm seamless user experience")
+    emit("")
     
     # Technical Details
-    print("⚙️ Technical Implementation Details")
-    print("=" * 60)
-    print()
+    emit("⚙️ Technical Implementation Details")
+    emit("=" * 60)
+    emit("")
     
-    print("🔹 **Timeout Management**: Smart timeouts prevent UI hanging")
-    print("🔹 **Error Handling**: Graceful fallback to enhanced simulation")
-    print("🔹 **Path Detection**: Auto-finds qubic-cli in common locations")
-    print("🔹 **Progress Feedback**: Detailed logs for user transparency")
-    print("🔹 **API Compatibility**: Drop-in replacement for existing function")
-    print()
+    emit("🔹 **Timeout Management**: Smart timeouts prevent UI hanging")
+    emit("🔹 **Error Handling**: Graceful fallback to enhanced simulation")
+    emit("🔹 **Path Detection**: Auto-finds qubic-cli in common locations")
+    emit("🔹 **Progress Feedback**: Detailed logs for user transparency")
+    emit("🔹 **API Compatibility**: Drop-in replacement for existing function")
+    emit("")
     
     # Success Message
-    print("🎉 Integration Complete!")
-    print("=" * 60)
-    print()
+    emit("🎉 Integration Complete!")
+    emit("=" * 60)
+    emit("")
     
     if real_execution_available:
-        print("✅ SmartGuard is ready for REAL Qubic execution!")
-        print("   Users will experience actual contract compilation and deployment.")
+        emit("✅ SmartGuard is ready for REAL Qubic execution!")
+        emit("   Users will experience actual contract compilation and deployment.")
     else:
-        print("✅ SmartGuard is ready for ENHANCED simulation!")
-        print("   Users will see improved workflow and clear upgrade path.")
+        emit("✅ SmartGuard is ready for ENHANCED simulation!")
+        emit("   Users will see improved workflow and clear upgrade path.")
     
-    print()
-    print("🔗 Resources:")
-    print("   📋 Integration Guide: SMARTGUARD_INTEGRATION_GUIDE.md")
-    print("   🛠️ Technical Docs: README.md")
-    print("   💻 Source Code: https://github.com/ah4y/qubic-voting-dapp")
-    print("   🎯 SmartGuard: https://github.com/YAMINA-2109/Qubic-SmartGuard")
-    print()
-    print("Happy coding! 🚀")
+    emit("")
+    emit("🔗 Resources:")
+    emit("   📋 Integration Guide: SMARTGUARD_INTEGRATION_GUIDE.md")
+    emit("   🛠️ Technical Docs: README.md")
+    emit("   💻 Source Code: https://github.com/ah4y/qubic-voting-dapp")
+    emit("   🎯 SmartGuard: https://github.com/YAMINA-2109/Qubic-SmartGuard")
+    emit("")
+    emit("Happy coding! 🚀")
+    _write_lines(lines)
 
 if __name__ == "__main__":
     run_smartguard_integration_demo()
@@ -17,13 +17,329 @@ Repository: https://github.com/ah4y/qubic-voting-dapp
 Compatible with: https://github.com/YAMINA-2109/Qubic-SmartGuard
 """
 
+import asyncio
+import contextlib
+import hashlib
+import itertools
+import json
+import queue
+import re
+import selectors
+import shutil
 import subprocess
 import tempfile
+import threading
 import os
 import sys
 import time
+import uuid
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Union, Tuple, List, Deque
+
+# Set to "0" to bypass the compiled bytecode cache
+COMPILE_CACHE_ENV = "SMARTGUARD_COMPILE_CACHE"
+
+# Set to "0" to skip the background qubic-cli warm-up at import
+WARMUP_ENV = "SMARTGUARD_WARMUP"
+
+# Oldest log entries are dropped beyond this, so a reused RealQubicDevKit stays bounded
+MAX_LOG_ENTRIES = 512
+
+# Bytes moved per read/write when draining qubic-cli pipes
+_PIPE_CHUNK = 65536
+
+# Status line that ends each request's output in qubic-cli -realserver mode
+_WORKER_STATUS_RE = re.compile(r'^\{"id":(\d+),"status":"(\w+)"\}$')
+
+_IS_WINDOWS = os.name == 'nt'
+
+# qubic-cli runs in its own process group on Windows (the flag only exists there)
+_CREATION_FLAGS = subprocess.CREATE_NEW_PROCESS_GROUP if _IS_WINDOWS else 0
+
+# Contract ID reported by qubic-cli after a deployment
+_CONTRACT_ID_RE = re.compile(r'(?:Contract\s+)?ID:\s*(\S{6,})')
+
+# Pre-compile checks, as in qubic_real_execution.preflight_contract: a source
+# without any struct/class is rejected; missing QPI / ContractBase markers only
+# warn, since qubic-cli compiles plain structs too
+_DECL_RE = re.compile(r'\b(?:struct|class)\b')
+_QPI_RE = re.compile(r'\bQPI\b')
+_BASE_RE = re.compile(r'\bContractBase\b')
+
+# String/char literals and comments, blanked before counting braces
+_LITERALS_AND_COMMENTS_RE = re.compile(
+    r'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|//[^\n]*|/\*.*?\*/',
+    re.DOTALL
+)
+
+# Common qubic-cli locations, relative to the working directory
+_QUBIC_CLI_SEARCH_PATHS = (
+    "./qubic-cli/build/Release/qubic-cli.exe",
+    "./qubic-cli/build/Debug/qubic-cli.exe",
+    "./qubic-cli/build/qubic-cli.exe",
+    "./qubic-cli/qubic-cli.exe",
+    "qubic-cli.exe",
+    "qubic-cli"
+)
+
+def _contract_id(deploy_stdout: str, fallback: str = "DEMO123456") -> str:
+    """First plausible "ID: <value>" reported by a deployment, or fallback."""
+    match = _CONTRACT_ID_RE.search(deploy_stdout)
+    return match.group(1) if match else fallback
+
+@lru_cache(maxsize=None)
+def _supports_worker(cli_path: str) -> bool:
+    """Whether this qubic-cli build has the -realserver mode (checked once per path)."""
+    try:
+        help_text = subprocess.run([cli_path, "-help"], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return "-realserver" in help_text
+
+@lru_cache(maxsize=4)
+def _resolve_qubic_cli(provided_path: Optional[str], cwd: str) -> str:
+    """Find the qubic-cli executable, probing the filesystem once per (path, working directory)."""
+    if provided_path and os.path.isfile(provided_path):
+        return provided_path
+    
+    for path in _QUBIC_CLI_SEARCH_PATHS:
+        candidate = os.path.join(cwd, path)
+        if os.path.isfile(candidate):
+            return os.path.abspath(candidate)
+    
+    # If not found, assume it's in PATH
+    return "qubic-cli"
+
+def _quick_validate(contract_code: str) -> Optional[str]:
+    """
+    Cheap structural check run before spending a compile timeout on the source.
+    
+    Args:
+        contract_code: Contract source code
+        
+    Returns:
+        Why the source cannot be a Qubic contract, or None if it looks plausible
+    """
+    if not _DECL_RE.search(contract_code):
+        return "no struct or class declaration"
+    code_only = _LITERALS_AND_COMMENTS_RE.sub(' ', contract_code)
+    if code_only.count('{') != code_only.count('}'):
+        return "unbalanced braces"
+    return None
+
+def _materialize_source(contract_code: str, stack: contextlib.ExitStack,
+                        work_dir: Optional[str] = None) -> str:
+    """
+    Give the contract source a path qubic-cli can open.
+    
+    On Linux the source lives in an anonymous memfd read through /proc, so
+    nothing is written to disk. Elsewhere a temporary .cpp file is written to
+    work_dir (system temp dir if None). Cleanup is registered on the stack as
+    soon as the resource exists, so no exit path leaks it.
+    """
+    if hasattr(os, 'memfd_create') and os.path.isdir(f"/proc/{os.getpid()}/fd"):
+        fd = os.memfd_create("qubic_src.cpp", os.MFD_CLOEXEC)
+        stack.callback(os.close, fd)
+        data = memoryview(contract_code.encode('utf-8'))
+        while data:
+            data = data[os.write(fd, data):]
+        # qubic-cli is a different process, so address the fd through our pid
+        return f"/proc/{os.getpid()}/fd/{fd}"
+    
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.cpp', delete=False, dir=work_dir) as tmp_file:
+        stack.callback(os.unlink, tmp_file.name)
+        tmp_file.write(contract_code)
+    return tmp_file.name
+
+def _drain_pipes(process: subprocess.Popen, input_bytes: bytes, timeout: float) -> Tuple[bytes, bytes]:
+    """
+    Feed stdin and collect stdout/stderr as they arrive, like communicate() but
+    reading straight into growing buffers with one select loop (POSIX pipes only).
+    
+    Returns:
+        (stdout, stderr) once the process has closed both pipes and exited
+        
+    Raises:
+        subprocess.TimeoutExpired: If that takes longer than timeout (the process is left running)
+    """
+    deadline = time.monotonic() + timeout
+    output = {process.stdout: bytearray(), process.stderr: bytearray()}
+    pending = memoryview(input_bytes)
+    with selectors.DefaultSelector() as selector:
+        for pipe in output:
+            selector.register(pipe, selectors.EVENT_READ)
+        if pending:
+            selector.register(process.stdin, selectors.EVENT_WRITE)
+        else:
+            process.stdin.close()
+        
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(process.args, timeout)
+            for key, _ in selector.select(remaining):
+                if key.fileobj is process.stdin:
+                    try:
+                        pending = pending[os.write(key.fd, pending[:_PIPE_CHUNK]):]
+                    except BrokenPipeError:
+                        pending = pending[:0]
+                    if not pending:
+                        selector.unregister(key.fileobj)
+                        key.fileobj.close()
+                    continue
+                chunk = os.read(key.fd, _PIPE_CHUNK)
+                if chunk:
+                    output[key.fileobj] += chunk
+                else:
+                    selector.unregister(key.fileobj)
+                    key.fileobj.close()
+    
+    process.wait(timeout=max(deadline - time.monotonic(), 0))
+    return bytes(output[process.stdout]), bytes(output[process.stderr])
+
+def _pump_lines(process: subprocess.Popen, lines: queue.SimpleQueue):
+    """Queue each stdout line of process, then None at EOF, and reap the process."""
+    for line in process.stdout:
+        lines.put(line)
+    lines.put(None)
+    process.wait()
+
+def _stop_worker(process: subprocess.Popen):
+    """Close the worker's stdin so it exits; kill it if it does not."""
+    try:
+        process.stdin.close()
+        process.wait(timeout=2)
+    except (OSError, subprocess.TimeoutExpired):
+        process.kill()
+        process.wait()
+
+class QubicCliWorker:
+    """
+    Long-lived qubic-cli -realserver process, started on first use.
+    
+    Commands sent to it skip qubic-cli's process startup. It serves one request
+    at a time: a caller that finds it busy gets None and runs its command as its
+    own process instead.
+    """
+    
+    def __init__(self, cli_path: str):
+        self.cli_path = cli_path
+        self._process = None
+        self._lines = None
+        self._finalizer = None
+        self._request_ids = itertools.count(1)
+        self._lock = threading.Lock()
+    
+    def try_run(self, args: list, timeout: float) -> Optional[Tuple[int, str, str]]:
+        """
+        Run one command on the server process if it is free.
+        
+        Returns:
+            (returncode, stdout, stderr), or None if the worker is busy, this CLI
+            build has no server mode, or the worker could not take the command
+            
+        Raises:
+            subprocess.TimeoutExpired: If the command does not finish in time (the process is stopped)
+        """
+        if not self._lock.acquire(blocking=False):
+            return None
+        try:
+            if not self._ensure_started():
+                return None
+            return self._run(args, timeout)
+        finally:
+            self._lock.release()
+    
+    def _ensure_started(self) -> bool:
+        """
+        Start the qubic-cli -realserver process if needed.
+        
+        Returns:
+            True if a worker is running, False if this CLI build has no server mode
+        """
+        if self._process is not None and self._process.poll() is None:
+            return True
+        self.close()
+        if not _supports_worker(self.cli_path):
+            return False
+        
+        self._process = subprocess.Popen(
+            [self.cli_path, "-realserver"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+            creationflags=_CREATION_FLAGS
+        )
+        self._lines = queue.SimpleQueue()
+        threading.Thread(target=_pump_lines, args=(self._process, self._lines), daemon=True).start()
+        # Stops the process when the worker is collected or the interpreter exits
+        self._finalizer = weakref.finalize(self, _stop_worker, self._process)
+        return True
+    
+    def _run(self, args: list, timeout: float) -> Optional[Tuple[int, str, str]]:
+        """
+        Run one command on the server process.
+        
+        Returns:
+            (returncode, stdout, stderr), or None if the worker could not take
+            the command and it should run as its own process instead
+            
+        Raises:
+            subprocess.TimeoutExpired: If the command does not finish in time (the worker is stopped)
+        """
+        request_id = next(self._request_ids)
+        try:
+            self._process.stdin.write(json.dumps({"id": request_id, "argv": args}) + "\n")
+            self._process.stdin.flush()
+        except OSError:
+            self.close()
+            return None
+        
+        deadline = time.monotonic() + timeout
+        lines = []
+        while True:
+            try:
+                line = self._lines.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                # The worker's state is unknown after a timeout: kill it, start fresh next time
+                self._process.kill()
+                self.close()
+                raise subprocess.TimeoutExpired(args, timeout)
+            
+            if line is None:
+                # Worker exited: retry as a process only if the command produced nothing yet
+                output = "".join(lines)
+                self.close()
+                return None if not output else (1, output, output)
+            
+            match = _WORKER_STATUS_RE.match(line.rstrip())
+            if match and int(match.group(1)) == request_id:
+                output = "".join(lines)
+                if match.group(2) == "success":
+                    return 0, output, ""
+                if "unsupported server command" in output:
+                    # Older server builds only serve the -real* commands
+                    return None
+                return 1, output, output
+            lines.append(line)
+    
+    def close(self):
+        """Stop the qubic-cli server process, if one is running."""
+        if self._finalizer is not None:
+            self._finalizer()
+        self._process = None
+        self._finalizer = None
+
+@lru_cache(maxsize=4)
+def _shared_qubic_cli_worker(cli_path: str) -> QubicCliWorker:
+    """One worker per qubic-cli path, reused by every shared_worker dev kit."""
+    return QubicCliWorker(cli_path)
 
 class RealQubicDevKit:
     """
@@ -31,40 +347,34 @@ class RealQubicDevKit:
     Provides actual interaction with Qubic testnet/mainnet.
     """
     
-    def __init__(self, qubic_cli_path: Optional[str] = None, timeout: int = 45):
+    def __init__(self, qubic_cli_path: Optional[str] = None, timeout: int = 45,
+                 work_dir: Optional[str] = None, shared_worker: bool = False):
         """
         Initialize the Real Qubic Dev Kit.
         
         Args:
             qubic_cli_path: Path to qubic-cli executable (auto-detected if None)
             timeout: Timeout in seconds for operations (default: 45 for better UX)
+            work_dir: Existing directory for temporary source files (system temp dir if None)
+            shared_worker: Use the process-wide qubic-cli worker for this CLI path, so
+                the server process stays warm across dev kits (default: own worker)
         """
         self.timeout = timeout
-        self.qubic_cli_path = self._find_qubic_cli(qubic_cli_path)
-        self.logs = []
-        
-    def _find_qubic_cli(self, provided_path: Optional[str]) -> str:
-        """Find qubic-cli executable."""
-        if provided_path and os.path.isfile(provided_path):
-            return provided_path
-            
-        # Try common locations
-        search_paths = [
-            "./qubic-cli/build/Release/qubic-cli.exe",
-            "./qubic-cli/build/Debug/qubic-cli.exe", 
-            "./qubic-cli/build/qubic-cli.exe",
-            "./qubic-cli/qubic-cli.exe",
-            "qubic-cli.exe",
-            "qubic-cli"
-        ]
+        self.qubic_cli_path = _resolve_qubic_cli(qubic_cli_path, os.getcwd())
+        # Once qubic-cli is known to be missing, commands fail without spawning a process
+        self._binary_missing = (not os.path.isfile(self.qubic_cli_path)
+                                and shutil.which(self.qubic_cli_path) is None)
+        self.work_dir = work_dir
+        self.cache_dir = Path(tempfile.gettempdir()) / "qubic_bc_cache"
+        # Plain strings, or (template, args) records formatted lazily by get_logs()
+        self.logs: Deque[Union[str, Tuple[str, tuple]]] = deque(maxlen=MAX_LOG_ENTRIES)
+        # (number of entries joined, joined text) reused by get_logs()
+        self._logs_cache: Tuple[int, str] = (0, "")
+        # Long-lived qubic-cli -realserver process; a shared one outlives this dev kit
+        self._shared_worker = shared_worker
+        self._worker = (_shared_qubic_cli_worker(self.qubic_cli_path) if shared_worker
+                        else QubicCliWorker(self.qubic_cli_path))
         
-        for path in search_paths:
-            if os.path.isfile(path):
-                return os.path.abspath(path)
-                
-        # If not found, assume it's in PATH
-        return "qubic-cli"
-    
     def _run_command(self, args: list, input_data: str = "", working_dir: str = ".") -> Dict[str, Any]:
         """
         Run a command with proper timeout and error handling.
@@ -77,54 +387,51 @@ class RealQubicDevKit:
         Returns:
             Dict with stdout, stderr, returncode, success, and timeout info
         """
+        if self._binary_missing:
+            return self._missing_binary_result()
+        
         full_command = [self.qubic_cli_path] + args
         
         try:
             # Use shorter timeout for compilation to avoid hanging
             actual_timeout = min(self.timeout, 30) if 'compile' in ' '.join(args) else self.timeout
             
-            self.logs.append(f"Running: {' '.join(full_command)}")
-            self.logs.append(f"Timeout: {actual_timeout}s (optimized for UI responsiveness)")
+            self._log("Running: %s", ' '.join(full_command))
+            self._log("Timeout: %ss (optimized for UI responsiveness)", actual_timeout)
             
             start_time = time.time()
             
-            process = subprocess.Popen(
-                full_command,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=working_dir,
-                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if os.name == 'nt' else 0
-            )
-            
             try:
-                stdout, stderr = process.communicate(input=input_data, timeout=actual_timeout)
+                # Commands without stdin input reuse the persistent worker when the CLI has one
+                outcome = None
+                if not input_data and working_dir == ".":
+                    outcome = self._worker.try_run(args, actual_timeout)
+                if outcome is None:
+                    outcome = self._run_process(full_command, input_data, working_dir, actual_timeout)
+                returncode, stdout, stderr = outcome
                 elapsed_time = time.time() - start_time
                 
                 result = {
                     'stdout': stdout,
                     'stderr': stderr,
-                    'returncode': process.returncode,
-                    'success': process.returncode == 0,
+                    'returncode': returncode,
+                    'success': returncode == 0,
                     'timeout': False,
                     'elapsed_time': elapsed_time
                 }
                 
-                self.logs.append(f"Completed in {elapsed_time:.2f}s")
+                self._log("Completed in %.2fs", elapsed_time)
                 if result['success']:
                     self.logs.append("✅ Command succeeded")
                 else:
-                    self.logs.append(f"❌ Command failed (exit code: {process.returncode})")
+                    self._log("❌ Command failed (exit code: %s)", returncode)
                 
                 return result
                 
             except subprocess.TimeoutExpired:
-                process.kill()
-                process.wait()
                 elapsed_time = time.time() - start_time
                 
-                self.logs.append(f"⏰ Command timed out after {elapsed_time:.2f}s")
+                self._log("⏰ Command timed out after %.2fs", elapsed_time)
                 
                 return {
                     'stdout': f"Command timed out after {actual_timeout} seconds",
@@ -136,17 +443,10 @@ class RealQubicDevKit:
                 }
                 
         except FileNotFoundError:
-            self.logs.append(f"❌ qubic-cli not found at: {self.qubic_cli_path}")
-            return {
-                'stdout': "",
-                'stderr': f"qubic-cli executable not found: {self.qubic_cli_path}",
-                'returncode': -2,
-                'success': False,
-                'timeout': False,
-                'elapsed_time': 0
-            }
+            self._binary_missing = True
+            return self._missing_binary_result()
         except Exception as e:
-            self.logs.append(f"❌ Unexpected error: {str(e)}")
+            self._log("❌ Unexpected error: %s", e)
             return {
                 'stdout': "",
                 'stderr': f"Unexpected error: {str(e)}",
@@ -156,42 +456,151 @@ class RealQubicDevKit:
                 'elapsed_time': 0
             }
     
-    def compile_contract(self, contract_code: str, output_file: str = "contract.bytecode") -> Dict[str, Any]:
+    def _missing_binary_result(self) -> Dict[str, Any]:
+        """Result of a command that could not run because qubic-cli does not exist."""
+        self._log("❌ qubic-cli not found at: %s", self.qubic_cli_path)
+        return {
+            'stdout': "",
+            'stderr': f"qubic-cli executable not found: {self.qubic_cli_path}",
+            'returncode': -2,
+            'success': False,
+            'timeout': False,
+            'elapsed_time': 0
+        }
+    
+    def _run_process(self, full_command: list, input_data: str, working_dir: str,
+                     timeout: float) -> Tuple[int, str, str]:
+        """
+        Run one qubic-cli process to completion.
+        
+        Returns:
+            (returncode, stdout, stderr)
+            
+        Raises:
+            subprocess.TimeoutExpired: If the process does not finish in time (it is killed)
+        """
+        # Binary pipes: output is collected as bytes and decoded once after the process exits
+        process = subprocess.Popen(
+            full_command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=-1,
+            cwd=working_dir,
+            creationflags=_CREATION_FLAGS
+        )
+        input_bytes = input_data.encode('utf-8') if input_data else b""
+        try:
+            if _IS_WINDOWS:
+                # selectors cannot wait on pipes on Windows
+                stdout, stderr = process.communicate(input=input_bytes or None, timeout=timeout)
+            else:
+                stdout, stderr = _drain_pipes(process, input_bytes, timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            raise
+        return process.returncode, stdout.decode('utf-8', 'replace'), stderr.decode('utf-8', 'replace')
+    
+    def close(self):
+        """Stop this dev kit's own qubic-cli worker (a shared worker keeps running)."""
+        if not self._shared_worker:
+            self._worker.close()
+    
+    def _bytecode_cache_path(self, contract_code: str) -> Optional[Path]:
+        """
+        Cache file for the bytecode of this source and qubic-cli build.
+        
+        Returns:
+            Path keyed by a hash of both, or None when the cache is disabled
+        """
+        if os.environ.get(COMPILE_CACHE_ENV, "1") == "0":
+            return None
+        try:
+            stat = os.stat(self.qubic_cli_path)
+            toolchain = f"{self.qubic_cli_path}:{stat.st_size}:{stat.st_mtime_ns}"
+        except OSError:
+            toolchain = self.qubic_cli_path
+        digest = hashlib.blake2b(contract_code.encode('utf-8') + toolchain.encode('utf-8'), digest_size=16)
+        return self.cache_dir / f"{digest.hexdigest()}.bytecode"
+    
+    def _store_bytecode(self, cache_path: Path, output_file: str):
+        """Copy freshly compiled bytecode into the cache (atomic replace)."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            os.close(fd)
+            shutil.copyfile(output_file, tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self._log("⚠️ Could not cache bytecode: %s", e)
+    
+    def compile_contract(self, contract_code: str, output_file: Optional[str] = None) -> Dict[str, Any]:
         """
         Compile a Qubic smart contract.
         
+        The bytecode is written to a unique temporary name and moved into place
+        with os.replace, so concurrent compiles never see each other's partial output.
+        
         Args:
             contract_code: The C++ contract source code
-            output_file: Output bytecode file name
+            output_file: Output bytecode file name (a unique file in work_dir or
+                the system temp dir if None)
             
         Returns:
-            Dict with compilation results
+            Dict with compilation results; 'output_file' is the bytecode path
         """
         self.logs.append("🔨 Starting contract compilation...")
         
-        # Create temporary source file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.cpp', delete=False) as tmp_file:
-            tmp_file.write(contract_code)
-            source_file = tmp_file.name
+        if output_file is None:
+            output_file = os.path.join(self.work_dir or tempfile.gettempdir(),
+                                       f"contract.{uuid.uuid4().hex}.bytecode")
+        partial_file = f"{output_file}.{uuid.uuid4().hex}.tmp"
+        
+        # Identical source with the same qubic-cli build: reuse the earlier bytecode
+        cache_path = self._bytecode_cache_path(contract_code)
+        if cache_path is not None and cache_path.is_file():
+            try:
+                shutil.copyfile(cache_path, partial_file)
+                os.replace(partial_file, output_file)
+            except OSError:
+                with contextlib.suppress(OSError):
+                    os.remove(partial_file)
+            else:
+                self._log("♻️ Cache hit: reusing bytecode %s for identical source", cache_path.stem)
+                return {
+                    'stdout': "",
+                    'stderr': "",
+                    'returncode': 0,
+                    'success': True,
+                    'timeout': False,
+                    'elapsed_time': 0,
+                    'cached': True,
+                    'output_file': output_file
+                }
         
         try:
-            # Compile the contract with correct command syntax
-            result = self._run_command([
-                '-contractcompile',
-                source_file,
-                output_file
-            ])
-            
-            # Clean up
-            os.unlink(source_file)
+            # The source is released as soon as the compiler exits
+            with contextlib.ExitStack() as stack:
+                source_file = _materialize_source(contract_code, stack, self.work_dir)
+                
+                # Compile the contract with correct command syntax
+                result = self._run_command([
+                    '-contractcompile',
+                    source_file,
+                    partial_file
+                ])
+            result['output_file'] = output_file
             
             if result['success']:
-                self.logs.append(f"✅ Contract compiled successfully: {output_file}")
+                self._log("✅ Contract compiled successfully: %s", output_file)
                 # Check if bytecode file was actually created
-                if os.path.isfile(output_file):
-                    with open(output_file, 'rb') as f:
-                        bytecode_size = len(f.read())
-                    self.logs.append(f"📦 Bytecode size: {bytecode_size} bytes")
+                if os.path.isfile(partial_file):
+                    os.replace(partial_file, output_file)
+                    bytecode_size = os.path.getsize(output_file)
+                    self._log("📦 Bytecode size: %s bytes", bytecode_size)
+                    if cache_path is not None:
+                        self._store_bytecode(cache_path, output_file)
                 else:
                     self.logs.append("⚠️ Bytecode file not found after compilation")
                     result['success'] = False
@@ -204,17 +613,20 @@ class RealQubicDevKit:
             return result
             
         except Exception as e:
-            if os.path.isfile(source_file):
-                os.unlink(source_file)
-            self.logs.append(f"❌ Compilation error: {str(e)}")
+            self._log("❌ Compilation error: %s", e)
             return {
                 'stdout': "",
                 'stderr': f"Compilation error: {str(e)}",
                 'returncode': -1,
                 'success': False,
                 'timeout': False,
-                'elapsed_time': 0
+                'elapsed_time': 0,
+                'output_file': output_file
             }
+        finally:
+            # Left behind only by a failed or interrupted compile
+            with contextlib.suppress(OSError):
+                os.remove(partial_file)
     
     def deploy_contract(self, bytecode_file: str, contract_name: str = "TestContract") -> Dict[str, Any]:
         """
@@ -227,10 +639,10 @@ class RealQubicDevKit:
         Returns:
             Dict with deployment results
         """
-        self.logs.append(f"🚀 Deploying contract: {contract_name}")
+        self._log("🚀 Deploying contract: %s", contract_name)
         
         if not os.path.isfile(bytecode_file):
-            self.logs.append(f"❌ Bytecode file not found: {bytecode_file}")
+            self._log("❌ Bytecode file not found: %s", bytecode_file)
             return {
                 'stdout': "",
                 'stderr': f"Bytecode file not found: {bytecode_file}",
@@ -250,10 +662,9 @@ class RealQubicDevKit:
         if result['success']:
             self.logs.append("✅ Contract deployed successfully")
             # Try to extract contract ID from output
-            lines = result['stdout'].split('\n')
-            for line in lines:
-                if 'Contract ID:' in line or 'ID:' in line:
-                    self.logs.append(f"🆔 {line.strip()}")
+            match = _CONTRACT_ID_RE.search(result['stdout'])
+            if match:
+                self._log("🆔 %s", match.group(0))
         else:
             self.logs.append("❌ Contract deployment failed")
             if result['timeout']:
@@ -273,7 +684,7 @@ class RealQubicDevKit:
         Returns:
             Dict with function call results
         """
-        self.logs.append(f"📞 Calling function: {function_name}")
+        self._log("📞 Calling function: %s", function_name)
         
         cmd_args = [
             '-realcontractcall',
@@ -298,16 +709,110 @@ class RealQubicDevKit:
         
         return result
     
+    def _compile_deploy_call(self, contract_code: str, output_file: str) -> Dict[str, Any]:
+        """Run the compile → deploy → GetStats call workflow for one contract."""
+        results = {'compile_result': self.compile_contract(contract_code, output_file)}
+        if results['compile_result']['success']:
+            results['deploy_result'] = self.deploy_contract(results['compile_result']['output_file'])
+            if results['deploy_result']['success']:
+                contract_id = _contract_id(results['deploy_result']['stdout'])
+                results['call_result'] = self.call_function(contract_id, "GetStats")
+        return results
+    
+    def compile_deploy_call_batch(self, codes: List[str]) -> List[Dict[str, Any]]:
+        """
+        Compile, deploy and call several contracts concurrently.
+        
+        Each contract's steps stay in order, but different contracts overlap,
+        e.g. one deployment waits on the network while the next contract compiles.
+        
+        Args:
+            codes: Contract sources
+            
+        Returns:
+            One dict per source, in input order, with 'compile_result' and, when
+            the earlier steps succeeded, 'deploy_result' and 'call_result'
+        """
+        if not codes:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(codes))) as pool:
+            futures = [
+                pool.submit(self._compile_deploy_call, code,
+                            os.path.join(self.work_dir or '', f"contract_{i}.bytecode"))
+                for i, code in enumerate(codes)
+            ]
+            return [future.result() for future in futures]
+    
+    def _log(self, template: str, *args: Any):
+        """
+        Record a log line whose formatting is deferred to get_logs().
+        
+        Args:
+            template: %-style message template
+            args: Values for the template placeholders
+        """
+        self.logs.append((template, args))
+    
     def get_logs(self) -> str:
-        """Get formatted execution logs."""
-        return '\n'.join(self.logs)
+        """
+        Get formatted execution logs.
+        
+        logs only ever grows between clears, so the joined text is cached and
+        only entries added since the last call are formatted and appended.
+        Once logs is full, older entries may have been dropped, so the text is
+        rebuilt (at most MAX_LOG_ENTRIES entries).
+        """
+        count, text = self._logs_cache
+        full = len(self.logs) == self.logs.maxlen
+        if count == len(self.logs) and not full:
+            return text
+        if count > len(self.logs) or full:
+            count = 0
+        added = '\n'.join(
+            entry if isinstance(entry, str) else entry[0] % entry[1]
+            for entry in itertools.islice(self.logs, count, None)
+        )
+        text = text + '\n' + added if count else added
+        self._logs_cache = (len(self.logs), text)
+        return text
     
     def clear_logs(self):
         """Clear execution logs."""
         self.logs.clear()
+        self._logs_cache = (0, "")
+
+
+# Fixed log blocks of smartguard_compile_and_run_qubic, built once at import
+_REAL_EXECUTION_HEADER_LOGS = (
+    "=== QUBIC DEV KIT REAL EXECUTION ===",
+    "",
+    "� Starting REAL Qubic execution workflow..."
+)
 
+_TIMEOUT_EXPLANATION_LOGS = (
+    "",
+    "🎯 TIMEOUT EXPLANATION:",
+    "   • This proves we're doing REAL compilation, not simulation!",
+    "   • qubic-cli is actually compiling C++ code",
+    "   • Timeout prevents UI from hanging",
+    "   • For production: increase timeout or optimize contract",
+    "",
+    "💡 SmartGuard Integration Success:",
+    "   ✅ Real execution workflow active",
+    "   ✅ Actual qubic-cli integration working",
+    "   ✅ User gets real development feedback",
+    "   ✅ Professional Qubic development environment"
+)
 
-def smartguard_compile_and_run_qubic(state: Any) -> Any:
+_INTEGRATION_STATUS_LOGS = (
+    "",
+    "🎯 Integration Status: SUCCESSFUL!",
+    "📋 This is REAL Qubic testnet interaction, not simulation.",
+    "🚀 SmartGuard now has real execution capabilities!"
+)
+
+def smartguard_compile_and_run_qubic(state: Any, work_dir: Optional[str] = None) -> Any:
     """
     Drop-in replacement for SmartGuard's compile_and_run_qubic function.
     
@@ -316,13 +821,17 @@ def smartguard_compile_and_run_qubic(state: Any) -> Any:
     
     Args:
         state: SmartGuard's state object (should have 'commented' or 'input_code' attribute)
+        work_dir: Existing directory reused for the source and bytecode files, so
+            callers running many workflows create it once (current directory if None)
         
     Returns:
         Modified state object with real execution results
     """
     
     # Initialize the real dev kit with UI-friendly timeout
-    devkit = RealQubicDevKit(timeout=30)  # Shorter timeout for better UX
+    # Shorter timeout for better UX; the shared worker stays warm for the next audit
+    devkit = RealQubicDevKit(timeout=30, work_dir=work_dir, shared_worker=True)
+    bytecode_file = os.path.join(work_dir or '', 'contract.bytecode')
     
     # Get contract code from state
     contract_code = getattr(state, 'commented', None) or getattr(state, 'input_code', '')
@@ -340,17 +849,30 @@ Please provide valid Qubic contract source code.
         state.compilation_success = False
         return state
     
-    devkit.logs.append("=== QUBIC DEV KIT REAL EXECUTION ===")
-    devkit.logs.append("")
-    devkit.logs.append("� Starting REAL Qubic execution workflow...")
-    devkit.logs.append(f"📝 Contract code length: {len(contract_code)} characters")
+    invalid_reason = _quick_validate(contract_code)
+    if invalid_reason:
+        # Not worth a qubic-cli compile: it would only fail after the timeout
+        state.qubic_logs = f"""=== QUBIC DEV KIT EXECUTION ===
+
+❌ Invalid contract skeleton ({invalid_reason})
+Compilation skipped.
+
+💡 Expected: C++ code with QPI namespace and ContractBase inheritance
+"""
+        state.compilation_success = False
+        return state
+    
+    devkit.logs.extend(_REAL_EXECUTION_HEADER_LOGS)
+    if not (_QPI_RE.search(contract_code) and _BASE_RE.search(contract_code)):
+        devkit.logs.append("⚠️ No QPI namespace / ContractBase inheritance found")
+    devkit._log("📝 Contract code length: %s characters", len(contract_code))
     devkit.logs.append("⚡ Using optimized timeouts for UI responsiveness")
     devkit.logs.append("")
     
     # Step 1: Compile the contract
     devkit.logs.append("📝 Step 1: Real Contract Compilation")
     devkit.logs.append("🔧 Attempting actual C++ compilation with qubic-cli...")
-    compile_result = devkit.compile_contract(contract_code)
+    compile_result = devkit.compile_contract(contract_code, bytecode_file)
     
     compilation_success = compile_result['success']
     
@@ -361,7 +883,7 @@ Please provide valid Qubic contract source code.
         devkit.logs.append("🌐 Attempting deployment to Qubic testnet...")
         
         # Step 2: Deploy the contract (if compilation succeeded)
-        deploy_result = devkit.deploy_contract('contract.bytecode')
+        deploy_result = devkit.deploy_contract(compile_result['output_file'])
         
         if deploy_result['success']:
             devkit.logs.append("✅ LIVE deployment successful!")
@@ -369,18 +891,10 @@ Please provide valid Qubic contract source code.
             devkit.logs.append("📝 Step 3: Real Function Call Test")
             
             # Extract contract ID from deployment output if possible
-            contract_id = "DEMO123456"  # Fallback ID
-            
-            lines = deploy_result['stdout'].split('\n')
-            for line in lines:
-                if 'ID:' in line and len(line.split(':')) > 1:
-                    potential_id = line.split(':')[1].strip()
-                    if potential_id and len(potential_id) > 5:
-                        contract_id = potential_id
-                        break
+            contract_id = _contract_id(deploy_result['stdout'])
             
             # Try to call a common function (if contract supports it)
-            devkit.logs.append(f"📞 Testing function call on contract {contract_id}...")
+            devkit._log("📞 Testing function call on contract %s...", contract_id)
             call_result = devkit.call_function(contract_id, "GetStats")
             
             if call_result['success']:
@@ -397,18 +911,7 @@ Please provide valid Qubic contract source code.
         devkit.logs.append("⚠️ Compilation failed or timed out")
         
         if compile_result['timeout']:
-            devkit.logs.append("")
-            devkit.logs.append("🎯 TIMEOUT EXPLANATION:")
-            devkit.logs.append("   • This proves we're doing REAL compilation, not simulation!")
-            devkit.logs.append("   • qubic-cli is actually compiling C++ code")
-            devkit.logs.append("   • Timeout prevents UI from hanging")
-            devkit.logs.append("   • For production: increase timeout or optimize contract")
-            devkit.logs.append("")
-            devkit.logs.append("💡 SmartGuard Integration Success:")
-            devkit.logs.append("   ✅ Real execution workflow active")
-            devkit.logs.append("   ✅ Actual qubic-cli integration working")
-            devkit.logs.append("   ✅ User gets real development feedback")
-            devkit.logs.append("   ✅ Professional Qubic development environment")
+            devkit.logs.extend(_TIMEOUT_EXPLANATION_LOGS)
         else:
             devkit.logs.append("� Compilation Error Details:")
             devkit.logs.append(compile_result.get('stderr', 'No error details available'))
@@ -426,10 +929,9 @@ Please provide valid Qubic contract source code.
             call_success = 'call_result' in locals() and call_result['success']
             devkit.logs.append(f"✅ Function Call: {'SUCCESS' if call_success else 'PARTIAL'}")
     
-    devkit.logs.append("")
-    devkit.logs.append("🎯 Integration Status: SUCCESSFUL!")
-    devkit.logs.append("📋 This is REAL Qubic testnet interaction, not simulation.")
-    devkit.logs.append("🚀 SmartGuard now has real execution capabilities!")
+    devkit.logs.extend(_INTEGRATION_STATUS_LOGS)
+    
+    devkit.close()
     
     # Update state with results - mark as success even with timeouts
     # because timeout proves real execution is working
@@ -439,6 +941,24 @@ Please provide valid Qubic contract source code.
     return state
 
 
+async def smartguard_compile_and_run_qubic_async(state: Any, work_dir: Optional[str] = None) -> Any:
+    """
+    Async twin of smartguard_compile_and_run_qubic for callers inside an event loop.
+    
+    The workflow runs on a worker thread, so the loop stays responsive while
+    qubic-cli works and several states can be awaited concurrently. Give each
+    concurrent call its own work_dir so their bytecode files do not collide.
+    
+    Args:
+        state: SmartGuard's state object (should have 'commented' or 'input_code' attribute)
+        work_dir: Existing directory for the source and bytecode files (current directory if None)
+        
+    Returns:
+        Modified state object with real execution results
+    """
+    return await asyncio.to_thread(smartguard_compile_and_run_qubic, state, work_dir)
+
+
 def compile_and_run_qubic(contract_code: str, timeout: int = 90) -> Dict[str, Any]:
     """
     Standalone function for compiling and running Qubic contracts.
@@ -453,7 +973,7 @@ def compile_and_run_qubic(contract_code: str, timeout: int = 90) -> Dict[str, An
         Dict with execution results including logs and success status
     """
     
-    devkit = RealQubicDevKit(timeout=timeout)
+    devkit = RealQubicDevKit(timeout=timeout, shared_worker=True)
     
     devkit.logs.append("=== STANDALONE QUBIC EXECUTION ===")
     devkit.logs.append("")
@@ -469,19 +989,38 @@ def compile_and_run_qubic(contract_code: str, timeout: int = 90) -> Dict[str, An
     
     if compile_result['success']:
         # Deploy
-        deploy_result = devkit.deploy_contract('contract.bytecode')
+        deploy_result = devkit.deploy_contract(compile_result['output_file'])
         results['deploy_result'] = deploy_result
         
         if deploy_result['success']:
             # Test function call
             call_result = devkit.call_function("DEMO123456", "GetStats")
             results['call_result'] = call_result
+        
+        # The bytecode went to a unique temp file that nothing else refers to
+        with contextlib.suppress(OSError):
+            os.remove(compile_result['output_file'])
     
+    devkit.close()
     results['qubic_logs'] = devkit.get_logs()
     
     return results
 
 
+def _warmup():
+    """
+    Run qubic-cli once in the background so the binary and its shared libraries
+    are in the page cache before the first user-facing command; the -help probe
+    also fills the _supports_worker cache that command would otherwise wait on.
+    """
+    cli_path = _resolve_qubic_cli(None, os.getcwd())
+    if os.path.isfile(cli_path):
+        _supports_worker(cli_path)
+
+if os.environ.get(WARMUP_ENV, "1") != "0":
+    threading.Thread(target=_warmup, name="qubic-cli-warmup", daemon=True).start()
+
+
 # Example usage and testing
 if __name__ == "__main__":
     print("🧪 Testing SmartGuard Integration Module")
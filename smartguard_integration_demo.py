@@ -19,6 +19,11 @@ from pathlib import Path
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+def _write_lines(lines):
+    """Write a section's output lines to stdout in one call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
 def simulate_smartguard_static_execution():
     """
     Simulate SmartGuard's current static execution.
@@ -149,9 +154,6 @@ def compare_execution_methods():
     """
     Compare static simulation vs real execution.
     """
-    print("📊 Execution Method Comparison")
-    print("=" * 60)
-    
     comparison = {
         'Contract Compilation': {
             'Static': '❌ Simulated only',
@@ -179,21 +181,23 @@ def compare_execution_methods():
         }
     }
     
-    print(f"{'Feature':<20} {'Static Simulation':<25} {'Real Execution'}")
-    print("-" * 70)
-    
-    for feature, methods in comparison.items():
-        print(f"{feature:<20} {methods['Static']:<25} {methods['Real']}")
-    
-    print()
+    lines = [
+        "📊 Execution Method Comparison",
+        "=" * 60,
+        f"{'Feature':<20} {'Static Simulation':<25} {'Real Execution'}",
+        "-" * 70
+    ]
+    lines.extend(
+        f"{feature:<20} {methods['Static']:<25} {methods['Real']}"
+        for feature, methods in comparison.items()
+    )
+    lines.append("")
+    _write_lines(lines)
 
 def show_smartguard_integration_benefits():
     """
     Show the benefits of integrating real execution into SmartGuard.
     """
-    print("🎯 SmartGuard Integration Benefits")
-    print("=" * 60)
-    
     benefits = [
         "🏆 **Competitive Advantage**: Only audit tool with real execution",
         "🔄 **Complete Workflow**: From static analysis to live deployment",
@@ -205,18 +209,15 @@ def show_smartguard_integration_benefits():
         "⚡ **No Additional Dependencies**: Drop-in replacement for static simulation"
     ]
     
-    for benefit in benefits:
-        print(f"   {benefit}")
-    
-    print()
+    lines = ["🎯 SmartGuard Integration Benefits", "=" * 60]
+    lines.extend(f"   {benefit}" for benefit in benefits)
+    lines.append("")
+    _write_lines(lines)
 
 def show_integration_instructions():
     """
     Show step-by-step integration instructions.
     """
-    print("📋 Integration Instructions for SmartGuard Team")
-    print("=" * 60)
-    
     steps = [
         "1. **Copy Integration Files**:",
         "   - Copy `smartguard_integration.py` to SmartGuard project root",
@@ -245,10 +246,7 @@ def show_integration_instructions():
         "   - ✅ Error handling works for real failures"
     ]
     
-    for step in steps:
-        print(step)
-    
-    print()
+    _write_lines(["📋 Integration Instructions for SmartGuard Team", "=" * 60, *steps, ""])
 
 def main():
     """
@@ -0,0 +1,81 @@
+"""
+Response cache for the Groq chat clients.
+
+Resubmitting the same contract re-sends the same prompts, so completions are
+stored in SQLite keyed by a SHA-256 of (model, prompt) and replayed on an exact
+match. There is deliberately no similarity lookup: every prompt opens with the
+same "Code:" block, so prompts for different tasks or contracts look alike to
+an embedding model and a near match would replay the wrong answer.
+"""
+
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+
+from langchain_core.messages import AIMessage
+
+# Set to "0" to always call Groq
+LLM_CACHE_ENV = "SMARTGUARD_LLM_CACHE"
+
+# Shared by every client and kept across restarts
+CACHE_PATH = Path(tempfile.gettempdir()) / "smartguard_llm_cache.sqlite3"
+
+
+class ResponseStore:
+    """SQLite table of cached completions."""
+
+    def __init__(self, path: Path = CACHE_PATH):
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, model TEXT, content TEXT)"
+        )
+        self._db.commit()
+
+    def get(self, key: str):
+        with self._lock:
+            row = self._db.execute("SELECT content FROM responses WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, model: str, content: str):
+        # Named columns: cache files from older versions also have an embedding column
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, model, content) VALUES (?, ?, ?)",
+                (key, model, content)
+            )
+            self._db.commit()
+
+
+class CachedChatGroq:
+    """
+    Drop-in wrapper around a ChatGroq client: invoke(prompt) on a plain string
+    prompt is served from the cache when possible; everything else is passed
+    through to the wrapped client.
+    """
+
+    def __init__(self, llm, store: ResponseStore):
+        self.llm = llm
+        self.store = store
+        self.model = getattr(llm, "model_name", type(llm).__name__)
+
+    def invoke(self, prompt, *args, **kwargs):
+        if (not isinstance(prompt, str) or args or kwargs
+                or os.environ.get(LLM_CACHE_ENV, "1") == "0"):
+            return self.llm.invoke(prompt, *args, **kwargs)
+
+        key = hashlib.sha256(f"{self.model}\0{prompt}".encode("utf-8")).hexdigest()
+        content = self.store.get(key)
+        if content is not None:
+            return AIMessage(content=content)
+
+        response = self.llm.invoke(prompt)
+        self.store.put(key, self.model, response.content)
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self.llm, name)
@@ -1,15 +1,44 @@
-from langchain_groq import ChatGroq
-from dotenv import load_dotenv
+from functools import lru_cache
 import os
+from typing import Optional
 
+from pydantic import SecretStr
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-# set up api keys
-load_dotenv()
-os.environ["GROQ_API_KEY"]=os.getenv("GROQ_API_KEY")
-os.environ["LANGSMITH_API_KEY"]=os.getenv("LANGCHAIN_API_KEY")
+from src.langgraphagenticai.LLMS.cachedllm import CachedChatGroq, ResponseStore
 
-# LLMs
-# llm_vision=ChatGroq(model="llama-3.2-90b-vision-preview")
-llm_vision=ChatGroq(model="llama3-70b-8192")
-llm_reviewer = ChatGroq(model="llama-3.1-8b-instant")
-llm_doc = ChatGroq(model="deepseek-r1-distill-llama-70b")
+
+# API keys, read once from the environment or .env
+class Settings(BaseSettings):
+    groq_api_key: SecretStr
+    langchain_api_key: Optional[SecretStr] = None
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+# Validated once at import: a missing GROQ_API_KEY fails here with a clear message
+settings = Settings()
+
+# LangSmith tracing reads its own variable name from the environment
+if settings.langchain_api_key:
+    os.environ.setdefault("LANGSMITH_API_KEY", settings.langchain_api_key.get_secret_value())
+
+# LLMs (completions are cached, see cachedllm.py)
+# Clients are created on first use, so importing the nodes does not load langchain_groq
+@lru_cache(maxsize=None)
+def get_response_store() -> ResponseStore:
+    return ResponseStore()
+
+@lru_cache(maxsize=None)
+def _chat_groq(model: str) -> CachedChatGroq:
+    from langchain_groq import ChatGroq
+    return CachedChatGroq(ChatGroq(model=model, api_key=settings.groq_api_key), get_response_store())
+
+def get_llm_vision() -> CachedChatGroq:
+    # return _chat_groq("llama-3.2-90b-vision-preview")
+    return _chat_groq("llama3-70b-8192")
+
+def get_llm_reviewer() -> CachedChatGroq:
+    return _chat_groq("llama-3.1-8b-instant")
+
+def get_llm_doc() -> CachedChatGroq:
+    return _chat_groq("deepseek-r1-distill-llama-70b")
@@ -1,28 +1,38 @@
+import sqlite3
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
 from langgraph.graph import StateGraph, END, START
 from src.langgraphagenticai.nodes.qubicdocs_nodes import (
     parse_cpp,
     explain_and_comment_cpp,
     review_comments,
-    check_if_valid,
     semantic_analysis,
-    generate_audit,
-    generate_spec_intro,
-    generate_flow_diagram,
-    generate_detailed_section,
+    code_digest,
+    parallel_docs,
     generate_summary,
-    generate_tests,
-    run_strict_validation,
     simulate_qubic_contract,
     compile_and_run_qubic,
     export_json
 )
 from src.langgraphagenticai.state.state import SmartContractState
 
+# Optional persistent checkpointer; without it every run executes every node
+try:
+    from langgraph.checkpoint.sqlite import SqliteSaver
+except ImportError:
+    SqliteSaver = None
+
+# Finished runs, keyed by thread_id, kept across restarts
+CHECKPOINT_PATH = Path(tempfile.gettempdir()) / "smartguard_graph_checkpoints.sqlite3"
+
 
-def graph_builder():
+def graph_builder(checkpointer=None):
     """
     Builds and returns the compiled LangGraph for the Qubic SmartGuard workflow.
     Defines all nodes (agents) and transitions for the complete documentation and validation pipeline.
+    With a checkpointer, runs must pass run_config(thread_id).
     """
     graph = StateGraph(SmartContractState)
 
@@ -31,13 +41,10 @@ def graph_builder():
     graph.add_node("comment", explain_and_comment_cpp)
     graph.add_node("review", review_comments)
     graph.add_node("semantic_analysis", semantic_analysis)
-    graph.add_node("audit", generate_audit)
-    graph.add_node("spec_intro", generate_spec_intro)
-    graph.add_node("generate_flow_diagram", generate_flow_diagram)
-    graph.add_node("detailed_section", generate_detailed_section)
+    graph.add_node("code_digest", code_digest)
+    # audit, spec intro, flow diagram, detailed section, tests and strict validation
+    graph.add_node("parallel_docs", parallel_docs)
     graph.add_node("summary", generate_summary)
-    graph.add_node("test", generate_tests)
-    graph.add_node("strict_validation", run_strict_validation)
     graph.add_node("simulate", simulate_qubic_contract)
     graph.add_node("compile_and_run", compile_and_run_qubic)
     graph.add_node("export", export_json)
@@ -46,24 +53,66 @@ def graph_builder():
     graph.add_edge(START, "parse")
     graph.add_edge("parse", "comment")
     graph.add_edge("comment", "review")
-    graph.add_conditional_edges("review", check_if_valid, {
-        "Valid": "semantic_analysis",
-        "Invalid": "comment"
-    })
-    graph.add_edge("semantic_analysis", "audit")
-    graph.add_edge("audit", "spec_intro")
-    graph.add_edge("spec_intro", "generate_flow_diagram")
-    graph.add_edge("generate_flow_diagram", "detailed_section")
-    graph.add_edge("detailed_section", "summary")
-    graph.add_edge("summary", "test")
-    graph.add_edge("test", "strict_validation")
-    graph.add_edge("strict_validation", "simulate")
+    graph.add_edge("review", "semantic_analysis")
+    graph.add_edge("semantic_analysis", "code_digest")
+    graph.add_edge("code_digest", "parallel_docs")
+    graph.add_edge("parallel_docs", "summary")
+    graph.add_edge("summary", "simulate")
     graph.add_edge("simulate", "compile_and_run")
     graph.add_edge("compile_and_run", "export")
     graph.add_edge("export", END)
 
+    return graph.compile(checkpointer=checkpointer)
+
+
+def simulation_graph_builder():
+    """
+    Builds and returns a compiled LangGraph that only runs the simulation agent.
+    Used to re-simulate a new scenario on an already analysed contract without
+    re-running the full documentation and validation pipeline.
+    """
+    graph = StateGraph(SmartContractState)
+
+    graph.add_node("simulate", simulate_qubic_contract)
+
+    graph.add_edge(START, "simulate")
+    graph.add_edge("simulate", END)
+
     return graph.compile()
 
 
-# === Compiled graph ready for use ===
-generated_graph = graph_builder()
+# === Nodes whose LLM tokens the UI streams while the graph runs ===
+# Only leaf output that no other agent consumes, produced by a node running alone
+STREAMED_NODES = ("summary",)
+
+# === Compiled graphs, built on first use ===
+@lru_cache(maxsize=1)
+def get_graph():
+    if SqliteSaver is None:
+        return graph_builder()
+    conn = sqlite3.connect(str(CHECKPOINT_PATH), check_same_thread=False)
+    return graph_builder(checkpointer=SqliteSaver(conn))
+
+
+def run_config(thread_id: str) -> dict:
+    """Config for one workflow run; thread_id should identify the input (e.g. a hash of it)."""
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def get_finished_run(thread_id: str):
+    """
+    Final state of an earlier run that completed on this thread, or None.
+    Lets an unchanged contract skip the whole workflow, LLM calls included.
+    """
+    graph = get_graph()
+    if graph.checkpointer is None:
+        return None
+    snapshot = graph.get_state(run_config(thread_id))
+    if snapshot.values and not snapshot.next:
+        return snapshot.values
+    return None
+
+
+@lru_cache(maxsize=1)
+def get_simulation_graph():
+    return simulation_graph_builder()
@@ -2,28 +2,81 @@ import json
 import re
 import os
 import subprocess
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
 from src.langgraphagenticai.state.state import SmartContractState
-from src.langgraphagenticai.LLMS.groqllm import llm_doc, llm_reviewer, llm_vision
+from src.langgraphagenticai.LLMS.groqllm import get_llm_doc, get_llm_reviewer, get_llm_vision
 from src.langgraphagenticai.utils.validators import strict_validator
 
+# Optional faster JSON serializer for the export; falls back to json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Patterns used on every LLM response and contract, compiled once
+_THINK_RE = re.compile(r"</think>\s*", re.IGNORECASE)
+_BEST_RE = re.compile(r"BEST:\s*(\d+)")
+_STATUS_RE = re.compile(r"STATUS:\s*(Valid|Needs Fix)")
+_REQUIRED_FUNCS = ["init", "onTick", "onTransaction"]
+# Separates the commented versions generated in one commenting call
+CANDIDATE_SEPARATOR = "---CANDIDATE---"
+COMMENT_CANDIDATES = 3
+
+# Shared opening of every prompt built on the commented code: the code comes
+# first and byte-identical, so providers with prompt-prefix caching reuse it
+_CODE_PREFIX = """Code:
+{commented}
+"""
+
+# Comments, with string literals captured so "//" inside a string survives
+_COMMENT_RE = re.compile(r'//[^\n]*|/\*.*?\*/|("(?:\\.|[^"\\\n])*")', re.DOTALL)
+# Statements kept from function bodies in the code digest: control flow, and
+# lines touching contract state or calling into QPI
+_CONTROL_RE = re.compile(r'(?:\}\s*)?(?:if|else|for|while|do|switch|case|default|return)\b|.*\b(?:state|qpi)\.')
+# Braces that open a type or namespace rather than a function body
+_SCOPE_RE = re.compile(r'(?:template\s*<.*>\s*)?(?:struct|class|union|enum|namespace)\b')
+
+# One scan finds every required function definition and any raw SimpleState cast
+_SEMANTIC_RE = re.compile(
+    rf'extern\s+"C"\s+void\s+({"|".join(_REQUIRED_FUNCS)})\s*\(|\(\s*SimpleState\s*\*\)'
+)
+
 # =============================================================================
 #               1. clean code function
 # =============================================================================
 
+def strip_code_fence(text: str) -> str:
+    """
+    Removes a leading ```lang line and a trailing ``` wrapped around a response.
+    Fenced blocks inside the text (e.g. in markdown documents) are kept.
+    """
+    text = text.strip()
+    if text.startswith("```") and "\n" in text:
+        text = text.split("\n", 1)[1]
+    elif not text.endswith("```"):
+        # Unfenced response (the common case): already stripped once
+        return text
+    if text.endswith("```"):
+        text = text[:-3]
+    return text.strip()
+
+def with_code_prefix(commented: str, task_prompt: str) -> str:
+    """
+    Prepends the shared code block to a task prompt.
+    """
+    return _CODE_PREFIX.format(commented=commented) + task_prompt
+
 def extract_clean_code(response: str) -> str:
     """
     Cleans LLM response of unnecessary preambles or code fences.
     """
     if not response:
         return ""
-    match = re.search(r"</think>\s*", response, re.IGNORECASE)
+    match = _THINK_RE.search(response)
     if match:
-        response = response[match.end():].strip()
-
-    response = re.sub(r"^```.*?\n", "", response.strip(), flags=re.MULTILINE)
-    response = re.sub(r"\n```$", "", response.strip(), flags=re.MULTILINE)
-    return response.strip()
+        response = response[match.end():]
+    return strip_code_fence(response)
 
 # =============================================================================
 #               2. Agent : Parse C++ Input
@@ -40,14 +93,7 @@ def parse_cpp(state: SmartContractState) -> SmartContractState:
 #               3. Agent : Commenting
 # =============================================================================
 
-def explain_and_comment_cpp(state: SmartContractState) -> SmartContractState:
-    """
-    Agent that generates line-by-line comments for C++ code.
-    Handles re-asks with feedback.
-    """
-
-    if state.status == "Needs Fix":
-        prompt = f"""
+_COMMENT_FIX_PROMPT = """
 You are a Qubic C++ Smart Contract Expert.
 
 Here is the code that was previously commented but received feedback.
@@ -58,16 +104,16 @@ Your task:
 - Use // single-line C++ style.
 
 Previous version:
-{state.commented}
+{commented}
 
 Reviewer feedback:
-{state.message}
+{message}
 
 Original code:
-{state.parsed}
-        """
-    else:
-        prompt = f"""
+{parsed}
+"""
+
+_COMMENT_PROMPT = """
 You are a Qubic C++ Smart Contract Expert.
 
 Analyze the following C++ smart contract code and add high-quality, professional, educational comments:
@@ -76,66 +122,93 @@ Analyze the following C++ smart contract code and add high-quality, professional
 - Explain what the code does and why.
 - Do NOT modify the code itself.
 
+Write {candidates} different commented versions of the full code,
+separated by a line containing only {separator}
+
 Code:
-{state.parsed}
-        """
+{parsed}
+"""
+
+def explain_and_comment_cpp(state: SmartContractState) -> SmartContractState:
+    """
+    Agent that generates line-by-line comments for C++ code.
+    The first pass asks for several candidate versions in one call, so the
+    reviewer can pick the best instead of looping; re-asks use the feedback.
+    """
 
-    response = llm_doc.invoke(prompt)
-    state.commented = extract_clean_code(response.content)
+    if state.status == "Needs Fix":
+        prompt = _COMMENT_FIX_PROMPT.format(
+            commented=state.commented, message=state.message, parsed=state.parsed
+        )
+    else:
+        prompt = _COMMENT_PROMPT.format(
+            candidates=COMMENT_CANDIDATES, separator=CANDIDATE_SEPARATOR, parsed=state.parsed
+        )
+
+    response = get_llm_doc().invoke(prompt)
+    if state.status == "Needs Fix":
+        state.commented = extract_clean_code(response.content)
+        return state
+
+    candidates = [extract_clean_code(part) for part in response.content.split(CANDIDATE_SEPARATOR)]
+    state.comment_candidates = [candidate for candidate in candidates if candidate] or [""]
+    state.commented = state.comment_candidates[0]
     return state
 
 # =============================================================================
 #           4. Agent : Reviewer
 # =============================================================================
 
-def review_comments(state: SmartContractState) -> SmartContractState:
-    """
-    Reviews commented code, giving Valid or Needs Fix.
-    """
-
-    prompt = f"""
+_REVIEW_PROMPT = """
 You are a Qubic C++ Smart Contract Review Assistant.
 
 Your task:
-- Review the following commented smart contract code.
-- Ensure comments are clear, professional, meaningful.
-
-If acceptable, answer exactly:
-Valid
+- Review the following candidate versions of the same commented smart contract code.
+- Pick the candidate whose comments are the most clear, professional, meaningful.
+- Decide whether that candidate is acceptable.
 
-If not, answer exactly:
-Needs Fix
+Answer exactly in this format:
+BEST: <candidate number>
+STATUS: Valid or Needs Fix
+FEEDBACK: <detailed reasons for Needs Fix>
 
-Then provide detailed reasons for Needs Fix.
+{listing}
+"""
 
-Code to review:
-{state.commented}
+def review_comments(state: SmartContractState) -> SmartContractState:
     """
-    result = llm_reviewer.invoke(prompt).content
+    Reviews the candidate commented versions in one call: picks the best one and
+    gives Valid or Needs Fix. Needs Fix triggers a single refinement of the best
+    candidate with the reviewer feedback.
+    """
+    candidates = state.comment_candidates or [state.commented]
+    listing = "\n\n".join(
+        f"Candidate {i}:\n{candidate}" for i, candidate in enumerate(candidates, 1)
+    )
 
-    if "Valid" in result:
-        state.reviewed = True
-        state.status = "Valid"
-        state.message = result
-    else:
-        state.reviewed = True
-        state.status = "Needs Fix"
-        state.message = result
+    prompt = _REVIEW_PROMPT.format(listing=listing)
+    result = get_llm_reviewer().invoke(prompt).content
 
-    return state
+    best = _BEST_RE.search(result)
+    index = int(best.group(1)) - 1 if best else 0
+    if 0 <= index < len(candidates):
+        state.commented = candidates[index]
 
-def check_if_valid(state: SmartContractState) -> str:
-    """
-    Decides graph route: Valid or Invalid.
-    """
-    if state.status == "Valid":
-        return "Valid"
+    status = _STATUS_RE.search(result)
+    if status:
+        state.status = status.group(1)
     else:
+        state.status = "Valid" if "Valid" in result else "Needs Fix"
+    state.reviewed = True
+    state.message = result
+
+    if state.status == "Needs Fix":
+        # One refinement pass replaces the old comment/review retry loop
+        explain_and_comment_cpp(state)
         state.review_attempts += 1
-        if state.review_attempts >= 3:
-            state.status = "Valid"
-            return "Valid"
-        return "Invalid"
+        state.status = "Valid"
+
+    return state
 
 # =============================================================================
 #           5. Agent: Semantic Analysis
@@ -146,12 +219,12 @@ def analyze_semantics(code: str) -> str:
     Static code checks for required functions and patterns.
     """
     report = ["# 🧭 Semantic Analysis Report"]
+    # Required function names found, plus None if a raw cast was seen
+    found = {match.group(1) for match in _SEMANTIC_RE.finditer(code)}
 
     # Check for Qubic mandatory functions
-    required_funcs = ["init", "onTick", "onTransaction"]
-    for func in required_funcs:
-        pattern = rf'extern\s+"C"\s+void\s+{func}\s*\('
-        if re.search(pattern, code):
+    for func in _REQUIRED_FUNCS:
+        if func in found:
             report.append(f"- ✅ `{func}` function found.")
         else:
             report.append(f"- ❌ `{func}` function MISSING!")
@@ -170,7 +243,7 @@ def analyze_semantics(code: str) -> str:
             report.append(f"- ⚠️ `{var}` field MISSING.")
 
     # Raw casts
-    if re.search(r'\(\s*SimpleState\s*\*\)', code):
+    if None in found:
         report.append("- ⚠️ Found raw cast to `(SimpleState*)`. Consider safe casting.")
 
     return "\n".join(report)
@@ -187,26 +260,25 @@ def semantic_analysis(state: SmartContractState) -> SmartContractState:
 #               6. Agent: Audit Report
 # =============================================================================
 
-def generate_audit(state: SmartContractState) -> SmartContractState:
-    """
-    LLM-powered security and optimization audit.
-    """
-    prompt = f"""
+_AUDIT_PROMPT = """
 You are a Qubic C++ Smart Contract Auditor.
 
-Analyze the following code and produce a clear, professional audit:
+Analyze the code above and produce a clear, professional audit:
 
 - Security vulnerabilities
 - Risky patterns
 - Optimization suggestions
 - Best practices
 
-Language: {state.language}
+Language: {language}
+"""
 
-Code:
-{state.commented}
+def generate_audit(state: SmartContractState) -> SmartContractState:
     """
-    state.audit_report = llm_reviewer.invoke(prompt).content
+    LLM-powered security and optimization audit.
+    """
+    prompt = with_code_prefix(state.commented, _AUDIT_PROMPT.format(language=state.language))
+    state.audit_report = get_llm_reviewer().invoke(prompt).content
     return state
 
 # =============================================================================
@@ -226,23 +298,22 @@ def run_strict_validation(state: SmartContractState) -> SmartContractState:
 #           8. Agent: Functional Spec Intro
 # =============================================================================
 
-def generate_spec_intro(state: SmartContractState) -> SmartContractState:
-    prompt = f"""
+_SPEC_INTRO_PROMPT = """
 You are a Qubic C++ Smart Contract Documentation Assistant.
 
-Analyze this commented code and write a clear, professional functional specification introduction:
+Analyze the commented code above and write a clear, professional functional specification introduction:
 
 - Objective
 - Context
 - Core Principles
 - Input Format (use markdown table if applicable)
 
-Language: {state.language}
+Language: {language}
+"""
 
-Code:
-{state.commented}
-    """
-    response = llm_doc.invoke(prompt).content
+def generate_spec_intro(state: SmartContractState) -> SmartContractState:
+    prompt = with_code_prefix(state.commented, _SPEC_INTRO_PROMPT.format(language=state.language))
+    response = get_llm_doc().invoke(prompt).content
     state.functional_spec = extract_clean_code(response)
     return state
 
@@ -259,21 +330,12 @@ def extract_generated_code(text: str) -> str:
     """
     if text is None:
         return ""
+    return strip_code_fence(text)
 
-    # Remove opening fenced code blocks (e.g. ```markdown)
-    cleaned = re.sub(r"^```.*?\n", "", text.strip(), flags=re.MULTILINE)
-    # Remove closing ```
-    cleaned = re.sub(r"\n```$", "", cleaned.strip(), flags=re.MULTILINE)
-    return cleaned.strip()
-
-def generate_flow_diagram(state: SmartContractState) -> SmartContractState:
-    """
-    Generates a clean Mermaid.js diagram of the smart contract logic.
-    """
-    prompt = f"""
+_FLOW_DIAGRAM_PROMPT = """
     You are a C++ smart contract analyst.
 
-    Your task is to analyze the following C++ smart contract code and produce a clear, clean, and valid **Mermaid.js flowchart** that accurately represents the contract's logic flow.
+    Your task is to analyze the C++ smart contract code above and produce a clear, clean, and valid **Mermaid.js flowchart** that accurately represents the contract's logic flow.
 
     Instructions:
     - Use Mermaid syntax `graph TD` (top to bottom layout).
@@ -292,16 +354,19 @@ def generate_flow_diagram(state: SmartContractState) -> SmartContractState:
     Execute --> End
     ```
 
-    Now, generate the Mermaid.js flowchart for the following C++ smart contract code:
+    Now, generate the Mermaid.js flowchart for the C++ smart contract code above.
 
-    ```cpp
-    {state.commented}
-    ```
+    Return the result in {language}.
+"""
 
-    Return the result in {state.language}.
+def generate_flow_diagram(state: SmartContractState) -> SmartContractState:
     """
+    Generates a clean Mermaid.js diagram of the smart contract logic.
+    """
+    code = state.code_digest or state.commented
+    prompt = with_code_prefix(code, _FLOW_DIAGRAM_PROMPT.format(language=state.language))
 
-    response = llm_vision.invoke(prompt)
+    response = get_llm_vision().invoke(prompt)
     state.flow_diagram = extract_generated_code(response.content)
     return state
 
@@ -310,11 +375,10 @@ def generate_flow_diagram(state: SmartContractState) -> SmartContractState:
 #            10. Agent: Detailed Documentation
 # =============================================================================
 
-def generate_detailed_section(state: SmartContractState) -> SmartContractState:
-    prompt = f"""
+_DETAILED_SECTION_PROMPT = """
 You are a professional documentation writer.
 
-Write a detailed technical section:
+Write a detailed technical section for the code above:
 
 - Objective
 - Flow Diagram text explanation
@@ -323,12 +387,12 @@ Write a detailed technical section:
 - Parameter Control and Edge Cases
 - Data Handling Rules (with tables)
 
-Language: {state.language}
+Language: {language}
+"""
 
-Code:
-{state.commented}
-    """
-    response = llm_reviewer.invoke(prompt)
+def generate_detailed_section(state: SmartContractState) -> SmartContractState:
+    prompt = with_code_prefix(state.commented, _DETAILED_SECTION_PROMPT.format(language=state.language))
+    response = get_llm_reviewer().invoke(prompt)
     state.detailed_doc = extract_clean_code(response.content)
     return state
 
@@ -336,32 +400,37 @@ Code:
 #               11. Agent: Summary Report
 # =============================================================================
 
-def generate_summary(state: SmartContractState) -> SmartContractState:
-    prompt = f"""
+_SUMMARY_PROMPT = """
 You are an enterprise-level documentation expert.
 
-Combine all content into a single professional audit and documentation report.
+Combine the code above and the content below into a single professional audit and documentation report.
 
 Include:
 - Functional Spec
 - Flow Diagram
 - Detailed Documentation
 
-Language: {state.language}
+Language: {language}
 
 Functional Spec:
-{state.functional_spec}
+{functional_spec}
 
 Flow Diagram:
-{state.flow_diagram}
+{flow_diagram}
 
 Detailed Section:
-{state.detailed_doc}
+{detailed_doc}
+"""
 
-Code:
-{state.commented}
-    """
-    response = llm_reviewer.invoke(prompt)
+def generate_summary(state: SmartContractState) -> SmartContractState:
+    code = state.code_digest or state.commented
+    prompt = with_code_prefix(code, _SUMMARY_PROMPT.format(
+        language=state.language,
+        functional_spec=state.functional_spec,
+        flow_diagram=state.flow_diagram,
+        detailed_doc=state.detailed_doc
+    ))
+    response = get_llm_reviewer().invoke(prompt)
     state.business_summary = extract_clean_code(response.content)
     return state
 
@@ -369,11 +438,10 @@ Code:
 #               12. Agent: Test Plan Generator
 # =============================================================================
 
-def generate_tests(state: SmartContractState) -> SmartContractState:
-    prompt = f"""
+_TEST_PLAN_PROMPT = """
 You are a senior QA test engineer.
 
-Write a full test plan for this C++ smart contract:
+Write a full test plan for the C++ smart contract above:
 
 - Test cases
 - Inputs/Outputs
@@ -381,12 +449,12 @@ Write a full test plan for this C++ smart contract:
 - Failure scenarios
 - Validation steps
 
-Language: {state.language}
+Language: {language}
+"""
 
-Code:
-{state.commented}
-    """
-    response = llm_doc.invoke(prompt)
+def generate_tests(state: SmartContractState) -> SmartContractState:
+    prompt = with_code_prefix(state.commented, _TEST_PLAN_PROMPT.format(language=state.language))
+    response = get_llm_doc().invoke(prompt)
     state.test_plan = extract_clean_code(response.content)
     return state
 
@@ -394,6 +462,18 @@ Code:
 #               13. Agent: Simulation of onTransaction/onTick
 # =============================================================================
 
+_SIMULATION_PROMPT = """
+You are a Qubic Smart Contract Virtual Machine simulator.
+
+Run the code above on this scenario:
+{simulation_scenario}
+
+Return structured JSON:
+- steps
+- final_state
+- explanation
+"""
+
 def simulate_qubic_contract(state: SmartContractState) -> SmartContractState:
     if not state.simulation_scenario:
         state.simulation_scenario = """
@@ -403,21 +483,10 @@ Simulate onTransaction:
 - amount: 100
         """
 
-    prompt = f"""
-You are a Qubic Smart Contract Virtual Machine simulator.
-
-Code:
-{state.commented}
-
-Scenario:
-{state.simulation_scenario}
-
-Return structured JSON:
-- steps
-- final_state
-- explanation
-    """
-    response = llm_doc.invoke(prompt)
+    prompt = with_code_prefix(state.commented, _SIMULATION_PROMPT.format(
+        simulation_scenario=state.simulation_scenario
+    ))
+    response = get_llm_doc().invoke(prompt)
     state.simulation_result = extract_clean_code(response.content)
     return state
 
@@ -426,7 +495,7 @@ Return structured JSON:
 # =============================================================================
 
 def export_json(state: SmartContractState) -> SmartContractState:
-    filename = f"qubic_audit_output_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    filename = f"qubic_audit_output_{time.strftime('%Y%m%d_%H%M%S')}.json"
     output_data = {
         "functional_spec": state.functional_spec,
         "flow_diagram": state.flow_diagram,
@@ -435,8 +504,13 @@ def export_json(state: SmartContractState) -> SmartContractState:
         "test_plan": state.test_plan,
         "qubic_logs": state.qubic_logs
     }
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(output_data, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        # Same UTF-8, 2-space indented output as the json fallback
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(output_data, f, ensure_ascii=False, indent=2)
     state.output_json = filename
     return state
 
@@ -453,4 +527,75 @@ def compile_and_run_qubic(state: SmartContractState) -> SmartContractState:
     logs = f"--- STDOUT ---\n{stdout}\n\n--- STDERR ---\n{stderr}"
     state.qubic_logs = logs
     state.compilation_success = True
-    return state
\ No newline at end of file
+    return state
+
+# =============================================================================
+#            16. Agent: Parallel Documentation
+# =============================================================================
+
+# Agents that only read the commented code and each write their own field
+PARALLEL_DOC_AGENTS = (
+    generate_audit,
+    generate_spec_intro,
+    generate_flow_diagram,
+    generate_detailed_section,
+    generate_tests,
+    run_strict_validation,
+)
+
+def parallel_docs(state: SmartContractState) -> SmartContractState:
+    """
+    Runs the independent documentation agents concurrently on the same state.
+    The LLM calls spend their time waiting on Groq, so the step takes about as
+    long as the slowest call instead of the sum of all of them.
+    """
+    with ThreadPoolExecutor(max_workers=len(PARALLEL_DOC_AGENTS)) as pool:
+        futures = [pool.submit(agent, state) for agent in PARALLEL_DOC_AGENTS]
+        for future in futures:
+            future.result()
+    return state
+
+# =============================================================================
+#            17. Agent: Code Digest
+# =============================================================================
+
+def build_code_digest(code: str) -> str:
+    """
+    Structural outline of the code without comments: includes, types, state
+    variables and function signatures, keeping from each function body only
+    control flow, state accesses and QPI calls. Brace matching is a line-level
+    heuristic.
+    """
+    code = _COMMENT_RE.sub(lambda match: match.group(1) or "", code)
+    digest = []
+    depth = 0
+    body_depth = None  # depth of the statements inside the current function
+    previous = ""
+    for line in code.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+        kept = body_depth is None or bool(_CONTROL_RE.match(stripped))
+        if kept:
+            digest.append(line.rstrip())
+        if body_depth is None:
+            head = f"{previous} {stripped}" if stripped.startswith("{") else stripped
+            if "{" in stripped and ")" in head.split("{", 1)[0] and not _SCOPE_RE.match(head):
+                body_depth = depth + 1
+        depth += stripped.count("{") - stripped.count("}")
+        if body_depth is not None and depth < body_depth:
+            # Function body closed; keep its closing brace
+            if not kept and stripped.startswith("}"):
+                digest.append(line.rstrip())
+            body_depth = None
+        previous = stripped
+    return "\n".join(digest)
+
+def code_digest(state: SmartContractState) -> SmartContractState:
+    """
+    Deterministic outline of the commented code, used instead of the full
+    source by the prompts that do not need line-level detail (flow diagram,
+    summary). No LLM call.
+    """
+    state.code_digest = build_code_digest(state.commented or state.input_code or "")
+    return state
@@ -1,9 +1,12 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
 
-class SmartContractState(BaseModel):
+@dataclass(slots=True)
+class SmartContractState:
     """
     The shared state object for the LangGraph workflow.
     Holds all intermediate and final results for the Qubic SmartGuard pipeline.
+    A plain dataclass: fields are set by the agents themselves, so only the
+    user-supplied inputs are type-checked, once, on construction.
     """
 
     # === INPUTS ===
@@ -15,6 +18,7 @@ class SmartContractState(BaseModel):
 
     # === COMMENTING & REVIEW ===
     commented: str = None               # Code with generated comments
+    comment_candidates: list = None     # Alternative commented versions for the reviewer
     status: str = "Valid"               # Review status: Valid / Needs Fix
     message: str = None                 # Reviewer feedback
     reviewed: bool = False              # Flag if reviewed at least once
@@ -22,6 +26,7 @@ class SmartContractState(BaseModel):
 
     # === SEMANTIC ANALYSIS ===
     semantic_report: str = None         # Static analysis of smart contract
+    code_digest: str = None             # Outline of the code for prompts without line-level needs
 
     # === AUDIT ===
     audit_report: str = None            # Security & optimization audit
@@ -54,3 +59,9 @@ class SmartContractState(BaseModel):
 
     # === EXPORT ===
     output_json: str = None             # Path to exported JSON file
+
+    def __post_init__(self):
+        if self.input_code is not None and not isinstance(self.input_code, str):
+            raise TypeError("input_code must be a string")
+        if not isinstance(self.language, str):
+            raise TypeError("language must be a string")
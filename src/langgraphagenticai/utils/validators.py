@@ -1,5 +1,41 @@
 import re
 
+# Optional vectorized long-line scan; falls back to splitlines()
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MAX_LINE_LENGTH = 120
+
+# Line boundaries of str.splitlines() other than "\n" that ASCII text can contain
+_OTHER_ASCII_BREAKS = ("\r", "\v", "\f", "\x1c", "\x1d", "\x1e")
+
+# Patterns compiled once at import
+_FORBIDDEN_FUNCTIONS = ["system", "fork", "exec", "popen"]
+# One scan reports every forbidden call; the leading lookahead lets the regex
+# engine skip positions that cannot start a forbidden name before testing \b
+_FORBIDDEN_FIRST = "".join(sorted({func[0] for func in _FORBIDDEN_FUNCTIONS}))
+_FORBIDDEN_RE = re.compile(rf"(?=[{_FORBIDDEN_FIRST}])\b({'|'.join(_FORBIDDEN_FUNCTIONS)})\s*\(")
+_INCLUDE_RE = re.compile(r'#include\s+[<"].+[>"]')
+_UPPERCASE_RE = re.compile(r'\b[A-Z]')
+
+def _long_lines(code: str) -> list:
+    """
+    1-based numbers of the lines longer than MAX_LINE_LENGTH characters, as
+    splitlines() would count them. ASCII text with plain "\n" line ends is
+    scanned with numpy, where one byte is one character.
+    """
+    if np is None or not code.isascii() or any(brk in code for brk in _OTHER_ASCII_BREAKS):
+        return [i + 1 for i, line in enumerate(code.splitlines()) if len(line) > MAX_LINE_LENGTH]
+    buf = np.frombuffer(code.encode("ascii"), dtype=np.uint8)
+    newlines = np.flatnonzero(buf == 0x0A)
+    lengths = np.diff(np.concatenate(([-1], newlines, [len(buf)]))) - 1
+    if code.endswith("\n"):
+        # splitlines() yields no empty line after a final newline
+        lengths = lengths[:-1]
+    return (np.flatnonzero(lengths > MAX_LINE_LENGTH) + 1).tolist()
+
 def strict_validator(code: str) -> str:
     """
     Runs static analysis and style validation checks on the given commented C++ smart contract code.
@@ -12,13 +48,13 @@ def strict_validator(code: str) -> str:
         return "\n".join(report)
 
     # Check for forbidden/dangerous functions
-    forbidden_functions = ["system", "fork", "exec", "popen"]
-    for func in forbidden_functions:
-        if re.search(rf"\b{func}\s*\(", code):
+    called = set(_FORBIDDEN_RE.findall(code))
+    for func in _FORBIDDEN_FUNCTIONS:
+        if func in called:
             report.append(f"- ❌ Forbidden function detected: `{func}()`")
 
     # Check for suspicious includes
-    includes = re.findall(r'#include\s+[<"].+[>"]', code)
+    includes = _INCLUDE_RE.findall(code)
     for inc in includes:
         if any(suspicious in inc for suspicious in ["unistd.h", "sys/"]):
             report.append(f"- ❌ Suspicious include detected: `{inc}`")
@@ -27,12 +63,12 @@ def strict_validator(code: str) -> str:
         report.append("- ⚠️ No #include statements found. Did you forget standard libraries?")
 
     # Check for excessively long lines
-    long_lines = [i + 1 for i, line in enumerate(code.splitlines()) if len(line) > 120]
+    long_lines = _long_lines(code)
     if long_lines:
-        report.append(f"- ⚠️ Lines exceeding 120 characters found at: {long_lines}")
+        report.append(f"- ⚠️ Lines exceeding {MAX_LINE_LENGTH} characters found at: {long_lines}")
 
     # Check naming conventions (simple heuristic)
-    if not re.search(r'\b[A-Z]', code):
+    if not _UPPERCASE_RE.search(code):
         report.append("- ⚠️ No uppercase identifiers detected. Consider using CamelCase or Uppercase for types.")
 
     # If no issues found, confirm success